@@ -45,23 +45,28 @@ class CopyrightEnStyleParser:
             yield ret
 
     @classmethod
-    def extract_phrases_with_coords(cls, sentence: str) -> List[Tuple[str, int, int]]:
+    def extract_phrases_with_coords(cls, sentence: str, document=None) -> List[Tuple[str, int, int]]:
+        """
+        :param sentence: text to split on phrases
+        :param document: language-specific shared NLP data of the text (if any)
+        """
         raise NotImplementedError()
 
     @classmethod
-    def get_copyright_annotations(cls, text: str, return_sources=False) \
+    def get_copyright_annotations(cls, text: str, return_sources=False, document=None) \
             -> Generator[CopyrightAnnotation, None, None]:
         """
         Find copyright in text.
         :param text:
         :param return_sources:
+        :param document: language-specific shared NLP data of the text (if any)
         :return:
         """
         # Iterate through sentences
         if not cls.copyright_ptn_re.search(text):
             return
 
-        tagged_phrases = cls.extract_phrases_with_coords(text)
+        tagged_phrases = cls.extract_phrases_with_coords(text, document=document)
 
         for phrase, phrase_start, phrase_end in tagged_phrases:
             for match in cls.copyright_ptn_re.finditer(phrase):
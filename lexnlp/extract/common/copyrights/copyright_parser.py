@@ -27,9 +27,10 @@ class CopyrightParser(TextPatternCollector):
         ant.year_end = ptrn.end_year
         return ant
 
-    def get_annotations_as_dictionaries(self) -> List[dict]:
+    @staticmethod
+    def get_annotations_as_dictionaries(annotations: List[TextAnnotation]) -> List[dict]:
         dfs = []
-        for ant in self.annotations:
+        for ant in annotations:
             df = ant.to_dictionary()
             dfs.append(df)
         return dfs
@@ -5,15 +5,15 @@ Dates parser based on dateparser package
 
 # pylint: disable=bare-except,broad-except,unused-argument
 
+import datetime
 import re
-import pandas as pd
 import string
 
 from dateparser.search import search_dates
-from typing import Generator
+from typing import Generator, List, Tuple
 
 from lexnlp.extract.common.annotations.date_annotation import DateAnnotation
-from lexnlp.extract.en.date_model import MODEL_DATE, get_date_features
+from lexnlp.extract.en.date_model import get_date_scores
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -23,12 +23,23 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
+class DateParsingContext:
+    """
+    Per-call state of DateParser.get_date_annotations(): the parser itself
+    keeps only its settings, so one instance can serve concurrent calls.
+    """
+    def __init__(self, text: str, language: str):
+        self.text = text
+        self.language = language
+        self.dates = []  # type: List[Tuple[str, datetime.datetime]]
+
+
 class DateParser(object):
     """
     Dates parser based on dateparser package
     """
     ENABLE_CLASSIFIER_CHECK = True
-    CLASSIFIER_MODEL = MODEL_DATE
+    CLASSIFIER_MODEL = None  # English date model (date_model.MODEL_DATE) by default
     CLASSIFIER_THRESHOLD = 0.5
     BAD_FULL_RE = re.compile(r'\d+\W?|(?:\d+\.? )?die|so|\d+ und \d+|die in einem', re.I)
     BAD_PARTIAL_RE = re.compile('[%s]' % re.escape(re.sub('[.,-:]', '', string.punctuation)))
@@ -45,28 +56,28 @@ class DateParser(object):
         """
         self.LANGUAGE = language
         self.TEXT = text
-        self.DATES = []
         self.ENABLE_CLASSIFIER_CHECK = enable_classifier_check \
             if enable_classifier_check is not None else self.ENABLE_CLASSIFIER_CHECK
         self.CLASSIFIER_MODEL = classifier_model or self.CLASSIFIER_MODEL
         self.CLASSIFIER_THRESHOLD = classifier_threshold or self.CLASSIFIER_THRESHOLD
         self.DATEPARSER_SETTINGS = dateparser_settings or self.DATEPARSER_SETTINGS
 
-    def get_dateparser_dates(self, text=None):
+    def get_dateparser_dates(self, text=None, language=None):
         """
         Extract possible dates with dateparser
         """
         text = text or self.TEXT
+        language = language or self.LANGUAGE
         # INFO: 'DATE_ORDER': 'DMY' prevents parsing date like 2004-12-13T00:00:00Z,
         #  use SKIP_TOKENS setting if needed along with DATE_ORDER
-        return search_dates(text, languages=[self.LANGUAGE], settings=self.DATEPARSER_SETTINGS) or []
+        return search_dates(text, languages=[language], settings=self.DATEPARSER_SETTINGS) or []
 
-    def get_extra_dates(self):
+    def get_extra_dates(self, context: DateParsingContext):
         """
-        Add custom search logic; use self.TEXT, self.LANGUAGE, self.DATES; update self.DATES
+        Add custom search logic; use context.text, context.language, context.dates; update context.dates
         :return: None
         """
-        # self.DATES += (custom logic)
+        # context.dates += (custom logic)
 
     def passed_general_check(self, date_str, date):
         """
@@ -74,16 +85,20 @@ class DateParser(object):
         """
         return not (self.BAD_FULL_RE.fullmatch(date_str) or self.BAD_PARTIAL_RE.search(date_str))
 
-    def passed_classifier_check(self, location_start, location_end):
+    def passed_classifier_check(self, text: str, location_start, location_end):
         """
         Use pre-trained classifier model to predict whether a date has right format
         Should be pluggable as it takes 90% parsing time
         """
-        row_df = pd.DataFrame.from_records(
-            [get_date_features(self.TEXT, location_start, location_end)])
-        date_score = self.CLASSIFIER_MODEL.predict_proba(
-            row_df.loc[:, self.CLASSIFIER_MODEL.columns])
-        return date_score[0, 1] > self.CLASSIFIER_THRESHOLD
+        return self.passed_classifier_checks(text, [(location_start, location_end)])[0]
+
+    def passed_classifier_checks(self, text: str, locations: List[Tuple[int, int]]) -> List[bool]:
+        """
+        Same as passed_classifier_check() but for all the (location_start, location_end) pairs at once:
+        builds one feature matrix and calls the classifier model only once.
+        """
+        date_scores = get_date_scores(text, locations, self.CLASSIFIER_MODEL)
+        return list(date_scores > self.CLASSIFIER_THRESHOLD)
 
     def get_dates(self, text=None, language=None):
         for ant in self.get_date_annotations(text, language):
@@ -97,47 +112,50 @@ class DateParser(object):
                              language: str = None) -> \
             Generator[DateAnnotation, None, None]:
 
-        self.TEXT = text.replace('\n', ' ') or self.TEXT
-        self.LANGUAGE = language or self.LANGUAGE
+        context = DateParsingContext((text.replace('\n', ' ') if text else None) or self.TEXT,
+                                     language or self.LANGUAGE)
 
-        if not self.TEXT or not self.LANGUAGE:
+        if not context.text or not context.language:
             raise RuntimeError('Define text and language.')
 
         # First try dateparser searcher
         try:
-            self.DATES = self.get_dateparser_dates() or []
+            context.dates = self.get_dateparser_dates(context.text, context.language) or []
         except Exception as e:
             # TODO: add logging
             print(str(e))
 
         # Next try custom search logic
-        self.get_extra_dates()
+        self.get_extra_dates(context)
 
         positions = []
-        for date_str, date in sorted(self.DATES, key=lambda i: -len(i[0])):
+        candidates = []
+        for date_str, date in sorted(context.dates, key=lambda i: -len(i[0])):
 
             # if possible date has weird format or unwanted symbols
             if not self.passed_general_check(date_str, date):
                 continue
 
-            for match in re.finditer(re.escape(date_str), self.TEXT):
+            for match in re.finditer(re.escape(date_str), context.text):
                 location_start, location_end = match.span()
 
                 # skip overlapping entities
                 if any([1 for i, j in positions if location_start>=i and location_end<=j]):
                     continue
                 positions.append(match.span())
-
-                # filter out possible dates using classifier
-                if self.ENABLE_CLASSIFIER_CHECK and \
-                        not self.passed_classifier_check(location_start, location_end):
-                    continue
-
-                ant = DateAnnotation(coords=(location_start, location_end),
-                                     date=date,
-                                     text=self.TEXT[location_start:location_end],
-                                     locale=language or self.LANGUAGE)
-                yield ant
+                candidates.append((match.span(), date))
+
+        # filter out possible dates using classifier - all the candidates are checked at once
+        if self.ENABLE_CLASSIFIER_CHECK and candidates:
+            passed = self.passed_classifier_checks(context.text, [span for span, _date in candidates])
+            candidates = [c for c, c_passed in zip(candidates, passed) if c_passed]
+
+        for (location_start, location_end), date in candidates:
+            ant = DateAnnotation(coords=(location_start, location_end),
+                                 date=date,
+                                 text=context.text[location_start:location_end],
+                                 locale=context.language)
+            yield ant
 
 
     def get_date_list(self, *args, **kwargs):
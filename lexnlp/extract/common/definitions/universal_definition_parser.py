@@ -1,3 +1,5 @@
+from typing import List
+
 from lexnlp.extract.common.annotations.definition_annotation import DefinitionAnnotation
 from lexnlp.extract.common.annotations.text_annotation import TextAnnotation
 from lexnlp.extract.common.pattern_found import PatternFound
@@ -27,9 +29,10 @@ class UniversalDefinitionsParser(TextPatternCollector):
             text=phrase.text[ptrn.start: ptrn.end],
             locale=locale)
 
-    def get_definition_dictionaries(self):
+    @staticmethod
+    def get_definition_dictionaries(annotations: List[TextAnnotation]) -> List[dict]:
         dfs = []
-        for ant in self.annotations:
+        for ant in annotations:
             dfs.append({
                     "attrs": {
                         "start": ant.coords[0],
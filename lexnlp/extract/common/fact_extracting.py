@@ -57,6 +57,7 @@ from lexnlp.extract.es.definitions import get_definition_annotations as get_es_d
 from lexnlp.extract.es.definitions import get_definitions as get_es_definitions
 from lexnlp.extract.es.regulations import get_regulation_annotations as get_es_regulation_annotations
 from lexnlp.extract.es.regulations import get_regulations as get_es_regulations
+from lexnlp.nlp.en.lex_document import LexDocument
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -84,11 +85,13 @@ class ExtractingFunction:
                  method: Callable,
                  fact_type: AnnotationType = None,
                  lang: str = '',
-                 result_fmt: ExtractorResultFormat = None):
+                 result_fmt: ExtractorResultFormat = None,
+                 use_document: bool = False):
         self.method = method  # <get_acts_annotations>
         self.fact_type = fact_type  # act
         self.language = lang  # "en"
         self.result_fmt = result_fmt  # fmt_class
+        self.use_document = use_document  # method accepts shared LexDocument (document=...)
 
 
 class FactExtractor:
@@ -150,11 +153,15 @@ class FactExtractor:
             extra_args = extra_args.get(result_fmt)
         extra_args = extra_args or {}  # type: Dict[AnnotationType, Tuple]
 
+        # sentences, tokens and POS tags are shared by the extractors
+        document = LexDocument(text) if lang == FactExtractor.LANGUAGE_EN else None
+
         facts = {}  # type: Dict[AnnotationType, List[Any]]
         for extractor in extractors:
             extras = extra_args.get(extractor.fact_type)
             func_args = (text,) + extras if extras else (text,)
-            typed_facts = list(extractor.method(*func_args))
+            func_kwargs = {'document': document} if extractor.use_document and document else {}
+            typed_facts = list(extractor.method(*func_args, **func_kwargs))
             if not typed_facts:
                 continue
             if result_fmt == ExtractorResultFormat.fmt_dict:
@@ -213,9 +220,9 @@ class FactExtractor:
                                result_fmt=ExtractorResultFormat.fmt_object),
 
             ExtractingFunction(method=get_amount_annotations, fact_type=AnnotationType.amount,
-                               result_fmt=ExtractorResultFormat.fmt_class),
+                               result_fmt=ExtractorResultFormat.fmt_class, use_document=True),
             ExtractingFunction(method=get_amounts, fact_type=AnnotationType.amount,
-                               result_fmt=ExtractorResultFormat.fmt_object),
+                               result_fmt=ExtractorResultFormat.fmt_object, use_document=True),
 
             ExtractingFunction(method=get_citation_annotations, fact_type=AnnotationType.citation,
                                result_fmt=ExtractorResultFormat.fmt_class),
@@ -223,19 +230,19 @@ class FactExtractor:
                                result_fmt=ExtractorResultFormat.fmt_object),
 
             ExtractingFunction(method=get_condition_annotations, fact_type=AnnotationType.condition,
-                               result_fmt=ExtractorResultFormat.fmt_class),
+                               result_fmt=ExtractorResultFormat.fmt_class, use_document=True),
             ExtractingFunction(method=get_conditions, fact_type=AnnotationType.condition,
-                               result_fmt=ExtractorResultFormat.fmt_object),
+                               result_fmt=ExtractorResultFormat.fmt_object, use_document=True),
 
             ExtractingFunction(method=get_constraint_annotations, fact_type=AnnotationType.constraint,
-                               result_fmt=ExtractorResultFormat.fmt_class),
+                               result_fmt=ExtractorResultFormat.fmt_class, use_document=True),
             ExtractingFunction(method=get_constraints, fact_type=AnnotationType.constraint,
-                               result_fmt=ExtractorResultFormat.fmt_object),
+                               result_fmt=ExtractorResultFormat.fmt_object, use_document=True),
 
             ExtractingFunction(method=get_copyright_annotations, fact_type=AnnotationType.copyright,
-                               result_fmt=ExtractorResultFormat.fmt_class),
+                               result_fmt=ExtractorResultFormat.fmt_class, use_document=True),
             ExtractingFunction(method=get_copyright, fact_type=AnnotationType.copyright,
-                               result_fmt=ExtractorResultFormat.fmt_object),
+                               result_fmt=ExtractorResultFormat.fmt_object, use_document=True),
 
             ExtractingFunction(method=get_court_annotations, fact_type=AnnotationType.court,
                                result_fmt=ExtractorResultFormat.fmt_class),
@@ -253,9 +260,9 @@ class FactExtractor:
                                result_fmt=ExtractorResultFormat.fmt_object),
 
             ExtractingFunction(method=get_definition_annotations, fact_type=AnnotationType.definition,
-                               result_fmt=ExtractorResultFormat.fmt_class),
+                               result_fmt=ExtractorResultFormat.fmt_class, use_document=True),
             ExtractingFunction(method=get_definitions, fact_type=AnnotationType.definition,
-                               result_fmt=ExtractorResultFormat.fmt_object),
+                               result_fmt=ExtractorResultFormat.fmt_object, use_document=True),
 
             ExtractingFunction(method=get_distance_annotations, fact_type=AnnotationType.distance,
                                result_fmt=ExtractorResultFormat.fmt_class),
@@ -13,11 +13,14 @@ __email__ = "support@contraxsuite.com"
 
 
 class TextPatternCollector:
-    basic_line_processor = LineProcessor()
     """
-    EsDefinitionsParser searches for definitions in text according to the
-    rules of Spanish. See the "parse" method
+    Base class for the parsers that split text on phrases and search the phrases
+    with the parsing functions given, e.g. EsDefinitionsParser. See the "parse" method.
+    The parser keeps no per-call state (the annotations found are collected in local
+    variables), so one instance can parse texts in concurrent threads.
     """
+    basic_line_processor = LineProcessor()
+
     def __init__(self, parsing_functions: List[Callable[[str], List[PatternFound]]],
                  split_params: LineSplitParams):
         """
@@ -25,7 +28,6 @@ class TextPatternCollector:
         :param split_params: text-to-sentences splitting params
         """
         self.parsing_functions = parsing_functions
-        self.annotations = [] # type: List[TextAnnotation]
         self.split_params = split_params
         self.proc = LineProcessor(line_split_params=self.split_params)
         self.prohibited_words = {} # words that are Not definitions per se
@@ -38,7 +40,7 @@ class TextPatternCollector:
                 "Extracted Entity Definition Name": "Software",
                 "Extracted Entity Text": ""Software" se refiere a: (i) el programa informático"} }
         """
-        self.annotations = []  # type: List[TextAnnotation]
+        annotations = []  # type: List[TextAnnotation]
         for phrase in self.proc.split_text_on_line_with_endings(text):
             matches = []
             for f in self.parsing_functions:
@@ -56,8 +58,8 @@ class TextPatternCollector:
                 # pylint:disable=assignment-from-none
                 ant = self.make_annotation_from_pattrn(locale, match, phrase)
                 ant.coords = (ant.coords[0] + phrase.start, ant.coords[1] + phrase.start)
-                self.annotations.append(ant)
-        return self.annotations
+                annotations.append(ant)
+        return annotations
 
     # pylint: disable=unused-argument
     def make_annotation_from_pattrn(self, locale: str,
@@ -2,7 +2,7 @@
 
 import re
 import pandas as pd
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
 from lexnlp.utils.lines_processing.line_processor import LineProcessor, LineSplitParams, LineOrPhrase
@@ -16,6 +16,10 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
+# (court name, court type, jurisdiction)
+CourtRow = Tuple[str, str, str]
+
+
 class ParserInitParams:
     """
     UniversalCourtsParser initialization parameters
@@ -34,7 +38,7 @@ class ParserInitParams:
 
 
 class MatchFound:
-    def __init__(self, subset, entry_start: int, entry_end: int, text: str):
+    def __init__(self, subset: List[CourtRow], entry_start: int, entry_end: int, text: str):
         self.subset = subset
         self.is_exact = len(subset) == 1
         self.court_name = None
@@ -123,10 +127,14 @@ class UniversalCourtsParser:
         self.court_alias_column = ptrs.column_names['alias']
         self.jurisdiction_column = ptrs.column_names['jurisdiction']
         self.proc = LineProcessor(line_split_params=ptrs.split_ptrs)
-        self.annotations = []  # type: List[CourtAnnotation]
         self.courts = None
+        # court rows indexed by name, alias, type and (type, jurisdiction)
+        self.rows_by_name = {}  # type: Dict[str, List[CourtRow]]
+        self.rows_by_alias = {}  # type: Dict[str, List[CourtRow]]
+        self.rows_by_type = {}  # type: Dict[str, List[CourtRow]]
+        self.rows_by_type_jur = {}  # type: Dict[Tuple[str, str], List[CourtRow]]
         self.load_courts(ptrs.dataframe_paths)
-        self.locale = None
+        self.index_courts()
 
         # unique columns
         self.finder_court_name = PhraseFinder(UniversalCourtsParser.get_unique_col_values(
@@ -156,23 +164,23 @@ class UniversalCourtsParser:
             'Extracted Entity Court Type': 'Verfassungsgericht',
             'Extracted Entity Court Jurisdiction': 'Sachsen'}
         """
-        self.annotations = []
-        self.locale = locale
-        self.find_courts_by_alias_in_whole_text(text)
+        annotations = self.find_courts_by_alias_in_whole_text(text, locale)
 
         # if the whole text doesn't contain the key word (gericht) - skip all the following
         if self.phrase_match_pattern is not None:
             if self.phrase_match_pattern.search(text, re.IGNORECASE) is None:
-                return self.annotations
+                return annotations
 
         for phrase in self.proc.split_text_on_line_with_endings(text):
             # if the phrase doesn't contain the key word (e.g., gericht for deutsche) - skip the phrase
             if self.phrase_match_pattern is not None:
                 if self.phrase_match_pattern.search(phrase.text, re.IGNORECASE) is None:
                     continue
-            self.find_court_by_any_key(phrase)
+            ant = self.find_court_by_any_key(phrase, locale)
+            if ant:
+                annotations.append(ant)
 
-        return self.annotations
+        return annotations
 
     def load_courts(self, dataframe_paths: List[str]):
         frames = []
@@ -188,30 +196,47 @@ class UniversalCourtsParser:
             frames.append(frame)
         self.courts = pd.concat(frames)
 
-    def find_courts_by_alias_in_whole_text(self, text: str) -> None:
+    def index_courts(self) -> None:
+        names = self.courts[self.court_name_column].values
+        types = self.courts[self.court_type_column].values
+        jurs = self.courts[self.jurisdiction_column].values
+        aliases = self.courts[self.court_alias_column].values if self.court_alias_column \
+            else [None] * len(names)
+
+        for name, court_type, jur, alias in zip(names, types, jurs, aliases):
+            row = (name, court_type, jur)  # type: CourtRow
+            self.rows_by_name.setdefault(name, []).append(row)
+            self.rows_by_type.setdefault(court_type, []).append(row)
+            self.rows_by_type_jur.setdefault((court_type, jur), []).append(row)
+            if alias is not None:
+                self.rows_by_alias.setdefault(alias, []).append(row)
+
+    def find_courts_by_alias_in_whole_text(self, text: str, locale: str = None) -> List[CourtAnnotation]:
+        annotations = []  # type: List[CourtAnnotation]
         if self.finder_court_alias is None:
-            return
+            return annotations
         for m in self.finder_court_alias.find_word(text):
             alias = m[0]
-            rows = self.courts.loc[self.courts[self.court_alias_column] == alias]
+            rows = self.rows_by_alias.get(alias, [])
             match_found = MatchFound(rows, m[1], m[2], text[m[1]:m[2]])
-            self.add_annotation(match_found)
+            annotations.append(self.make_annotation(match_found, locale))
+        return annotations
 
-    def find_court_by_any_key(self, phrase: LineOrPhrase):
+    def find_court_by_any_key(self, phrase: LineOrPhrase, locale: str = None) -> Optional[CourtAnnotation]:
         # find by court names
         matches = []
         matches += self.find_court_by_name(phrase)
         matches += self.find_court_by_type_and_jurisdiction(phrase)
         matches = [m for m in matches if m is not None]
         if len(matches) == 0:
-            return
+            return None
         # find the best match
         matches.sort(key=lambda m: m.make_sort_key())
-        self.add_annotation(matches[0])
+        return self.make_annotation(matches[0], locale)
 
     def find_court_by_name(self, phrase: LineOrPhrase) -> List[MatchFound]:
         match = self.find_court_by_key_column(phrase, self.finder_court_name,
-                                                self.court_name_column)
+                                                self.rows_by_name)
         if match is None:
             return []
 
@@ -220,11 +245,11 @@ class UniversalCourtsParser:
 
     def find_court_by_key_column(self, phrase: LineOrPhrase,
                                  phrase_finder: PhraseFinder,
-                                 column: str) -> Tuple[MatchFound, List[PhraseMatch]]:
+                                 rows_by_key: Dict[str, List[CourtRow]]) -> Tuple[MatchFound, List[PhraseMatch]]:
         found_substrings = phrase_finder.find_word(phrase.text, True)
         if len(found_substrings) == 0:
             return None
-        subset = self.courts.loc[self.courts[column] == found_substrings[0][0]]
+        subset = rows_by_key.get(found_substrings[0][0], [])
         if len(subset) == 0:
             return None
 
@@ -257,10 +282,9 @@ class UniversalCourtsParser:
             return matches
 
         if len(court_jurs) == 0:
-            subset = self.courts.loc[self.courts[self.court_type_column] == court_types[0][0]]
+            subset = self.rows_by_type.get(court_types[0][0], [])
         else:
-            subset = self.courts.loc[(self.courts[self.court_type_column] == court_types[0][0]) &
-                                     (self.courts[self.jurisdiction_column] == court_jurs[0][0])]
+            subset = self.rows_by_type_jur.get((court_types[0][0], court_jurs[0][0]), [])
 
         match = MatchFound(subset,
                            phrase.start,
@@ -271,31 +295,33 @@ class UniversalCourtsParser:
             match.court_type = court_types[0][0]
         return [match]
 
-    def add_annotation(self, match: MatchFound):
+    def make_annotation(self, match: MatchFound, locale: str = None) -> CourtAnnotation:
         mlen = len(match.subset)
 
-        name = match.subset[self.court_name_column].values[0] \
+        first_row = match.subset[0] if mlen > 0 else None
+
+        name = first_row[0] \
             if match.is_exact else \
             match.court_name if match.court_name is not None else \
-            match.subset[self.court_name_column].values[0] if mlen > 0 else ''
+            first_row[0] if mlen > 0 else ''
 
-        court_type = match.subset[self.court_type_column].values[0] \
+        court_type = first_row[1] \
             if match.is_exact else \
             match.court_type if match.court_type is not None else \
-            match.subset[self.court_type_column].values[0] if mlen > 0 else ''
+            first_row[1] if mlen > 0 else ''
 
-        jurisdiction = match.subset[self.jurisdiction_column].values[0] \
+        jurisdiction = first_row[2] \
             if match.is_exact else \
             match.jurisdiction if match.jurisdiction is not None else \
-                match.subset[self.jurisdiction_column].values[0] if mlen > 0 else ''
+            first_row[2] if mlen > 0 else ''
 
         ant = CourtAnnotation(name=name,
                               coords=(match.entry_start, match.entry_end),
-                              locale=self.locale,
+                              locale=locale,
                               text=match.text)
         ant.jurisdiction = jurisdiction
         ant.court_type = court_type
-        self.annotations.append(ant)
+        return ant
 
     @staticmethod
     def get_unique_col_values(col_values):
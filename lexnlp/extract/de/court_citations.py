@@ -1,5 +1,5 @@
 import regex as re
-from typing import List, Tuple, Generator
+from typing import List, Tuple, Generator, Optional
 from lexnlp.extract.common import year_parser
 from lexnlp.extract.common.annotations.court_citation_annotation import CourtCitationAnnotation
 from lexnlp.extract.de.dates import get_dates
@@ -64,65 +64,69 @@ class CourtCitationsParser:
         reg_split_by_registry = re.compile("|".join(list(registries.keys())))
     # endregion
 
-    def __init__(self):
-        self.locale = 'de'
-        self.items = []  # List[CourtCitationAnnotation]
-        self.locale = None
-
     def parse(self, text: str, locale: str = None) -> List[CourtCitationAnnotation]:
-        self.items = []
-        self.locale = locale
-        self.find_citations_in_embraced_text(text)
-        return self.items
+        return self.find_citations_in_embraced_text(text, locale)
 
-    def find_citations_in_embraced_text(self, text: str) -> None:
+    def find_citations_in_embraced_text(self, text: str, locale: str = None) -> List[CourtCitationAnnotation]:
+        items = []  # type: List[CourtCitationAnnotation]
         fragment_start = 0
         for embraced_text in CourtCitationsParser.reg_cite_chunk.finditer(text):
             start = embraced_text.start()
 
             # process text before braces
             fragment = text[fragment_start:start]
-            self.split_chunk_and_find_citations(fragment, fragment_start)
+            items += self.split_chunk_and_find_citations(fragment, fragment_start, locale)
             fragment_start = embraced_text.end() + 1
 
             # process text in braces
-            self.process_chunks_in_embraced_text(embraced_text, start)
+            items += self.process_chunks_in_embraced_text(embraced_text, start, locale)
 
         fragment = text[fragment_start:-1]
-        self.split_chunk_and_find_citations(fragment, fragment_start)
+        items += self.split_chunk_and_find_citations(fragment, fragment_start, locale)
+        return items
 
-    def process_chunks_in_embraced_text(self, embraced_text: str, start) -> None:
+    def process_chunks_in_embraced_text(self, embraced_text: str, start,
+                                        locale: str = None) -> List[CourtCitationAnnotation]:
+        items = []  # type: List[CourtCitationAnnotation]
         parts = embraced_text.group().split(';')
         for part in parts:
-            self.get_detail_from_chunk(part, start)
+            ant = self.get_detail_from_chunk(part, start, locale)
+            if ant:
+                items.append(ant)
             start += len(part) + 1
-        return
+        return items
 
-    def split_chunk_and_find_citations(self, text: str, start: int) -> None:
+    def split_chunk_and_find_citations(self, text: str, start: int,
+                                       locale: str = None) -> List[CourtCitationAnnotation]:
+        items = []  # type: List[CourtCitationAnnotation]
         chunks = self.split_text_by_keywords(text)
         for chunk in chunks:
-            self.get_detail_from_chunk(chunk[0], chunk[1] + start)
+            ant = self.get_detail_from_chunk(chunk[0], chunk[1] + start, locale)
+            if ant:
+                items.append(ant)
+        return items
 
-    def get_detail_from_chunk(self, chunk_text: str, chunk_start: int) -> None:
+    def get_detail_from_chunk(self, chunk_text: str, chunk_start: int,
+                              locale: str = None) -> Optional[CourtCitationAnnotation]:
         chunk_body = chunk_text.strip(r'() \t')
         dates = self.get_dates_from_text(chunk_body)
         registries = self.get_registries_from_text(chunk_body)
         triggers = CourtCitationsParser.reg_trigger_words.search(chunk_body)
 
         if not triggers and len(registries) == 0 and len(dates) == 0:
-            return
+            return None
 
         start = chunk_start + chunk_text.find(chunk_body)
         end = start + len(chunk_body)
         ant = CourtCitationAnnotation(name=chunk_body,
                                       coords=(start, end),
                                       text=chunk_body,
-                                      locale=self.locale)
-        ant.locale = self.locale
+                                      locale=locale)
+        ant.locale = locale
         if len(registries) > 0:
             ant.name = CourtCitationsParser.registries[registries[0].value]
             ant.short_name = self.get_reference_from_registry(registries[0], chunk_body)
-        self.items.append(ant)
+        return ant
 
     def get_reference_from_registry(self, registry: PossibleToken,
                                     chunk_body: str) -> str:
@@ -3,7 +3,8 @@ from typing import Union, List, Tuple, Generator
 import pandas as pd
 
 from lexnlp.extract.common.annotations.geo_annotation import GeoAnnotation
-from lexnlp.utils.parse_df import get_entities, get_entity_list, DataframeEntityParser
+from lexnlp.utils.parse_df import get_entities, get_entity_list, DataframeEntityParser, \
+    get_dataframe_entity_parser
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -21,7 +22,7 @@ get_geoentity_list = get_entity_list
 
 def get_geoentity_annotations(
                         text: str,
-                        config: pd.DataFrame,
+                        config: Union[pd.DataFrame, DataframeEntityParser],
                         parse_columns: Union[List[str], Tuple[str]] = None,
                         result_columns: Union[dict, None] = None,
                         preformed_entity: Union[dict, None] = None,
@@ -81,7 +82,7 @@ class DeGeoentitiesParser:
 
     def get_geoentities(self,
                      text: str,
-                     config: pd.DataFrame,
+                     config: Union[pd.DataFrame, DataframeEntityParser],
                      parse_columns: Union[List[str], Tuple[str]] = None,
                      result_columns: Union[dict, None] = None,
                      preformed_entity: Union[dict, None] = None,
@@ -89,22 +90,61 @@ class DeGeoentitiesParser:
                      priority_sort_ascending: bool = True,
                      cell_values_separator: Union[str, None] = ';',
                      unique_column_values: bool = True) -> Generator:
-
+        """
+        :param config: geo entities dataframe or a parser built by build_parser()
+        """
         parse_columns = parse_columns or self.default_selecting_columns
 
-        yield from DataframeEntityParser(dataframe=config,
+        yield from get_entities(text,
+                                config=config,
+                                parse_columns=parse_columns,
+                                result_columns=result_columns,
+                                preformed_entity=preformed_entity,
+                                priority_sort_column=priority_sort_column,
+                                priority_sort_ascending=priority_sort_ascending,
+                                cell_values_separator=cell_values_separator,
+                                unique_column_values=unique_column_values)
+
+    def build_parser(self,
+                     config: pd.DataFrame,
+                     parse_columns: Union[List[str], Tuple[str]] = None,
+                     preformed_entity: Union[dict, None] = None,
+                     priority_sort_column: Union[str, None] = None,
+                     priority_sort_ascending: bool = True,
+                     cell_values_separator: Union[str, None] = ';',
+                     unique_column_values: bool = True) -> DataframeEntityParser:
+        """
+        Build the parser once and pass it as "config" to get_geoentity_annotations()
+        instead of the dataframe.
+        """
+        parse_columns = parse_columns or self.default_selecting_columns
+        if preformed_entity:
+            # the cached parser is shared, so the parser with preformed_entity is built anew
+            return DataframeEntityParser(dataframe=config,
                                          parse_columns=parse_columns,
-                                         result_columns=result_columns,
+                                         result_columns=self.get_df_result_columns(),
                                          preformed_entity=preformed_entity,
                                          priority_sort_column=priority_sort_column,
                                          priority_sort_ascending=priority_sort_ascending,
                                          cell_values_separator=cell_values_separator,
-                                         unique_column_values=unique_column_values).get_entities(text)
+                                         unique_column_values=unique_column_values)
+        return get_dataframe_entity_parser(config=config,
+                                           parse_columns=parse_columns,
+                                           result_columns=self.get_df_result_columns(),
+                                           priority_sort_column=priority_sort_column,
+                                           priority_sort_ascending=priority_sort_ascending,
+                                           cell_values_separator=cell_values_separator,
+                                           unique_column_values=unique_column_values)
+
+    def get_df_result_columns(self) -> dict:
+        return {c.dataframe_col_name: c.dataframe_col_name
+                for c in self.default_annotation_columns
+                if c.dataframe_col_name}
 
     def get_geoentity_annotations(
                         self,
                         text: str,
-                        config: pd.DataFrame,
+                        config: Union[pd.DataFrame, DataframeEntityParser],
                         parse_columns: Union[List[str], Tuple[str]] = None,
                         result_columns: List[DeGeoentityColumn] = None,
                         preformed_entity: Union[dict, None] = None,
@@ -115,9 +155,7 @@ class DeGeoentitiesParser:
 
         parse_columns = parse_columns or self.default_selecting_columns
         result_columns = result_columns or self.default_annotation_columns
-        df_result_columns = {c.dataframe_col_name: c.dataframe_col_name
-                             for c in self.default_annotation_columns
-                             if c.dataframe_col_name}
+        df_result_columns = self.get_df_result_columns()
 
         for ent in get_entities(text,
                                 config=config,
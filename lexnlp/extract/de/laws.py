@@ -22,7 +22,6 @@ class LawsParser:
                  gesetze_df: pd.DataFrame,
                  verordnungen_df: pd.DataFrame,
                  concept_df: pd.DataFrame):
-        self.locale = ''
         parse_columns = ('Kurztitel', 'Titel', 'Abkürzung')
         dependent_columns = {'Titel': 'External Reference Normalized'}
         preformed_entity = {'External Reference Type': 'Laws and Rules',
@@ -62,7 +61,7 @@ class LawsParser:
 
     def parse(self, text: str, locale: str = None) -> List[LawAnnotation]:
         res = []
-        self.locale = locale if locale else 'de'
+        locale = locale if locale else 'de'
         res.extend(self.gesetze_parser.get_entity_list(text))
         res.extend(self.verordnungen_parser.get_entity_list(text))
         res.extend(self.concept_parser.get_entity_list(text))
@@ -72,7 +71,7 @@ class LawsParser:
             coords = (i.pop('location_start'), i.pop('location_end'))
             text = i.pop('source')
             ant = LawAnnotation(name=text, coords=coords,
-                                text=text, locale=self.locale)
+                                text=text, locale=locale)
             # new_item.update(i)
             res_formatted.append(ant)
         return res_formatted
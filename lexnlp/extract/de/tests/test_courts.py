@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
@@ -58,6 +59,15 @@ class TestParseDeCourts(TestCase):
         jurisdiction = ret[0]["tags"]["Extracted Entity Court Jurisdiction"]
         self.assertEqual("Federal", jurisdiction)
 
+    def test_parse_in_threads(self):
+        texts = [load_resource_document('lexnlp/extract/de/sample_de_courts01.txt', 'utf-8'),
+                 load_resource_document('lexnlp/extract/de/sample_de_courts02.txt', 'utf-8'),
+                 " vom Amtsgericht Stuttgart als zentralem Mahngericht, Amtsgerichte  Pforzheim"] * 4
+        expected = [list(get_courts(text)) for text in texts]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            actual = list(executor.map(lambda t: list(get_courts(t)), texts))
+        self.assertEqual(expected, actual)
+
     def test_file_samples(self):
         tester = TypedAnnotationsTester()
         tester.test_and_raise_errors(
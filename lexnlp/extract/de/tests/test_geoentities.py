@@ -1,9 +1,11 @@
-from typing import List
+from typing import Callable, Dict, List
+from unittest import TestCase
 import pandas as pd
 import io
+import time
 
 from lexnlp.extract.common.annotations.geo_annotation import GeoAnnotation
-from lexnlp.extract.de.geoentities import get_geoentity_list, get_geoentity_annotations
+from lexnlp.extract.de.geoentities import get_geoentity_list, get_geoentity_annotations, DeGeoentitiesParser
 from lexnlp.extract.de.tests.test_amounts import AssertionMixin
 from lexnlp.tests.typed_annotations_tests import TypedAnnotationsTester
 
@@ -96,6 +98,39 @@ class TestGetGeoEntities(AssertionMixin):
         self.assertEqual('GEO', ants[0].iso_3166_3)
         self.assertEqual('', ants[0].alias)
 
+    def test_cached_parser(self):
+        text = "some odd text and Georgien mentioned inside it, Albanien and AFG"
+        config = entity_df.copy()
+        geo_parser = DeGeoentitiesParser()
+        self.assertIs(geo_parser.build_parser(config), geo_parser.build_parser(config))
+        self.assertIs(geo_parser.build_parser(config), geo_parser.build_parser(config.copy()))
+
+        df_ants = list(get_geoentity_annotations(text, config))
+        parser_ants = list(get_geoentity_annotations(text, geo_parser.build_parser(config)))
+        self.assertEqual(3, len(df_ants))
+        self.assertEqual([a.coords for a in df_ants], [a.coords for a in parser_ants])
+
+    def test_cached_parser_mutated_config(self):
+        text = "some odd text and Georgien mentioned inside it, Albanien and AFG"
+        config = entity_df.copy()
+        parser = DeGeoentitiesParser().build_parser(config)
+        self.assertEqual(3, len(list(get_geoentity_annotations(text, config))))
+
+        config.loc[config['German Name'] == 'Albanien', 'German Name'] = 'Arbeit'
+        self.assertIsNot(parser, DeGeoentitiesParser().build_parser(config))
+        ants = list(get_geoentity_annotations(text, config))
+        self.assertEqual(2, len(ants))
+        self.assertNotIn('Albanien', [a.source for a in ants])
+
+    def test_cached_parser_preformed_entity(self):
+        text = "some odd text and Georgien mentioned inside it"
+        ents = list(get_geoentity_list(text, entity_df, ['German Name'],
+                                       preformed_entity={'k': ['l']}))
+        self.assertTrue(ents)
+        self.assertEqual(['l'], ents[0]['k'])
+        ents = list(get_geoentity_list(text, entity_df, ['German Name']))
+        self.assertNotIn('k', ents[0])
+
     def test_file_samples(self):
         tester = TypedAnnotationsTester()
         tester.test_and_raise_errors(
@@ -104,7 +139,52 @@ class TestGetGeoEntities(AssertionMixin):
             GeoAnnotation)
 
 
+class TestGeoentitiesParsingSpeed(TestCase):
+    """
+    This method is not named as test_XXX
+    because it is not intended for (automatic) regression tests
+    """
+    def cached_parser_speed(self):
+        text = "some odd text and Georgien mentioned inside it, Albanien and AFG. " * 20
+        # a config of a realistic size: the sample rows and 20k made-up places
+        config = pd.concat([entity_df, pd.DataFrame({
+            'Entity ID': range(1000, 21000),
+            'Entity Category': 'Cities',
+            'Entity Name': [f'Town {i}' for i in range(20000)],
+            'Entity Priority': 100,
+            'German Name': [f'Stadt{i}' for i in range(20000)],
+            'ISO-3166-2': '',
+            'ISO-3166-3': '',
+            'Alias': ''})], ignore_index=True)
+        # makes the config differ from the configs parsed before, so the first call builds the parser
+        config.loc[0, 'Alias'] = f'Alias {time.time()}'
+        repeats = 20
+
+        def parse_repeated(config_or_parser) -> None:
+            for _ in range(repeats):
+                list(get_geoentity_annotations(text, config_or_parser))
+
+        times = {}  # type: Dict[str, float]
+        self.check_time(text, lambda s: list(get_geoentity_annotations(s, config)), 'not_cached', times)
+        self.check_time(text, lambda _: parse_repeated(config), 'cached', times)
+        parser = DeGeoentitiesParser().build_parser(config)
+        self.check_time(text, lambda _: parse_repeated(parser), 'prebuilt_parser', times)
+
+        self.assertLess(times['cached'] / repeats, times['not_cached'])
+        self.assertLess(times['prebuilt_parser'] / repeats, times['not_cached'])
+
+    def check_time(self, text: str, func: Callable, func_name: str, times: Dict[str, float]) -> None:
+        start = time.time()
+        func(text)
+        end = time.time()
+        times[func_name] = end - start
+
+
+# the parser is built once for all the samples
+entity_df_parser = DeGeoentitiesParser().build_parser(entity_df)
+
+
 def get_ordered_geo_annotations(text: str) -> List[GeoAnnotation]:
-    ants = list(get_geoentity_annotations(text, entity_df))
+    ants = list(get_geoentity_annotations(text, entity_df_parser))
     ants.sort(key=lambda a: a.coords[0])
     return ants
@@ -15,6 +15,8 @@ import pycountry
 from dateutil import parser as dateparser
 import pickle
 
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
+
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
 __license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
@@ -133,11 +135,18 @@ POS_TAG_SET_INDEX_FN = os.path.join(cwd, 'nltk_pos_tag_indexes.json')
 
 POS_TAG_SET_INDEX = json.load(open(POS_TAG_SET_INDEX_FN, 'r'))
 
-COUNTRY_WORDS = build_country_words()
+# Word sets below are loaded on first use
+COUNTRY_WORDS_RESOURCE = register_resource('en.address_country_words', build_country_words)
+
+PROVINCES_WORDS_RESOURCE = register_resource('en.address_provinces_words', build_provinces_words)
 
-PROVINCES_WORDS = build_provinces_words()
+CITY_NAME_WORDS_RESOURCE = register_resource(
+    'en.address_city_name_words', lambda: _pickle_load(os.path.join(cwd, 'city_name_words.pickle')))
 
-CITY_NAME_WORDS = _pickle_load(os.path.join(cwd, 'city_name_words.pickle'))
+__getattr__ = lazy_module_attributes(__name__, {
+    'COUNTRY_WORDS': COUNTRY_WORDS_RESOURCE,
+    'PROVINCES_WORDS': PROVINCES_WORDS_RESOURCE,
+    'CITY_NAME_WORDS': CITY_NAME_WORDS_RESOURCE})
 
 FEATURE_WORD_LEN = 21
 
@@ -152,6 +161,9 @@ def get_word_features(word: str, part_of_speech: str) -> List[int]:
     word_no_dots = word_norm.strip('.')
     is_upper = word.isupper()
     all_digits = all(ch.isdigit() for ch in word)
+    country_words = COUNTRY_WORDS_RESOURCE.get()
+    provinces_words = PROVINCES_WORDS_RESOURCE.get()
+    city_name_words = CITY_NAME_WORDS_RESOURCE.get()
     res = [
         POS_TAG_SET_INDEX.get(part_of_speech or '') or 0,  # part of speech
         int(is_upper or word.istitle()),  # init_cap
@@ -173,9 +185,9 @@ def get_word_features(word: str, part_of_speech: str) -> List[int]:
         int(word_no_dots in BUILDING_SUFFIXES),  # building
         int(word_norm in STREET_DIRECTIONS),  # street directions
         int(is_zip_code(word)),
-        int(word_norm in COUNTRY_WORDS),
-        int(word_norm in PROVINCES_WORDS),
-        int(word_norm in CITY_NAME_WORDS)
+        int(word_norm in country_words),
+        int(word_norm in provinces_words),
+        int(word_norm in city_name_words)
     ]
 
     return res
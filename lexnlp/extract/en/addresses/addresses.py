@@ -5,11 +5,13 @@ Addresses extraction for English language.
 import os
 import pickle
 import re
-from typing import Generator, Tuple, List
+from typing import Generator, Tuple, List, Optional
 
 from lexnlp.extract.en.preprocessing.span_tokenizer import SpanTokenizer
 
 from lexnlp.extract.en.addresses import address_features
+from lexnlp.nlp.en.lex_document import LexDocument
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -103,16 +105,18 @@ def load_classifier():
         return pickle.load(f)
 
 
-NGRAM_CLASSIFIER = load_classifier()
+NGRAM_CLASSIFIER_RESOURCE = register_resource('en.address_ngram_classifier', load_classifier)
+__getattr__ = lazy_module_attributes(__name__, {'NGRAM_CLASSIFIER': NGRAM_CLASSIFIER_RESOURCE})
 NGRAM_WINDOW_HALF_WIDTH = 10
 NGRAM_WINDOW_STEP = 1
 
 
-def prepare_ngrams_in_text(text: str, window_half_width: int, window_step: int) \
+def prepare_ngrams_in_text(text: str, window_half_width: int, window_step: int,
+                           document: Optional[LexDocument] = None) \
         -> Generator[Tuple[List[int], List[str], int, int], None, None]:
     words2 = []
 
-    for word, pos_token, word_start_pos, word_end_pos in TOKENIZER.get_token_spans(text):
+    for word, pos_token, word_start_pos, word_end_pos in TOKENIZER.get_token_spans(text, document=document):
         features = address_features.get_word_features(word, pos_token)
         # our tokenizer returns exact word_end_pos and we need it so that text[word_start_pos:word_end_pos] == word
         words2.append((word, pos_token, word_start_pos, word_end_pos + 1, features))
@@ -139,18 +143,20 @@ def cleanup(address: str) -> str:
     return address
 
 
-def get_addresses(text: str) -> Generator[str, None, None]:
-    for addr, _start, _end in get_address_spans(text):
+def get_addresses(text: str, document: Optional[LexDocument] = None) -> Generator[str, None, None]:
+    for addr, _start, _end in get_address_spans(text, document=document):
         yield addr
 
 
-def get_address_spans(text: str) -> Generator[Tuple[str, int, int], None, None]:
+def get_address_spans(text: str, document: Optional[LexDocument] = None) \
+        -> Generator[Tuple[str, int, int], None, None]:
     possible_address_start = None
     possible_address_end = None
     margin = 0
+    classifier = NGRAM_CLASSIFIER_RESOURCE.get()
     for ngram_features, _word, word_start_pos, word_end_pos \
-            in prepare_ngrams_in_text(text, NGRAM_WINDOW_HALF_WIDTH, NGRAM_WINDOW_STEP):
-        ngram_type = NGRAM_CLASSIFIER.predict([ngram_features])
+            in prepare_ngrams_in_text(text, NGRAM_WINDOW_HALF_WIDTH, NGRAM_WINDOW_STEP, document=document):
+        ngram_type = classifier.predict([ngram_features])
 
         if possible_address_start is None:
             if ngram_type in (NGramType.ADDR_START, NGramType.ADDR_MIDDLE):
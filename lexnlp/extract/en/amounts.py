@@ -28,14 +28,17 @@ Avoids:
 # pylint: disable=bare-except
 
 # Imports
+import bisect
 import string
-from typing import Generator
+from functools import lru_cache
+from typing import Any, Generator, Optional, Tuple, Type
 
 import nltk
 import regex as re
 from num2words import num2words
 
 from lexnlp.extract.common.annotations.amount_annotation import AmountAnnotation
+from lexnlp.nlp.en.lex_document import LexDocument
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -118,6 +121,7 @@ NUM_PTN = r"""
 NUM_PTN_RE = re.compile(NUM_PTN, re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE)
 
 NON_WRIT_RE = re.compile(r'[\d\.]+')
+PLAIN_NUMBER_RE = re.compile(r'(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?')
 MIXED_WRIT_RE = re.compile(r'(^[\d\.]*)(.+)', re.DOTALL)
 ONLY_BIG_WRIT_RE = re.compile(r'^\s*(?:{}|hundred|dozen)'.format('|'.join(MAGNITUDE_MAP)))
 NUM_FRACTION_RE = re.compile(r'(\s+no|\d{1,2})/(\d{1,3}[^/])')
@@ -125,6 +129,7 @@ NUM_FRACTION_SUB_RE = re.compile(r'(?:\s*and)?(?:\s+no|\s*\d{1,2})/\d{1,3}')
 HALF_RE = re.compile(r'\s*and\s+a\s+half')
 QUARTER_RE = re.compile(r'(?:\s*and\s+)?(one|two|three)[\s-]+quarters?')
 AND_RE = re.compile(r'\W*and\W*', re.IGNORECASE | re.MULTILINE | re.DOTALL)
+EDGE_AND_RE = re.compile(r'\s+and\s*$|^\s*and\s+')
 
 FRACTION_PTN = r"(?:(?:\W|^)" \
                r"(?:one[\s-]+(?:{writ_ord_2_90}|hundredth|thousandth|(?:{writ_20_90})[\s-]+" \
@@ -164,6 +169,31 @@ grammar = r"""
 """
 chunker = nltk.RegexpParser(grammar)
 
+# max number of tokens following an amount that are searched for the amount's unit
+UNIT_TOKEN_WINDOW = 10
+
+# max number of distinct number strings parse_amount_value() remembers
+AMOUNT_VALUE_CACHE_SIZE = 16384
+
+
+# kinds of the words in a written number
+WORD_SKIP, WORD_SMALL, WORD_DOZEN, WORD_HALF, WORD_MAGNITUDE = range(5)
+
+# written number word -> (kind, value), "hundred..." words are checked separately
+WRITTEN_NUMBER_WORDS = {'a': (WORD_SKIP, 0), 'and': (WORD_SKIP, 0)}
+WRITTEN_NUMBER_WORDS.update({w: (WORD_SMALL, n) for w, n in SMALL_NUMBERS_MAP.items()})
+WRITTEN_NUMBER_WORDS.update({'dozen': (WORD_DOZEN, 12), 'half': (WORD_HALF, .5)})
+WRITTEN_NUMBER_WORDS.update({w: (WORD_MAGNITUDE, n) for w, n in MAGNITUDE_MAP.items()})
+
+# words that can't be a part of a fraction or a quarter: if a written number
+# consists of these words only, fraction / quarter patterns are not searched
+PLAIN_NUMBER_WORDS = {'a', 'and', 'dozen', 'half', 'hundred'}
+PLAIN_NUMBER_WORDS.update(num2words(n) for n in SMALL_NUMBERS)
+PLAIN_NUMBER_WORDS.update(w for w in MAGNITUDE_MAP if not w.startswith('thousandth'))
+
+# max number of distinct normalized strings text2num() remembers
+TEXT2NUM_CACHE_SIZE = 16384
+
 
 def text2num(s, search_fraction=True):
     """
@@ -172,13 +202,38 @@ def text2num(s, search_fraction=True):
     :param search_fraction: extract fraction
     :return: integer/float
     """
-    n = 0
-    g = 0
+    value, error = _parse_written_number(_normalize_written_number(s), search_fraction)
+    if error is not None:
+        error_type, error_args = error
+        raise error_type(*error_args)
+    return value
+
+
+def _normalize_written_number(s: str) -> str:
     s = s.lower().replace(',', '').replace('-', ' ').strip(string.whitespace).rstrip(
         string.punctuation + string.whitespace)
-    s = re.sub(r'\s+and\s*$|^\s*and\s+', '', s)
+    s = EDGE_AND_RE.sub('', s)
     if not (s.startswith('.') and s[1].isdigit()):
         s = s.lstrip(string.punctuation + string.whitespace)
+    return s
+
+
+@lru_cache(maxsize=TEXT2NUM_CACHE_SIZE)
+def _parse_written_number(s: str, search_fraction: bool) -> Tuple[Any, Optional[Tuple[Type[Exception], tuple]]]:
+    """
+    Convert normalized written amount into integer/float.
+    :return: (value, None) or (None, (error type, error args)) if the text is not a number -
+        the exception itself is not cached, text2num() raises a new one on each call
+    """
+    try:
+        return _parse_normalized_number(s, search_fraction), None
+    except Exception as e:  # pylint:disable=broad-except
+        return None, (type(e), e.args)
+
+
+def _parse_normalized_number(s: str, search_fraction: bool):
+    n = 0
+    g = 0
     if s in ['k', 'm', 'b']:
         return
     # if only number or float in string
@@ -194,59 +249,81 @@ def text2num(s, search_fraction=True):
     if ONLY_BIG_WRIT_RE.search(s) and not g:
         s = 'one ' + s
 
+    a = s.split()
     d = 0
-    dnd = NUM_FRACTION_RE.search(s)
-    fs = FRACTION_PTN_RE.search(s)
-    q = QUARTER_RE.search(s)
-    if q:  # convert quarters
-        s = QUARTER_RE.sub('', s)
-        nu = q.groups()[0]
-        d = text2num(nu) / 4
-    elif dnd:  # if text has fraction like 1/33 or 87/100 or 1/100
-        dn, dd = dnd.groups()
-        if dn.isdigit():
-            d = int(dn) / int(dd)
-        s = NUM_FRACTION_SUB_RE.sub('', s)
-    elif fs and search_fraction:  # extract written fractions
-        try:
-            s = FRACTION_PTN_RE.sub('', s)
-            fe = fs.group(0)
-            fn, fd = FRACTION_EXTRACT_PTN_RE.search(fe).groups()
-            fn = text2num(fn, search_fraction=False)
-            fd = text2num(fd, search_fraction=False)
-            d = fn / fd
-        except (ValueError, TypeError, ZeroDivisionError):
-            pass
+    if not all(w in PLAIN_NUMBER_WORDS for w in a):
+        dnd = NUM_FRACTION_RE.search(s)
+        fs = FRACTION_PTN_RE.search(s)
+        q = QUARTER_RE.search(s)
+        if q:  # convert quarters
+            s = QUARTER_RE.sub('', s)
+            nu = q.groups()[0]
+            d = text2num(nu) / 4
+        elif dnd:  # if text has fraction like 1/33 or 87/100 or 1/100
+            dn, dd = dnd.groups()
+            if dn.isdigit():
+                d = int(dn) / int(dd)
+            s = NUM_FRACTION_SUB_RE.sub('', s)
+        elif fs and search_fraction:  # extract written fractions
+            try:
+                s = FRACTION_PTN_RE.sub('', s)
+                fe = fs.group(0)
+                fn, fd = FRACTION_EXTRACT_PTN_RE.search(fe).groups()
+                fn = text2num(fn, search_fraction=False)
+                fd = text2num(fd, search_fraction=False)
+                d = fn / fd
+            except (ValueError, TypeError, ZeroDivisionError):
+                pass
+        a = s.split()
 
     # process
-    a = s.split()
-
     x1 = 0
     for w in a:
-        if w in ['a', 'and']:
+        kind, x = WRITTEN_NUMBER_WORDS.get(w, (None, None))
+        if kind == WORD_SKIP:
             continue
-        x = SMALL_NUMBERS_MAP.get(w, None)
-        if x is not None:
+        if kind == WORD_SMALL:
             g += x
         elif 'hundred' in w and g != 0:
             g *= 100
-        elif w == 'dozen' and g != 0:
+        elif kind == WORD_DOZEN and g != 0:
             g *= 12
-        elif w == 'half':
+        elif kind == WORD_HALF:
             if x1:
                 g += x1 * .5
             else:
                 g += .5
+        elif kind == WORD_MAGNITUDE:
+            x1 = x
+            n += g * x
+            g = 0
         else:
-            x = x1 = MAGNITUDE_MAP.get(w, None)
-            if x is not None:
-                n += g * x
-                g = 0
-            else:
-                raise RuntimeError('Unknown number: ' + w)
+            raise RuntimeError('Unknown number: ' + w)
     return n + g + d
 
 
+def parse_amount_value(text: str, float_digits=4) -> Optional[float]:
+    """
+    Get the value of the only amount in the text without any NLP processing (no unit search).
+    Is used by money, duration, percent etc. parsers on the number part they have captured.
+    Repeating number strings ("thirty (30)") are parsed just once.
+    :param text: number text, e.g. "twenty five", "25,000.00"
+    :param float_digits: round float to N digits, don't round if None
+    :return: amount value or None if the text contains no amount or more than one
+    """
+    return _parse_amount_value(text.strip().lower(), float_digits)
+
+
+@lru_cache(maxsize=AMOUNT_VALUE_CACHE_SIZE)
+def _parse_amount_value(text: str, float_digits: Optional[int]) -> Optional[float]:
+    if PLAIN_NUMBER_RE.fullmatch(text):
+        amount = float(text.replace(',', ''))
+        return round(amount, float_digits) if float_digits else amount
+    values = [ant.value for ant in get_amount_annotations(
+        text, extended_sources=False, float_digits=float_digits)]
+    return values[0] if len(values) == 1 else None
+
+
 def get_np(text) -> Generator:
     tokens = nltk.word_tokenize(text)
     pos_tokens = nltk.tag.pos_tag(tokens)
@@ -257,19 +334,73 @@ def get_np(text) -> Generator:
         yield np, _np
 
 
+def _get_amount_unit(document: LexDocument,
+                     pos: int,
+                     unit_token_window: Optional[int] = UNIT_TOKEN_WINDOW) -> str:
+    """
+    Find the noun phrase that starts right at the pos in the text (after an amount).
+    Only the sentence's tokens in unit_token_window are chunked, the sentence
+    is POS-tagged once for all the amounts within it.
+    """
+    if pos >= len(document.text):
+        return ''
+    index = max(0, document.get_sentence_index(pos))
+    tagged = []
+    while index < len(document.sentence_spans):
+        token_spans = document.get_sentence_token_spans(index)
+        token_index = bisect.bisect_left(token_spans, (pos, pos))
+        if token_index < len(token_spans):
+            token_end = len(token_spans) if unit_token_window is None \
+                else token_index + unit_token_window
+            tagged = document.get_sentence_pos(index)[token_index:token_end]
+            break
+        index += 1
+    if not tagged:
+        return ''
+
+    unit = ''
+    chunks = chunker.parse(tagged)
+    for subtree in chunks.subtrees(filter=lambda t: t.label() == 'NP'):
+        np = ' '.join([i[0] for i in subtree.leaves()])
+        if document.text.startswith(np, pos):
+            unit = np
+    return unit
+
+
+def _get_prev_token(document: LexDocument, pos: int) -> str:
+    """
+    Get the (part of the) last token that precedes the pos in the text.
+    """
+    index = document.get_sentence_index(pos)
+    while index >= 0:
+        token_spans = document.get_sentence_token_spans(index)
+        token_index = bisect.bisect_left(token_spans, (pos, pos)) - 1
+        if token_index >= 0:
+            start, end = token_spans[token_index]
+            return document.text[start:min(end, pos)]
+        index -= 1
+    return ''
+
+
 def get_amounts(text: str,
                 return_sources=False,
                 extended_sources=True,
-                float_digits=4) -> Generator[float, None, None]:
+                float_digits=4,
+                unit_token_window: Optional[int] = UNIT_TOKEN_WINDOW,
+                document: Optional[LexDocument] = None) -> Generator[float, None, None]:
     """
     Find possible amount references in the text.
     :param text: text
     :param return_sources: return amount AND source text
     :param extended_sources: return data around amount itself
     :param float_digits: round float to N digits, don't round if None
+    :param unit_token_window: search amount's unit within N tokens of the sentence, None - whole sentence
+    :param document: shared sentences / tokens / POS tags of the text
     :return: list of amounts
     """
-    for ant in get_amount_annotations(text, extended_sources, float_digits):  # type: AmountAnnotation
+    for ant in get_amount_annotations(text, extended_sources, float_digits,
+                                      unit_token_window=unit_token_window,
+                                      document=document):  # type: AmountAnnotation
         if return_sources:
             yield (ant.value, ant.text)
         else:
@@ -278,13 +409,17 @@ def get_amounts(text: str,
 
 def get_amount_annotations(text: str,
                            extended_sources=True,
-                           float_digits=4) \
+                           float_digits=4,
+                           unit_token_window: Optional[int] = UNIT_TOKEN_WINDOW,
+                           document: Optional[LexDocument] = None) \
         -> Generator[AmountAnnotation, None, None]:
     """
     Find possible amount references in the text.
     :param text: text
     :param extended_sources: return data around amount itself
     :param float_digits: round float to N digits, don't round if None
+    :param unit_token_window: search amount's unit within N tokens of the sentence, None - whole sentence
+    :param document: shared sentences / tokens / POS tags of the text
     :return: list of amounts
     """
     for match in NUM_PTN_RE.finditer(text):
@@ -310,20 +445,15 @@ def get_amount_annotations(text: str,
             amount = round(amount, float_digits)
 
         if extended_sources:
-            unit = ''
-            next_text = text[match.span()[1]:]
-            if next_text:
-                for np, _ in get_np(next_text):
-                    if next_text.startswith(np):
-                        unit = np
-                if unit:
-                    found_item = ' '.join([found_item.strip(), unit])
-            if not unit:
-                prev_text = text[:match.span()[0]]
-                prev_text_tags = nltk.word_tokenize(prev_text)
-                if prev_text_tags and prev_text_tags[-1].lower() in allowed_prev_units:
+            document = LexDocument.get(text, document)
+            unit = _get_amount_unit(document, match.span()[1], unit_token_window)
+            if unit:
+                found_item = ' '.join([found_item.strip(), unit])
+            else:
+                prev_token = _get_prev_token(document, match.span()[0])
+                if prev_token and prev_token.lower() in allowed_prev_units:
                     sep = ' ' if text[match.span()[0] - 1] == ' ' else ''
-                    found_item = sep.join([prev_text_tags[-1], found_item.rstrip()])
+                    found_item = sep.join([prev_token, found_item.rstrip()])
 
             ant = AmountAnnotation(coords=match.span(),
                                    value=amount,
@@ -8,12 +8,12 @@ Todo:
 
 # Imports
 import copy
-from typing import Generator
+from typing import Generator, Optional
 
 import regex as re
 
 from lexnlp.extract.common.annotations.condition_annotation import ConditionAnnotation
-from lexnlp.nlp.en.segments.sentences import get_sentence_list
+from lexnlp.nlp.en.lex_document import LexDocument
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -54,24 +54,25 @@ CONDITION_PATTERN = create_condition_pattern(CONDITION_PATTERN_TEMPLATE, CONDITI
 RE_CONDITION = re.compile(CONDITION_PATTERN, re.IGNORECASE | re.UNICODE | re.DOTALL | re.MULTILINE | re.VERBOSE)
 
 
-def get_conditions(text, strict=True) -> Generator:
-    for ant in get_condition_annotations(text, strict):
+def get_conditions(text, strict=True, document: Optional[LexDocument] = None) -> Generator:
+    for ant in get_condition_annotations(text, strict, document=document):
         yield (ant.condition,
                ant.pre,
                ant.post)
 
 
-def get_condition_annotations(text: str, strict=True) \
+def get_condition_annotations(text: str, strict=True, document: Optional[LexDocument] = None) \
         -> Generator[ConditionAnnotation, None, None]:
     """
     Find possible conditions in natural language.
     :param text:
     :param strict:
+    :param document: shared sentences / tokens / POS tags of the text
     :return:
     """
 
     # Iterate through all potential matches
-    for sentence in get_sentence_list(text):
+    for sentence in LexDocument.get(text, document).sentences:
         for match in RE_CONDITION.finditer(sentence):
             # Get individual group matches
             captures = match.capturesdict()
@@ -8,12 +8,12 @@ Todo:
 
 # Imports
 import copy
-from typing import Generator
+from typing import Generator, Optional
 
 import regex as re
 
 from lexnlp.extract.common.annotations.constraint_annotation import ConstraintAnnotation
-from lexnlp.nlp.en.segments.sentences import get_sentence_list
+from lexnlp.nlp.en.lex_document import LexDocument
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -66,30 +66,32 @@ CONSTRAINT_PATTERN = create_constraint_pattern(CONSTRAINT_PATTERN_TEMPLATE, CONS
 RE_CONSTRAINT = re.compile(CONSTRAINT_PATTERN, re.IGNORECASE | re.UNICODE | re.DOTALL | re.MULTILINE | re.VERBOSE)
 
 
-def get_constraints(text: str, strict=False) -> Generator:
+def get_constraints(text: str, strict=False, document: Optional[LexDocument] = None) -> Generator:
     """
     Find possible constraints in natural language.
     :param text:
     :param strict:
+    :param document: shared sentences / tokens / POS tags of the text
     :return:
     """
 
     # Iterate through all potential matches
-    for ant in get_constraint_annotations(text, strict):
+    for ant in get_constraint_annotations(text, strict, document=document):
         yield (ant.constraint, ant.pre, ant.post)
 
 
-def get_constraint_annotations(text: str, strict=False) \
+def get_constraint_annotations(text: str, strict=False, document: Optional[LexDocument] = None) \
         -> Generator[ConstraintAnnotation, None, None]:
     """
     Find possible constraints in natural language.
     :param text:
     :param strict:
+    :param document: shared sentences / tokens / POS tags of the text
     :return:
     """
 
     # Iterate through all potential matches
-    for sentence in get_sentence_list(text):
+    for sentence in LexDocument.get(text, document).sentences:
         for match in RE_CONSTRAINT.finditer(sentence.lower()):
             # Get individual group matches
             captures = match.capturesdict()
@@ -12,6 +12,7 @@ from sklearn.externals import joblib
 # LexNLP
 from lexnlp.nlp.en.segments.sentences import get_sentence_list
 from lexnlp.nlp.en.tokens import get_stem_list
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -23,14 +24,14 @@ __email__ = "support@contraxsuite.com"
 
 data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'data')
 
-# Load doc2vec model
 d2v_model_filename = "d2v_all_size100_window10.model"
 d2v_model_path = os.path.join(data_dir, d2v_model_filename)
 
-# Load doc2vec model from part files like d2v_all_size100_window10.model.part.aa
-if os.path.exists(d2v_model_path):
-    d2v_model = gensim.models.doc2vec.Doc2Vec.load(d2v_model_path)
-else:
+
+def load_d2v_model():
+    # Load doc2vec model from part files like d2v_all_size100_window10.model.part.aa
+    if os.path.exists(d2v_model_path):
+        return gensim.models.doc2vec.Doc2Vec.load(d2v_model_path)
     d2v_model_filenames = sorted([i for i in os.listdir(data_dir)
                                   if i.startswith('{}.part.'.format(d2v_model_filename))])
     if not d2v_model_filenames:
@@ -38,12 +39,14 @@ else:
     d2v_model_pickled = b''
     for filename in d2v_model_filenames:
         d2v_model_pickled += open(os.path.join(data_dir, filename), 'rb').read()
-    d2v_model = pickle.loads(d2v_model_pickled)
+    return pickle.loads(d2v_model_pickled)
 
 
-# Load classifier model
-rf_model = joblib.load(
-    os.path.join(data_dir, "is_contract_classifier.pickle"))
+# Doc2vec and classifier models are loaded on first use
+D2V_MODEL = register_resource('en.contract_d2v_model', load_d2v_model)
+RF_MODEL = register_resource(
+    'en.contract_classifier', lambda: joblib.load(os.path.join(data_dir, "is_contract_classifier.pickle")))
+__getattr__ = lazy_module_attributes(__name__, {'d2v_model': D2V_MODEL, 'rf_model': RF_MODEL})
 
 
 # Utility methods
@@ -60,11 +63,11 @@ def process_document(document):
 
 def is_contract(text, min_probability=0.5, return_probability=False):
     # Create the vector representation from doc2vec model
-    text_vector = d2v_model.infer_vector(process_document(text))
+    text_vector = D2V_MODEL.get().infer_vector(process_document(text))
 
     # Pass vector into classifier
     try:
-        classifier_score = rf_model.predict_proba([text_vector])[0, 1]
+        classifier_score = RF_MODEL.get().predict_proba([text_vector])[0, 1]
     except IndexError:
         return None
 
@@ -8,11 +8,12 @@ Todo: -
 
 # Imports
 import string
-from typing import Generator, List, Tuple
+from typing import Generator, List, Optional, Tuple
 
 from lexnlp.extract.common.copyrights.copyright_en_style_parser import CopyrightEnStyleParser
 from lexnlp.extract.common.annotations.copyright_annotation import CopyrightAnnotation
 from lexnlp.extract.en.utils import NPExtractor
+from lexnlp.nlp.en.lex_document import LexDocument
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -47,13 +48,15 @@ np_extractor = CopyrightNPExtractor(grammar=grammar)
 
 class CopyrightEnParser(CopyrightEnStyleParser):
     @classmethod
-    def extract_phrases_with_coords(cls, sentence: str) -> List[Tuple[str, int, int]]:
-        return np_extractor.get_np_with_coords(sentence)
+    def extract_phrases_with_coords(cls, sentence: str,
+                                    document: Optional[LexDocument] = None) -> List[Tuple[str, int, int]]:
+        return np_extractor.get_np_with_coords(sentence, document=document)
 
 
 def get_copyright(text: str,
-                  return_sources=False) -> Generator:
-    for ant in get_copyright_annotations(text, return_sources):
+                  return_sources=False,
+                  document: Optional[LexDocument] = None) -> Generator:
+    for ant in get_copyright_annotations(text, return_sources, document=document):
         ret = (ant.sign,
                ant.date,
                ant.name)
@@ -62,9 +65,11 @@ def get_copyright(text: str,
         yield ret
 
 
-def get_copyright_annotations(text: str, return_sources=False) -> \
+def get_copyright_annotations(text: str, return_sources=False,
+                              document: Optional[LexDocument] = None) -> \
         Generator[CopyrightAnnotation, None, None]:
     for ant in CopyrightEnParser.get_copyright_annotations(text,
-                                                           return_sources):
+                                                           return_sources,
+                                                           document=document):
         ant.locale = 'en'
         yield ant
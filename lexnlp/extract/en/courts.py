@@ -9,11 +9,11 @@ Todo:
 
 # pylint: disable=unused-argument
 
-from typing import List, Tuple, Generator, Any
+from typing import List, Tuple, Generator, Any, Union
 
 from lexnlp.extract.common.base_path import lexnlp_base_path
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
-from lexnlp.extract.en.dict_entities import find_dict_entities, conflicts_take_first_by_id
+from lexnlp.extract.en.dict_entities import find_dict_entities, conflicts_take_first_by_id, DictEntityIndex
 
 import os
 import re
@@ -31,7 +31,7 @@ __email__ = "support@contraxsuite.com"
 
 
 def get_courts(text: str,
-               court_config_list: List[Tuple[int, str, int, List[Tuple[str, str, bool, int]]]],
+               court_config_list: Union[DictEntityIndex, List[Tuple[int, str, int, List[Tuple[str, str, bool, int]]]]],
                priority: bool = False,
                text_languages: List[str] = None) -> Generator[Tuple[Tuple, Tuple], Any, Any]:
     """
@@ -44,7 +44,7 @@ def get_courts(text: str,
     entity_alias(), add_aliases_to_entity().
     :param text:
     :param court_config_list: List list of all possible known courts in the form of tuples:
-     (id, name, [(alias, lang, is_abbrev], ...).
+     (id, name, [(alias, lang, is_abbrev], ...), or DictEntityIndex built from this list.
     :param return_source:
     :param priority: If two courts found with the totally equal matching aliases - then use the one with the lowest id.
     :param text_languages: Language(s) of the source text. If a language is specified then only aliases of this
@@ -9,9 +9,14 @@ This module implements date extraction functionality in English.
 import itertools
 import os
 import string
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
+import numpy as np
 from sklearn.externals import joblib
 
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
+
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
 __license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
@@ -23,19 +28,158 @@ __email__ = "support@contraxsuite.com"
 # Setup path
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load model
-MODEL_DATE = joblib.load(os.path.join(MODULE_PATH, "./date_model.pickle"))
+# Model is loaded on first use
+DATE_MODEL = register_resource(
+    'en.date_model', lambda: joblib.load(os.path.join(MODULE_PATH, "./date_model.pickle")))
+__getattr__ = lazy_module_attributes(__name__, {'MODEL_DATE': DATE_MODEL})
 
 DATE_MODEL_CHARS = []
 DATE_MODEL_CHARS.extend(string.ascii_letters)
 DATE_MODEL_CHARS.extend(string.digits)
 DATE_MODEL_CHARS.extend(["-", "/", " ", "%", "#", "$"])
+DEFAULT_DATE_MODEL_CHARS = tuple(DATE_MODEL_CHARS)
+
+
+def get_date_feature_names(characters=None, include_bigrams=True) -> Tuple[List[str], List[str]]:
+    """
+    Get names of the character and bigram features in the order used by get_date_features().
+    :param characters: characters to use for feature generation
+    :param include_bigrams: whether to include bigram/bicharacter features
+    :return: (list of chars, list of bigrams)
+    """
+    characters = tuple(characters) if characters else DEFAULT_DATE_MODEL_CHARS
+    return _get_date_feature_names(characters, include_bigrams)
+
+
+@lru_cache(maxsize=16)
+def _get_date_feature_names(characters: Tuple[str], include_bigrams: bool) -> Tuple[List[str], List[str]]:
+    bigrams = ["".join(s) for s in itertools.permutations(characters, 2)] if include_bigrams else []
+    return list(characters), bigrams
+
+
+class DateFeatureEngine:
+    """
+    Calculates date classifier features (see get_date_features()) for many date candidates of one text.
+
+    The text is converted once into arrays of character and bigram codes. For a batch of candidate windows
+    cumulative counts of each character and bigram are calculated at the window boundaries only, so the
+    feature vector of each candidate is the difference of two rows - it does not depend on the window length.
+    Results are identical to get_date_features().
+    """
+
+    def __init__(self, text: str, characters=None, include_bigrams=True, window=5, norm=True):
+        """
+        :param text: raw text containing date candidates
+        :param characters: characters to use for feature generation, e.g., digits only, alpha only
+        :param include_bigrams: whether to include bigram/bicharacter features
+        :param window: window around match
+        :param norm: whether to norm, i.e., transform to proportion
+        """
+        self.text = text
+        self.window = window
+        self.norm = norm
+        self.include_bigrams = include_bigrams
+        self.characters, self.bigrams = get_date_feature_names(characters, include_bigrams)
+        self.char_keys = ["char_{0}".format(c) for c in self.characters]
+        self.bigram_keys = ["bigram_{0}".format(b) for b in self.bigrams]
+        self.feature_names = self.char_keys + self.bigram_keys
+
+        char_count = len(self.characters)
+        code_points = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32) if text \
+            else np.zeros(0, dtype=np.uint32)
+        char_points = np.array([ord(c) for c in self.characters], dtype=np.uint32)
+        order = np.argsort(char_points)
+        sorted_points = char_points[order]
+        positions = np.searchsorted(sorted_points, code_points).clip(0, max(char_count - 1, 0))
+        is_char = sorted_points[positions] == code_points if char_count else np.zeros(len(code_points), bool)
+        # code of each char of the text: index in self.characters or -1
+        self.char_codes = np.where(is_char, order[positions] if char_count else -1, -1)
+
+        self.bigram_codes = None
+        if include_bigrams:
+            # permutations(characters, 2) gives pairs of different chars: (a, b) -> a * (n - 1) + b - (b > a)
+            first, second = self.char_codes[:-1], self.char_codes[1:]
+            is_bigram = (first >= 0) & (second >= 0) & (first != second)
+            self.bigram_codes = np.where(is_bigram,
+                                         first * (char_count - 1) + second - (second > first),
+                                         -1)
+
+    def get_window(self, start_index: int, end_index: int) -> Tuple[int, int]:
+        """
+        Get [start, end) of the text window around the date - the same as text[start:end].strip() would give.
+        """
+        text = self.text
+        window_start = max(0, start_index - self.window)
+        window_end = min(len(text), end_index + self.window)
+        window_start = min(window_start, window_end)
+        while window_start < window_end and text[window_start].isspace():
+            window_start += 1
+        while window_end > window_start and text[window_end - 1].isspace():
+            window_end -= 1
+        return window_start, window_end
+
+    @staticmethod
+    def _count_between(codes: np.ndarray, feature_count: int, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Count each code in codes[starts[i]:ends[i]] for all i using cumulative counts at the boundaries.
+        :return: matrix of shape (len(starts), feature_count)
+        """
+        boundaries = np.unique(np.concatenate([starts, ends]))
+        lowest, highest = boundaries[0], boundaries[-1]
+        codes = codes[lowest:highest]
+        indexes = np.arange(lowest, lowest + len(codes))
+        valid = codes >= 0
+        # boundary segment of each position: boundaries[segment - 1] <= position < boundaries[segment]
+        segments = np.searchsorted(boundaries, indexes[valid], side='right')
+        counts = np.bincount(segments * feature_count + codes[valid],
+                             minlength=(len(boundaries) + 1) * feature_count)
+        # cumulative[j] - counts of positions < boundaries[j]
+        cumulative = counts.reshape(len(boundaries) + 1, feature_count).cumsum(axis=0)
+        return (cumulative[np.searchsorted(boundaries, ends)]
+                - cumulative[np.searchsorted(boundaries, starts)]).astype(float)
+
+    def get_feature_matrix(self, spans: List[Tuple[int, int]], columns: List[str] = None) -> np.ndarray:
+        """
+        Build feature matrix for the date candidates.
+        :param spans: (start, end) of each date candidate
+        :param columns: feature names to return (in this order) - all features by default
+        :return: float matrix of shape (len(spans), number of features)
+        """
+        char_count = len(self.characters)
+        bigram_count = len(self.bigrams)
+        matrix = np.zeros((len(spans), char_count + bigram_count), dtype=float)
+        if spans:
+            windows = np.array([self.get_window(start, end) for start, end in spans], dtype=np.int64)
+            starts, ends = windows[:, 0], windows[:, 1]
+            if char_count:
+                matrix[:, :char_count] = self._count_between(self.char_codes, char_count, starts, ends)
+            if bigram_count:
+                # bigram starting at i is inside of [start, end) if start <= i < end - 1
+                matrix[:, char_count:] = self._count_between(self.bigram_codes, bigram_count,
+                                                             starts, np.maximum(ends - 1, starts))
+            if self.norm:
+                for part in (matrix[:, :char_count], matrix[:, char_count:]):
+                    sums = part.sum(axis=1, keepdims=True)
+                    np.divide(part, sums, out=part, where=sums > 0)
+
+        if columns is not None:
+            feature_index = {name: i for i, name in enumerate(self.feature_names)}
+            matrix = matrix[:, [feature_index[c] for c in columns]]
+        return matrix
+
+    def get_features(self, start_index: int, end_index: int) -> Dict[str, float]:
+        """
+        Get features of one date candidate as dict - see get_date_features().
+        """
+        row = self.get_feature_matrix([(start_index, end_index)])[0]
+        return dict(zip(self.feature_names, row.tolist()))
 
 
 def get_date_features(text, start_index, end_index, include_bigrams=True, window=5, characters=None,
                       norm=True):
     """
     Get features to use for classification of date as false positive.
+    Use DateFeatureEngine for getting features of many date candidates of the same text.
     :param text: raw text around potential date
     :param start_index: date start index
     :param end_index: date end index
@@ -45,46 +189,41 @@ def get_date_features(text, start_index, end_index, include_bigrams=True, window
     :param norm: whether to norm, i.e., transform to proportion
     :return:
     """
-    # Check chars
-    if not characters:
-        characters = DATE_MODEL_CHARS
-
-    # Get text window
+    # Only the text window is needed for the features of a single date
     window_start = max(0, start_index - window)
     window_end = min(len(text), end_index + window)
-    feature_text = text[window_start:window_end].strip()
-
-    # Build character vector
-    char_vec = {}
-    char_keys = []
-    bigram_keys = {}
-    for character in characters:
-        key = "char_{0}".format(character)
-        char_vec[key] = feature_text.count(character)
-        char_keys.append(key)
-
-    # Build character bigram vector
-    if include_bigrams:
-        bigram_set = ["".join(s) for s in itertools.permutations(characters, 2)]
-        bigram_keys = []
-        for character in bigram_set:
-            key = "bigram_{0}".format(character)
-            char_vec[key] = feature_text.count(character)
-            bigram_keys.append(key)
-
-    # Norm if requested
-    if norm:
-        # Norm by characters
-        char_sum = sum([char_vec[k] for k in char_keys])
-        if char_sum > 0:
-            for key in char_keys:
-                char_vec[key] /= float(char_sum)
-
-        # Norm by bigrams
-        if include_bigrams:
-            bigram_sum = sum([char_vec[k] for k in bigram_keys])
-            if bigram_sum > 0:
-                for key in bigram_keys:
-                    char_vec[key] /= float(bigram_sum)
+    engine = DateFeatureEngine(text[window_start:window_end], characters=characters,
+                               include_bigrams=include_bigrams, window=0, norm=norm)
+    return engine.get_features(0, window_end - window_start)
+
 
-    return char_vec
+def get_date_feature_matrix(text: str,
+                            spans: List[Tuple[int, int]],
+                            columns: List[str]) -> np.ndarray:
+    """
+    Build the feature matrix for all date candidates of a text: one row per candidate span,
+    one column per feature in the order of the model columns.
+    :param text: raw text containing the date candidates
+    :param spans: (start, end) of each date candidate
+    :param columns: feature names in the order expected by the model
+    :return: float matrix of shape (len(spans), len(columns))
+    """
+    return DateFeatureEngine(text).get_feature_matrix(spans, list(columns))
+
+
+def get_date_scores(text: str,
+                    spans: List[Tuple[int, int]],
+                    model=None) -> np.ndarray:
+    """
+    Predict the probability of being a date for all date candidates of a text at once.
+    The feature matrix is built for all the candidates and the model is called only once.
+    :param text: raw text containing the date candidates
+    :param spans: (start, end) of each date candidate
+    :param model: classifier having "columns" attribute - MODEL_DATE by default
+    :return: array of probabilities, one per span
+    """
+    if not spans:
+        return np.zeros(0, dtype=float)
+    model = model or DATE_MODEL.get()
+    matrix = get_date_feature_matrix(text, spans, model.columns)
+    return model.predict_proba(matrix)[:, 1]
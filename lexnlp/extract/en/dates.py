@@ -7,7 +7,6 @@ This module implements date extraction functionality in English.
 
 # Standard imports
 import datetime
-import itertools
 import os
 import calendar
 
@@ -24,7 +23,8 @@ from sklearn.externals import joblib
 
 from lexnlp.extract.common.annotations.date_annotation import DateAnnotation
 from lexnlp.extract.common.date_parsing.datefinder import DateFinder
-from lexnlp.extract.en.date_model import MODEL_DATE, DATE_MODEL_CHARS, MODULE_PATH
+from lexnlp.extract.en.date_model import DATE_MODEL_CHARS, MODULE_PATH, get_date_scores, \
+    get_date_features
 from lexnlp.extract.common.dates import DateParser
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -73,64 +73,6 @@ MONTH_BY_NAME = get_month_by_name()
 MONTH_FULLS = {v.lower(): k for k,v in enumerate(calendar.month_name)}
 
 
-def get_date_features(text, start_index, end_index, include_bigrams=True, window=5, characters=None,
-                      norm=True):
-    """
-    Get features to use for classification of date as false positive.
-    :param text: raw text around potential date
-    :param start_index: date start index
-    :param end_index: date end index
-    :param include_bigrams: whether to include bigram/bicharacter features
-    :param window: window around match
-    :param characters: characters to use for feature generation, e.g., digits only, alpha only
-    :param norm: whether to norm, i.e., transform to proportion
-    :return:
-    """
-    # Check chars
-    if not characters:
-        characters = DATE_MODEL_CHARS
-
-    # Get text window
-    window_start = max(0, start_index - window)
-    window_end = min(len(text), end_index + window)
-    feature_text = text[window_start:window_end].strip()
-
-    # Build character vector
-    char_vec = {}
-    char_keys = []
-    bigram_keys = {}
-    for character in characters:
-        key = "char_{0}".format(character)
-        char_vec[key] = feature_text.count(character)
-        char_keys.append(key)
-
-    # Build character bigram vector
-    if include_bigrams:
-        bigram_set = ["".join(s) for s in itertools.permutations(characters, 2)]
-        bigram_keys = []
-        for character in bigram_set:
-            key = "bigram_{0}".format(character)
-            char_vec[key] = feature_text.count(character)
-            bigram_keys.append(key)
-
-    # Norm if requested
-    if norm:
-        # Norm by characters
-        char_sum = sum([char_vec[k] for k in char_keys])
-        if char_sum > 0:
-            for key in char_keys:
-                char_vec[key] /= float(char_sum)
-
-        # Norm by bigrams
-        if include_bigrams:
-            bigram_sum = sum([char_vec[k] for k in bigram_keys])
-            if bigram_sum > 0:
-                for key in bigram_keys:
-                    char_vec[key] /= float(bigram_sum)
-
-    return char_vec
-
-
 def get_raw_date_list(text, strict=False, base_date=None, return_source=False) -> List:
     return list(get_raw_dates(text, strict=strict, base_date=base_date, return_source=return_source))
 
@@ -381,14 +323,18 @@ def get_date_annotations(text: str, strict=False, base_date=None, threshold=0.50
     """
     # Get raw dates
     raw_date_results = get_raw_date_list(text, strict=strict, base_date=base_date, return_source=True)
+    if not raw_date_results:
+        return
+
+    # Score all the candidates with one model call
+    date_scores = get_date_scores(text, [raw_date[1] for raw_date in raw_date_results])
+    passed = date_scores >= threshold
 
-    for raw_date in raw_date_results:
-        row_df = pd.DataFrame([get_date_features(text, raw_date[1][0], raw_date[1][1])])
-        date_score = MODEL_DATE.predict_proba(row_df.loc[:, MODEL_DATE.columns])
-        if date_score[0, 1] >= threshold:
+    for raw_date, date_score, date_passed in zip(raw_date_results, date_scores, passed):
+        if date_passed:
             ant = DateAnnotation(coords=raw_date[1],
                                  date=raw_date[0],
-                                 score=date_score[0, 1])
+                                 score=date_score)
             yield ant
 
 
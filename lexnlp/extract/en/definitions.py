@@ -1,11 +1,11 @@
-from typing import Generator, List, Tuple
+from typing import Generator, List, Optional, Tuple
 
 from lexnlp.extract.common.annotation_locator_type import AnnotationLocatorType
 from lexnlp.extract.common.annotations.definition_annotation import DefinitionAnnotation
 from lexnlp.extract.en.definition_parsing_methods import DefinitionCaught, get_definition_list_in_sentence, \
     filter_definitions_for_self_repeating
 from lexnlp.extract.ml.en.definitions.layered_definition_detector import LayeredDefinitionDetector
-from lexnlp.nlp.en.segments.sentences import get_sentence_span
+from lexnlp.nlp.en.lex_document import LexDocument
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -26,14 +26,16 @@ def get_definitions_in_sentence(sentence: str,
             yield df.name
 
 
-def get_definition_objects_list(text, decode_unicode=True) -> List[DefinitionCaught]:
+def get_definition_objects_list(text, decode_unicode=True,
+                                document: Optional[LexDocument] = None) -> List[DefinitionCaught]:
     """
     :param text: text to search for definitions
     :param decode_unicode:
+    :param document: shared sentences / tokens / POS tags of the text
     :return: a list of found definitions - objects of class DefinitionCaught
     """
     definitions = []
-    for sentence in get_sentence_span(text):  # type: Tuple[int, int, str]
+    for sentence in LexDocument.get(text, document).sentence_spans:  # type: Tuple[int, int, str]
         definitions += get_definition_list_in_sentence(sentence, decode_unicode)
     definitions = filter_definitions_for_self_repeating(definitions)
     return definitions
@@ -42,22 +44,38 @@ def get_definition_objects_list(text, decode_unicode=True) -> List[DefinitionCau
 parser_ml_classifier = LayeredDefinitionDetector()
 
 
+def get_ml_definition_annotations(text: str,
+                                  document: Optional[LexDocument] = None) -> List[DefinitionAnnotation]:
+    """
+    Find definitions in all the sentences of the text with parser_ml_classifier,
+    running its models once for the whole document.
+    """
+    sentence_spans = LexDocument.get(text, document).sentence_spans
+    sentence_annotations = parser_ml_classifier.get_annotations_batch([s for _, _, s in sentence_spans])
+    annotations = []  # type: List[DefinitionAnnotation]
+    for (start, _, _), ants in zip(sentence_spans, sentence_annotations):
+        for ant in ants:
+            ant.coords = (ant.coords[0] + start, ant.coords[1] + start)
+            annotations.append(ant)
+    return annotations
+
+
 def get_definition_annotations(text: str,
                                decode_unicode=True,
-                               locator_type: AnnotationLocatorType = AnnotationLocatorType.RegexpBased) \
+                               locator_type: AnnotationLocatorType = AnnotationLocatorType.RegexpBased,
+                               document: Optional[LexDocument] = None) \
         -> Generator[DefinitionAnnotation, None, None]:
 
     if locator_type == AnnotationLocatorType.MlWordVectorBased:
         if not parser_ml_classifier.initialized:
             raise Exception(f'"parser_ml_classifier" object should be initialized (call load_compressed method)')
-        ants = parser_ml_classifier.get_annotations(text)
-        for ant in ants:
-            yield ant
+        yield from get_ml_definition_annotations(text, document=document)
         return
 
     # use Regexp-based locator
     for d in get_definition_objects_list(text,
-                                         decode_unicode=decode_unicode):
+                                         decode_unicode=decode_unicode,
+                                         document=document):
         ant = DefinitionAnnotation(coords=d.coords,
                                    text=d.text,
                                    name=d.name)
@@ -68,7 +86,8 @@ def get_definitions(text: str,
                     return_sources=False,
                     decode_unicode=True,
                     return_coords=False,
-                    locator_type: AnnotationLocatorType = AnnotationLocatorType.RegexpBased) -> Generator:
+                    locator_type: AnnotationLocatorType = AnnotationLocatorType.RegexpBased,
+                    document: Optional[LexDocument] = None) -> Generator:
     """
     Find possible definitions in natural language in text.
     The text will be split to sentences first.
@@ -77,14 +96,15 @@ def get_definitions(text: str,
     :param return_sources: returns a tuple with the extracted term and the source sentence
     :param text: the input text
     :param locator_type: use default (Regexp-based) or ML-based locator
+    :param document: shared sentences / tokens / POS tags of the text
     :return: Generator[name] or Generator[name, text] or Generator[name, text, coords]
     """
     if locator_type == AnnotationLocatorType.MlWordVectorBased:
         if not parser_ml_classifier.initialized:
             raise Exception(f'"parser_ml_classifier" object should be initialized (call load_compressed method)')
-        definitions = parser_ml_classifier.get_annotations(text)
+        definitions = get_ml_definition_annotations(text, document=document)
     else:
-        definitions = get_definition_objects_list(text, decode_unicode)
+        definitions = get_definition_objects_list(text, decode_unicode, document=document)
 
     for df in definitions:
         if return_coords:
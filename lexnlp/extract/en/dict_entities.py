@@ -18,9 +18,11 @@
 """
 
 import re
-from typing import Union, List, Dict, Set, Tuple, Callable, Generator, Any
+from array import array
+from collections import deque
+from typing import Union, List, Dict, Set, Tuple, Callable, Generator, Any, Iterable
 
-from lexnlp.nlp.en.tokens import get_token_list, get_stem_list
+from lexnlp.nlp.en.tokens import get_token_list, get_stem_list, get_token_spans, DEFAULT_STEMMER
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -254,6 +256,84 @@ def normalize_text(text: str,
     return res
 
 
+def _replace_with_offsets(text: str,
+                          offsets: array,
+                          old: str,
+                          new: str,
+                          new_offsets: Callable[[int], Iterable[int]]) -> Tuple[str, array]:
+    """
+    Works as text.replace(old, new) and keeps the offset map in sync with the text.
+    :param new_offsets: function returning offsets of the chars of the new substring
+    by the offset of the first char of the replaced one.
+    """
+    res = []
+    res_offsets = array('i')
+    pos = 0
+    while True:
+        found = text.find(old, pos)
+        if found < 0:
+            break
+        res.append(text[pos:found])
+        res_offsets.extend(offsets[pos:found])
+        res.append(new)
+        res_offsets.extend(new_offsets(offsets[found]))
+        pos = found + len(old)
+    res.append(text[pos:])
+    res_offsets.extend(offsets[pos:])
+    return ''.join(res), res_offsets
+
+
+def normalize_text_with_offsets(text: str,
+                                lowercase: bool = True,
+                                use_stemmer: bool = False) -> Tuple[str, array]:
+    """
+    Normalizes text the same way as normalize_text() does (with spaces on start/end and after dots)
+    and builds the map of positions in the normalized text to positions in the source text.
+    Each char of the normalized text gets the position of the source char it was taken from.
+    Each space gets the position in the source text right after the preceding token (or dot).
+    :param text:
+    :param lowercase:
+    :param use_stemmer:
+    :return: (normalized text, array of source positions - one item per char of the normalized text)
+    """
+    tokens = get_token_list(text)
+    spans = get_token_spans(text, tokens)
+    if lowercase:
+        tokens = [t.lower() for t in tokens]
+    if use_stemmer:
+        tokens = [DEFAULT_STEMMER.stem(t) for t in tokens]
+
+    offsets = array('i', [0])
+    for token, (start, end) in zip(tokens, spans):
+        if len(token) == end - start:
+            offsets.extend(range(start, end))
+        else:
+            # stems and replaced quotes
+            last = max(start, end - 1)
+            offsets.extend(min(start + i, last) for i in range(len(token)))
+        offsets.append(end)
+    res = ' ' + ' '.join(tokens) + ' '
+    if not tokens:
+        offsets.append(0)
+
+    res, offsets = _replace_with_offsets(res, offsets, '.', ' . ', lambda o: (o, o, o + 1))
+    res, offsets = _replace_with_offsets(res, offsets, '  ', ' ', lambda o: (o,))
+    return res, offsets
+
+
+def _get_source_coords(normalized_text: str, offsets: array, start: int, end: int) -> Tuple[int, int]:
+    """
+    Convert [start, end] (both inclusive) coordinates of an alias found in the normalized text
+    into [start, end) coordinates in the source text. Spaces surrounding the alias are not included.
+    """
+    last = len(offsets) - 1
+    start = min(start, last)
+    end = min(end, last)
+    while start < end and normalized_text[start] == ' ':
+        start += 1
+    return offsets[start], offsets[end] if normalized_text[end] == ' ' else offsets[end] + 1
+
+
 def alias_is_blacklisted(alias_black_list: Union[None, Dict[str, Tuple[List[str], List[str]]]],
                          norm_alias: str,
                          alias_lang:str,
@@ -268,6 +348,29 @@ def alias_is_blacklisted(alias_black_list: Union[None, Dict[str, Tuple[List[str]
     return False
 
 
+def _abbrev_in_uppercase_block(text: str, position: int, check_range: int) -> bool:
+    block = text[max(0, position - check_range): min(len(text), position + check_range)]
+    block_upper = block.upper()
+    return block == block_upper
+
+
+def _add_to_search_context(context: Dict[int, SearchResultPosition],
+                           entity: Tuple[int, str, int, List[Tuple]],
+                           alias: Tuple,
+                           start: int,
+                           end: int):
+    """
+    Put the found alias into the search context leaving the longest alias for each position in the text.
+    If there is already a found alias at this position and it is not shorter than the new one - then the entity
+    is added to the entities of this position.
+    """
+    already_found = context.get(start)
+    if already_found and len(already_found.alias_text) >= len(alias[0]):
+        already_found.add_entity(entity, alias)
+    else:
+        context[start] = SearchResultPosition(entity, alias, start, end)
+
+
 def _find_entity_positions(normalized_text: str,
                            normalized_text_lowercase: str,
                            entity: Tuple[int, str, int, List[Tuple]],
@@ -306,11 +409,6 @@ def _find_entity_positions(normalized_text: str,
     :return:
     """
 
-    def abbrev_in_uppercase_block(text: str, position: int, check_range:int):
-        block = text[max(0, position - check_range): min(len(text), position + check_range)]
-        block_upper = block.upper()
-        return block == block_upper
-
     if context is None:
         context = dict()
 
@@ -345,15 +443,242 @@ def _find_entity_positions(normalized_text: str,
                     break
 
                 if alias_is_abbreviation and \
-                        abbrev_in_uppercase_block(normalized_text_for_alias, start, abbrev_uppercase_check_range):
+                        _abbrev_in_uppercase_block(normalized_text_for_alias, start, abbrev_uppercase_check_range):
                     continue
                 end = start + len(normalized_alias) - 1
+                _add_to_search_context(context, entity, ea, start, end)
+
+
+class _TokenAutomaton:
+    """
+    Aho-Corasick automaton over sequences of tokens.
+    Transitions are made on whole tokens instead of characters - normalized aliases are always token-aligned
+    in the normalized text, so this keeps the automaton small even for tens of thousands of aliases.
+    """
+    __slots__ = ('goto', 'fail', 'out')
+
+    def __init__(self):
+        self.goto = [dict()]  # type: List[Dict[str, int]]
+        self.fail = [0]  # type: List[int]
+        self.out = [[]]  # type: List[List[int]]
+
+    def add(self, tokens: List[str], pattern_id: int):
+        state = 0
+        for token in tokens:
+            next_state = self.goto[state].get(token)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][token] = next_state
+                self.goto.append(dict())
+                self.fail.append(0)
+                self.out.append([])
+            state = next_state
+        self.out[state].append(pattern_id)
 
-                already_found = context.get(start)
-                if already_found and len(already_found.alias_text) >= len(alias_text):
-                    already_found.add_entity(entity, ea)
-                else:
-                    context[start] = SearchResultPosition(entity, ea, start, end)
+    def compile(self):
+        """
+        Build failure links (breadth-first) and merge outputs of the states reachable via failure links.
+        """
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fail_state = self.fail[state]
+                while fail_state and token not in self.goto[fail_state]:
+                    fail_state = self.fail[fail_state]
+                self.fail[next_state] = self.goto[fail_state].get(token, 0)
+                fail_out = self.out[self.fail[next_state]]
+                if fail_out:
+                    self.out[next_state] = self.out[next_state] + fail_out
+
+    def find(self, tokens: List[str]) -> Generator[Tuple[int, int], None, None]:
+        """
+        Find all pattern occurrences in a single pass over the tokens.
+        :return: Generates (index of the last token of the occurrence, pattern id) in order of end positions.
+        """
+        goto = self.goto
+        fail = self.fail
+        out = self.out
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if out[state]:
+                for pattern_id in out[state]:
+                    yield index, pattern_id
+
+
+class DictEntityIndex:
+    """
+    Search index compiled once from the list of dictionary entities.
+
+    All aliases of all entities are put into Aho-Corasick automata (one for abbreviations searched in the
+    case-sensitive normalized text and one for other aliases searched in the lowercase normalized text).
+    This allows finding all alias occurrences in a single pass over the text instead of running str.find()
+    for each alias of each entity.
+
+    The index can be passed to find_dict_entities() (and get_geoentities(), get_courts(), ...) in place
+    of the raw entity config list. Search results are the same as for the list.
+    Language, minimal alias length and alias black list filters are applied at search time,
+    so one index can be used with different search options.
+    """
+
+    def __init__(self,
+                 all_possible_entities: Iterable[Tuple[int, str, int, List[Tuple]]],
+                 use_stemmer: bool = False):
+        """
+        :param all_possible_entities: list of all possible entities to search for - see entity_config().
+        :param use_stemmer: Use stemmer instead of tokenizer for normalizing the aliases and the texts.
+        See normalize_text().
+        """
+        self.use_stemmer = use_stemmer
+        self.entities = list(all_possible_entities)
+        # pattern id -> normalized alias, is abbreviation, list of (entity index, alias index)
+        self.patterns = []  # type: List[Tuple[str, bool, List[Tuple[int, int]]]]
+        # patterns which are not token-aligned (custom normalized aliases) - searched with str.find()
+        self.irregular_pattern_ids = []  # type: List[int]
+        self.abbrev_automaton = _TokenAutomaton()
+        self.lowercase_automaton = _TokenAutomaton()
+        self.pattern_token_counts = []  # type: List[int]
+
+        pattern_ids = dict()  # type: Dict[Tuple[bool, str], int]
+        for entity_index, entity in enumerate(self.entities):
+            for alias_index, alias in enumerate(get_entity_aliases(entity) or []):
+                alias_text = alias[0]
+                if not alias_text:
+                    continue
+                is_abbrev = bool(alias[2])
+                normalized_alias = alias[4] if len(alias) == 5 and alias[4] is not None \
+                    else normalize_text(alias_text, lowercase=not is_abbrev, use_stemmer=use_stemmer)
+                if not normalized_alias:
+                    continue
+                key = (is_abbrev, normalized_alias)
+                pattern_id = pattern_ids.get(key)
+                if pattern_id is None:
+                    pattern_id = len(self.patterns)
+                    pattern_ids[key] = pattern_id
+                    self.patterns.append((normalized_alias, is_abbrev, []))
+                    tokens = self._get_pattern_tokens(normalized_alias)
+                    self.pattern_token_counts.append(len(tokens) if tokens else 0)
+                    if tokens:
+                        automaton = self.abbrev_automaton if is_abbrev else self.lowercase_automaton
+                        automaton.add(tokens, pattern_id)
+                    else:
+                        self.irregular_pattern_ids.append(pattern_id)
+                self.patterns[pattern_id][2].append((entity_index, alias_index))
+
+        self.abbrev_automaton.compile()
+        self.lowercase_automaton.compile()
+
+    @staticmethod
+    def _get_pattern_tokens(normalized_alias: str) -> Union[None, List[str]]:
+        """
+        Normalized aliases are surrounded by spaces, so their occurrences in the normalized text always
+        start and end on a space and cover a whole number of space-separated tokens.
+        Returns None for the aliases which do not fit this form.
+        """
+        if len(normalized_alias) < 2 or normalized_alias[0] != ' ' or normalized_alias[-1] != ' ':
+            return None
+        return normalized_alias[1:-1].split(' ')
+
+    @staticmethod
+    def _split_normalized_text(normalized_text: str) -> Tuple[List[str], List[int]]:
+        """
+        Split normalized text into tokens.
+        :return: (tokens, space positions) - token [i] lays between spaces [i] and [i + 1].
+        """
+        parts = normalized_text.split(' ')
+        space_positions = []
+        position = len(parts[0])
+        for part in parts[1:]:
+            space_positions.append(position)
+            position += len(part) + 1
+        return parts[1:-1], space_positions
+
+    def _find_pattern_starts(self,
+                             normalized_text: str,
+                             automaton: _TokenAutomaton,
+                             found: Dict[int, List[int]]):
+        tokens, space_positions = self._split_normalized_text(normalized_text)
+        token_counts = self.pattern_token_counts
+        for last_token_index, pattern_id in automaton.find(tokens):
+            start = space_positions[last_token_index - token_counts[pattern_id] + 1]
+            starts = found.get(pattern_id)
+            if starts is None:
+                found[pattern_id] = [start]
+            else:
+                starts.append(start)
+
+    def find_positions(self,
+                       normalized_text: str,
+                       normalized_text_lowercase: str,
+                       text_languages: Union[List[str], Tuple[str], Set[str]] = None,
+                       min_alias_len: int = None,
+                       alias_black_list: Union[None, Dict[str, Tuple[List[str], List[str]]]] = None,
+                       abbrev_uppercase_check_range: int = 20) -> Dict[int, SearchResultPosition]:
+        """
+        Find all alias occurrences in the normalized text and build the search context:
+        map of positions in the normalized text to SearchResultPosition entries.
+        The context is filled the same way as _find_entity_positions() does it being called for each entity
+        one by one - so the results (including longest match and conflict resolution) are equal.
+        See find_dict_entities() for the description of the parameters.
+        """
+        found = dict()  # type: Dict[int, List[int]]
+        self._find_pattern_starts(normalized_text, self.abbrev_automaton, found)
+        self._find_pattern_starts(normalized_text_lowercase, self.lowercase_automaton, found)
+        for pattern_id in self.irregular_pattern_ids:
+            normalized_alias, is_abbrev, _ = self.patterns[pattern_id]
+            text = normalized_text if is_abbrev else normalized_text_lowercase
+            starts = []
+            start = text.find(normalized_alias)
+            while start >= 0:
+                starts.append(start)
+                start = text.find(normalized_alias, start + 1)
+            if starts:
+                found[pattern_id] = starts
+
+        hits = []  # type: List[Tuple[int, int, int, int]]
+        for pattern_id, starts in found.items():
+            normalized_alias, is_abbrev, entity_aliases = self.patterns[pattern_id]
+            alias_len = len(normalized_alias)
+            text = normalized_text if is_abbrev else normalized_text_lowercase
+
+            # Repeat the behaviour of the sequential str.find() search: the next occurrence is searched
+            # starting from the last char of the previous one (accepted or not).
+            accepted_starts = []
+            search_from = 0
+            for start in starts:
+                if start < search_from:
+                    continue
+                search_from = start + max(alias_len - 1, 1)
+                if is_abbrev and _abbrev_in_uppercase_block(text, start, abbrev_uppercase_check_range):
+                    continue
+                accepted_starts.append(start)
+            if not accepted_starts:
+                continue
+
+            for entity_index, alias_index in entity_aliases:
+                alias = get_entity_aliases(self.entities[entity_index])[alias_index]
+                alias_lang = alias[1]
+                if text_languages and alias_lang and alias_lang not in text_languages:
+                    continue
+                if min_alias_len and len(alias[0]) < min_alias_len:
+                    continue
+                if alias_is_blacklisted(alias_black_list, normalized_alias, alias_lang, is_abbrev):
+                    continue
+                for start in accepted_starts:
+                    hits.append((entity_index, alias_index, start, start + alias_len - 1))
+
+        # Fill the context in the order of entities and aliases in the config to get the same
+        # results as the sequential search.
+        hits.sort()
+        context = dict()  # type: Dict[int, SearchResultPosition]
+        for entity_index, alias_index, start, end in hits:
+            entity = self.entities[entity_index]
+            _add_to_search_context(context, entity, get_entity_aliases(entity)[alias_index], start, end)
+        return context
 
 
 class DictionaryEntity:
@@ -374,7 +699,7 @@ class DictionaryEntity:
 
 
 def find_dict_entities(text: str,
-                       all_possible_entities: List[Tuple[int, str, int, List[Tuple]]],
+                       all_possible_entities: Union[DictEntityIndex, List[Tuple[int, str, int, List[Tuple]]]],
                        text_languages: Union[List[str], Tuple[str], Set[str]] = None,
                        conflict_resolving_func: Callable[[List[Tuple[int, str, List[Tuple]]]],
                                                          Tuple[List[Tuple[int, str, List[Tuple]]], Tuple]] = None,
@@ -395,6 +720,10 @@ def find_dict_entities(text: str,
     This method takes care of time AM/PM components which possibly can appear in the aliases of some entities -
     it tries to detect minutes/seconds/milliseconds before AM/PM and ignore them in such cases.
 
+    Coordinates of the found entities are returned as [start, end) positions in the source text.
+    They are calculated from the positions in the normalized text using the offset map built
+    while normalizing the text - see normalize_text_with_offsets().
+
     Algorithm of this method:
     1. Normalize the source text (we need lowercase and non-lowercase versions for abbrev searches).
     2. Create a shared search context - a map of position -> (alias text + list of matching entities)
@@ -420,10 +749,13 @@ def find_dict_entities(text: str,
     We could form regexps containing the possible aliases and apply them to the source text:
     r'alias1|alias2|longer alias2|...'
 
-    TODO Compare to other algorithms for time and memory complexity
+    For big configs (geo entities, courts) the entities should be compiled into DictEntityIndex once and the index
+    should be passed instead of the list. The index finds all aliases in a single pass over the text
+    using Aho-Corasick automata instead of searching for each alias separately. Results are the same.
 
     :param text:
-    :param all_possible_entities: list of dict or list of DictEntity - all possible entities to search for
+    :param all_possible_entities: list of dict or list of DictEntity - all possible entities to search for,
+    or DictEntityIndex compiled from such list. For the index its own use_stemmer setting is used.
     :param min_alias_len: Minimal length of alias/name to search for. Can be used to ignore too short aliases like "M."
     while searching.
     :param prepared_alias_black_list: List of aliases to remove from searching. Can be used to ignore concrete aliases.
@@ -445,15 +777,25 @@ def find_dict_entities(text: str,
     if not text:
         return
 
-    normalized_text = normalize_text(text, lowercase=False, use_stemmer=use_stemmer)
+    if isinstance(all_possible_entities, DictEntityIndex):
+        use_stemmer = all_possible_entities.use_stemmer
+
+    normalized_text, source_offsets = normalize_text_with_offsets(text, lowercase=False, use_stemmer=use_stemmer)
     normalized_text_lowercase = normalized_text.lower()
 
-    search_context = dict()
-    # Search for each DictEntity occurrence adding them into the shared search context.
-    for dict_entity in all_possible_entities:
-        _find_entity_positions(normalized_text, normalized_text_lowercase, dict_entity, text_languages, search_context,
-                               use_stemmer=use_stemmer, min_alias_len=min_alias_len,
-                               alias_black_list=prepared_alias_black_list)
+    if isinstance(all_possible_entities, DictEntityIndex):
+        # Search for all aliases in one pass using the compiled index.
+        search_context = all_possible_entities.find_positions(normalized_text, normalized_text_lowercase,
+                                                              text_languages=text_languages,
+                                                              min_alias_len=min_alias_len,
+                                                              alias_black_list=prepared_alias_black_list)
+    else:
+        search_context = dict()
+        # Search for each DictEntity occurrence adding them into the shared search context.
+        for dict_entity in all_possible_entities:
+            _find_entity_positions(normalized_text, normalized_text_lowercase, dict_entity, text_languages,
+                                   search_context, use_stemmer=use_stemmer, min_alias_len=min_alias_len,
+                                   alias_black_list=prepared_alias_black_list)
 
     # At this moment we have a map of positions in the text
     # to SearchResultPosition entries (position + appeared name/alias + DictEntity).
@@ -487,12 +829,13 @@ def find_dict_entities(text: str,
                     or re.match(r'\.\d\d\d\s', maybe_time2):
                 return []
 
+        coords = _get_source_coords(normalized_text, source_offsets, pos.start, pos.end)
         if len(entities_at_pos) == 1:
-            return [DictionaryEntity(entities_at_pos[0], (pos.start, pos.end))]
+            return [DictionaryEntity(entities_at_pos[0], coords)]
         else:
             cfree_ents = conflict_resolving_func(entities_at_pos) \
                 if conflict_resolving_func else entities_at_pos
-            return [DictionaryEntity(ent, (pos.start, pos.end))
+            return [DictionaryEntity(ent, coords)
                     for ent in cfree_ents]
 
     for (_index, next_pos) in sorted(search_context.items()):
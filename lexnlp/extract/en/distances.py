@@ -9,7 +9,7 @@ import re
 from typing import Generator
 
 from lexnlp.extract.common.annotations.distance_annotation import DistanceAnnotation
-from lexnlp.extract.en.amounts import get_amounts, NUM_PTN
+from lexnlp.extract.en.amounts import parse_amount_value, NUM_PTN
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -55,12 +55,11 @@ def get_distance_annotations(text: str, float_digits=4) \
 
     for match in DISTANCE_PTN_RE.finditer(text.lower()):
         source_text, number_text, distance_item = match.groups()
-        amount = list(get_amounts(number_text, float_digits=float_digits))
-        if len(amount) != 1:
+        amount = parse_amount_value(number_text, float_digits=float_digits)
+        if amount is None:
             continue
         distance_type = DISTANCE_SYMBOL_MAP.get(distance_item) \
                         or DISTANCE_TOKEN_MAP.get(distance_item)
-        amount = amount[0]
         if float_digits:
             amount = round(amount, float_digits)
         ant = DistanceAnnotation(coords=match.span(),
@@ -7,7 +7,7 @@ import regex as re
 
 from lexnlp.extract.common.durations.durations_parser import DurationParser
 from lexnlp.extract.common.annotations.duration_annotation import DurationAnnotation
-from lexnlp.extract.en.amounts import get_amounts, NUM_PTN
+from lexnlp.extract.en.amounts import parse_amount_value, NUM_PTN
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -56,10 +56,9 @@ class EnDurationParser(DurationParser):
 
         for match in cls.DURATION_PTN_RE.finditer(text.lower()):
             source_text, number_text, duration_type = match.groups()
-            amount = list(get_amounts(number_text, float_digits=float_digits))
-            if len(amount) != 1:
+            amount = parse_amount_value(number_text, float_digits=float_digits)
+            if amount is None:
                 continue
-            amount = amount[0]
             if float_digits:
                 amount = round(amount, float_digits)
             duration_days = cls.DURATION_MAP[duration_type] * amount
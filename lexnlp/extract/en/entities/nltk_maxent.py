@@ -14,7 +14,7 @@ Todo:
 import re
 import string
 
-from typing import Generator, Dict, Tuple
+from typing import Generator, Dict, List, Optional, Tuple
 
 import nltk
 
@@ -24,8 +24,7 @@ from lexnlp.extract.common.annotations.company_annotation import CompanyAnnotati
 from lexnlp.config.en.company_types import COMPANY_TYPES, COMPANY_DESCRIPTIONS
 from lexnlp.extract.en.entities import nltk_re
 from lexnlp.extract.en.utils import strip_unicode_punctuation, NPExtractor
-from lexnlp.nlp.en.segments.sentences import get_sentence_list, get_sentence_span_list
-from lexnlp.nlp.en.tokens import get_token_list
+from lexnlp.nlp.en.lex_document import LexDocument
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -46,6 +45,12 @@ PERSONS_STOP_WORDS = re.compile(
 
 
 def contains_companies(person:str, companies) -> bool:
+    """
+    Check the person's name is (a part of) a company name.
+    :param person: person's name
+    :param companies: companies found in the person's sentence
+    :return:
+    """
     if COMPANY_TYPES_RE.search(person):
         # noinspection PyTypeChecker
         for ant in nltk_re.get_companies(person):  # type: CompanyAnnotation
@@ -63,20 +68,40 @@ def contains_companies(person:str, companies) -> bool:
     return False
 
 
-def get_persons(text, strict=False, return_source=False, window=2) -> Generator:
+def get_companies_by_sentence(text: str,
+                              document: Optional[LexDocument] = None) -> Dict[int, List[CompanyAnnotation]]:
+    """
+    Find company annotations in text once and group them by sentences.
+    :param text:
+    :param document: shared sentences / tokens / POS tags of the text
+    :return: {sentence index: [companies found in the sentence]}
+    """
+    document = LexDocument.get(text, document)
+    companies = {}  # type: Dict[int, List[CompanyAnnotation]]
+    for ant in get_company_annotations(text, document=document):
+        index = document.get_sentence_index(ant.coords[0])
+        companies.setdefault(index, []).append(ant)
+    return companies
+
+
+def get_persons(text, strict=False, return_source=False, window=2,
+                document: Optional[LexDocument] = None) -> Generator:
     """
     Get names from text.
     :param window:
     :param return_source:
     :param strict:
     :param text:
+    :param document: shared sentences / tokens / POS tags of the text
     :return:
     """
+    document = LexDocument.get(text, document)
+    companies_by_sentence = get_companies_by_sentence(text, document)
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
+    for sentence_index, sentence in enumerate(document.sentences):
         # Tag sentence
-        sentence_pos = nltk.pos_tag(get_token_list(sentence))
-        companies = list(get_company_annotations(text))
+        sentence_pos = document.get_sentence_pos(sentence_index)
+        companies = companies_by_sentence.get(sentence_index, [])
 
         # Iterate through chunks
         persons = []
@@ -130,19 +155,22 @@ def get_persons(text, strict=False, return_source=False, window=2) -> Generator:
                 yield person
 
 
-def get_geopolitical(text, strict=False, return_source=False, window=2) -> Generator:
+def get_geopolitical(text, strict=False, return_source=False, window=2,
+                     document: Optional[LexDocument] = None) -> Generator:
     """
     Get GPEs from text.
     :param window:
     :param return_source:
     :param strict:
     :param text:
+    :param document: shared sentences / tokens / POS tags of the text
     :return:
     """
+    document = LexDocument.get(text, document)
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
+    for sentence_index, sentence in enumerate(document.sentences):
         # Tag sentence
-        sentence_pos = nltk.pos_tag(get_token_list(sentence))
+        sentence_pos = document.get_sentence_pos(sentence_index)
 
         # Iterate through chunks
         gpes = []
@@ -187,20 +215,23 @@ def get_geopolitical(text, strict=False, return_source=False, window=2) -> Gener
                 yield gpe
 
 
-def get_noun_phrases(text, strict=False, return_source=False, window=3, valid_punctuation=None) -> Generator:
+def get_noun_phrases(text, strict=False, return_source=False, window=3, valid_punctuation=None,
+                     document: Optional[LexDocument] = None) -> Generator:
     """
     Get NNP phrases from text.
     :param window:
     :param return_source:
     :param strict:
     :param text:
+    :param document: shared sentences / tokens / POS tags of the text
     :return:
     """
     valid_punctuation = valid_punctuation or VALID_PUNCTUATION
+    document = LexDocument.get(text, document)
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
+    for sentence_index, sentence in enumerate(document.sentences):
         # Tag sentence
-        sentence_pos = nltk.pos_tag(get_token_list(sentence))
+        sentence_pos = document.get_sentence_pos(sentence_index)
 
         # Iterate through chunks
         nnps = []
@@ -290,6 +321,7 @@ def get_company_annotations(
         use_gnp: bool = False,
         count_unique: bool = False,
         name_upper: bool = False,
+        document: Optional[LexDocument] = None
         ) -> Generator[CompanyAnnotation, None, None]:
     """
     Find company names in text, optionally using the stricter article/prefix expression.
@@ -299,6 +331,7 @@ def get_company_annotations(
     :param use_gnp: use get_noun_phrases or NPExtractor
     :param name_upper: return company name in upper case.
     :param count_unique: return only unique companies - case insensitive.
+    :param document: shared sentences / tokens / POS tags of the text
     :return:
     """
     # skip if all text is in uppercase
@@ -310,15 +343,17 @@ def get_company_annotations(
 
     if COMPANY_TYPES_RE.search(text):
         # Iterate through sentences
-        for s_start, s_end, sentence in get_sentence_span_list(text):
+        document = LexDocument.get(text, document)
+        for s_start, s_end, sentence in document.sentence_spans:
             # skip if whole phrase is in uppercase
             if sentence == sentence.upper():
                 continue
             if use_gnp:
                 phrases = list(get_noun_phrases(sentence, strict=strict,
-                                                valid_punctuation=valid_punctuation))
+                                                valid_punctuation=valid_punctuation,
+                                                document=document))
             else:
-                phrases = list(np_extractor.get_np(sentence))
+                phrases = list(np_extractor.get_np(sentence, document=document))
             phrase_spans = PhrasePositionFinder.find_phrase_in_source_text(sentence, phrases)
 
             for phrase, p_start, p_end in phrase_spans:
@@ -361,7 +396,8 @@ def get_companies(text: str,
                   count_unique: bool = False,
                   name_upper: bool = False,
                   parse_name_abbr: bool = False,
-                  return_source: bool = False):
+                  return_source: bool = False,
+                  document: Optional[LexDocument] = None):
     """
     Find company names in text, optionally using the stricter article/prefix expression.
     :param text:
@@ -372,6 +408,7 @@ def get_companies(text: str,
     :param count_unique: return only unique companies - case insensitive.
     :param parse_name_abbr: return company abbreviated name if exists.
     :param return_source:
+    :param document: shared sentences / tokens / POS tags of the text
     :return:
     """
     # skip if all text is in uppercase
@@ -380,7 +417,8 @@ def get_companies(text: str,
                                        strict,
                                        use_gnp,
                                        count_unique,
-                                       name_upper):  # type:CompanyAnnotation
+                                       name_upper,
+                                       document=document):  # type:CompanyAnnotation
         result = (ant.name, ant.company_type)
         if detail_type:
             result += (ant.company_type_abbr, ant.company_type_label, ant.description)
@@ -14,7 +14,8 @@ Todo:
 from typing import List, Any
 
 from lexnlp.extract.en.entities.nltk_maxent import get_noun_phrases, get_companies, get_persons, \
-    get_geopolitical
+    get_geopolitical, get_companies_by_sentence
+from lexnlp.nlp.en.lex_document import LexDocument
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -193,3 +194,21 @@ def test_gpe_in():
     """
     lexnlp_tests.test_extraction_func_on_test_data(get_geopolitical,
                                                    test_only_expected_in=True)
+
+
+def test_companies_by_sentence():
+    """
+    Test companies are found once and grouped by sentences.
+    :return:
+    """
+    text = 'This is an agreement between John Smith and Acme Supplies, LLC.\n\n' + \
+           'The Buyer is Umbrella Holdings, Inc. and the Seller is Don E. Marsh.'
+    document = LexDocument(text)
+    companies = get_companies_by_sentence(text, document)
+    assert sorted(companies) == [0, 1]
+    assert any('Acme' in c.name for c in companies[0])
+    assert any('Umbrella' in c.name for c in companies[1])
+    for index, sentence_companies in companies.items():
+        start, end, _ = document.sentence_spans[index]
+        for company in sentence_companies:
+            assert start <= company.coords[0] < company.coords[1] <= end
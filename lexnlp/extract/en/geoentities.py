@@ -11,7 +11,7 @@ from lexnlp.extract.common.annotations.text_annotation import TextAnnotation
 from lexnlp.extract.common.annotations.geo_annotation import GeoAnnotation
 from lexnlp.config.en import geoentities_config
 from lexnlp.extract.en.dict_entities import find_dict_entities, conflicts_take_first_by_id, \
-    prepare_alias_blacklist_dict, conflicts_top_by_priority, entity_config, add_aliases_to_entity
+    prepare_alias_blacklist_dict, conflicts_top_by_priority, entity_config, add_aliases_to_entity, DictEntityIndex
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -25,7 +25,7 @@ _ALIAS_BLACK_LIST_PREPARED = prepare_alias_blacklist_dict(geoentities_config.ALI
 
 
 def get_geoentities(text: str,
-                    geo_config_list: List[Tuple[int, str, List[Tuple[str, str, bool, int]]]],
+                    geo_config_list: Union[DictEntityIndex, List[Tuple[int, str, List[Tuple[str, str, bool, int]]]]],
                     priority: bool = False,
                     priority_by_id: bool = False,
                     text_languages: List[str] = None,
@@ -42,7 +42,8 @@ def get_geoentities(text: str,
     entity_alias(), add_aliases_to_entity().
     :param text:
     :param geo_config_list: List of all possible known geo entities in the form of tuples
-    (id, name, [(alias, lang, is_abbrev, alias_id), ...]).
+    (id, name, [(alias, lang, is_abbrev, alias_id), ...]), or DictEntityIndex built from this list.
+    For big configs it is much faster to build the index once and pass it on each call.
     :param priority: If two entities found with the totally equal matching aliases -
     then use the one with the greatest priority field.
     :param priority_by_id: If two entities found with the totally equal matching aliases -
@@ -74,7 +75,7 @@ def get_geoentities(text: str,
 
 
 def get_geoentity_annotations(text: str,
-                    geo_config_list: List[Tuple[int, str, List[Tuple[str, str, bool, int]]]],
+                    geo_config_list: Union[DictEntityIndex, List[Tuple[int, str, List[Tuple[str, str, bool, int]]]]],
                     priority: bool = False,
                     priority_by_id: bool = False,
                     text_languages: List[str] = None,
@@ -14,7 +14,7 @@ from typing import Generator
 
 from lexnlp.extract.common.annotations.money_annotation import MoneyAnnotation
 from lexnlp.extract.en.amounts import (
-    get_amounts, NUM_PTN, CURRENCY_PREFIX_MAP,
+    parse_amount_value, NUM_PTN, CURRENCY_PREFIX_MAP,
     CURRENCY_SYMBOL_MAP)
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -96,8 +96,8 @@ def get_money_annotations(text: str, float_digits=4) \
             continue
         prefix = capture['prefix']
         postfix = capture['postfix']
-        amount = list(get_amounts(capture['amount'][0], float_digits=float_digits))
-        if len(amount) != 1:
+        amount = parse_amount_value(capture['amount'][0], float_digits=float_digits)
+        if amount is None:
             continue
         if prefix:
             prefix = prefix[0].lower()
@@ -114,7 +114,7 @@ def get_money_annotations(text: str, float_digits=4) \
         text = capture['text'][0].strip(
                    string.punctuation.replace('$', '') + string.whitespace)
         ant = MoneyAnnotation(coords=match.span(),
-                              amount=amount[0],
+                              amount=amount,
                               text=text,
                               currency=currency_type)
         yield ant
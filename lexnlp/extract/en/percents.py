@@ -11,7 +11,7 @@ from typing import Generator
 
 from lexnlp.extract.en.ratios import get_ratio_annotations
 from lexnlp.extract.common.annotations.percent_annotation import PercentAnnotation
-from .amounts import get_amounts, NUM_PTN
+from .amounts import parse_amount_value, NUM_PTN
 from .money import CURRENCY_SYMBOL_MAP, CURRENCY_PREFIX_MAP
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -71,9 +71,9 @@ def get_percent_annotations(text: str, float_digits=4) \
             continue
 
         val = 0  # type:float
-        numbers = list(get_amounts(number_text, float_digits=float_digits))
-        if len(numbers) == 1:
-            val = numbers[0]
+        number = parse_amount_value(number_text, float_digits=float_digits)
+        if number is not None:
+            val = number
         else:
             ratios = list(get_ratio_annotations(number_text, float_digits=float_digits))
             if len(ratios) == 1:
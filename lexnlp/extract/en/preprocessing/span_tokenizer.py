@@ -1,7 +1,8 @@
 import nltk
-from typing import Tuple, Generator
+from typing import Tuple, Generator, Optional
 
 from lexnlp.extract.common.text_beautifier import TextBeautifier
+from lexnlp.nlp.en.lex_document import LexDocument
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -13,13 +14,14 @@ __email__ = "support@contraxsuite.com"
 
 class SpanTokenizer:
     @staticmethod
-    def get_token_spans(txt: str) -> \
+    def get_token_spans(txt: str, document: Optional[LexDocument] = None) -> \
             Generator[Tuple[str, str, int, int], None, None]:
         """
+        document: shared POS tags cache of the text
         returns: [('word', 'token', (word_start, word_end)), ...]
         """
         words = nltk.word_tokenize(txt)
-        tokens = nltk.pos_tag(words)
+        tokens = document.pos_tag(words) if document else nltk.pos_tag(words)
         offset = 0
         last_symbol = len(txt) - 1
 
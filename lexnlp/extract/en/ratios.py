@@ -11,7 +11,7 @@ import regex as re
 from typing import Generator
 
 from lexnlp.extract.common.annotations.ratio_annotation import RatioAnnotation
-from lexnlp.extract.en.amounts import get_amounts, NUM_PTN
+from lexnlp.extract.en.amounts import parse_amount_value, NUM_PTN
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -45,12 +45,10 @@ def get_ratio_annotations(text: str, float_digits=4) \
         -> Generator[RatioAnnotation, None, None]:
     for match in RATIO_PTN_RE.finditer(text.lower()):
         source_text, ratio_1_text, ratio_2_text = match.groups()
-        amount_1 = list(get_amounts(ratio_1_text, float_digits=float_digits))
-        amount_2 = list(get_amounts(ratio_2_text, float_digits=float_digits))
-        if len(amount_1) != 1 or len(amount_2) != 1:
+        amount_1 = parse_amount_value(ratio_1_text, float_digits=float_digits)
+        amount_2 = parse_amount_value(ratio_2_text, float_digits=float_digits)
+        if amount_1 is None or amount_2 is None:
             continue
-        amount_1 = amount_1[0]
-        amount_2 = amount_2[0]
         if amount_1 == 0 or amount_2 == 0:
             continue
         if float_digits:
@@ -11,7 +11,7 @@ Todo:
 
 # Imports
 
-from lexnlp.extract.en.amounts import get_amounts
+from lexnlp.extract.en.amounts import get_amounts, get_amount_annotations, parse_amount_value, text2num
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -79,3 +79,48 @@ outstanding under this Agreement have been declared or have automatically become
 acceleration or otherwise)."""
     for _ in lexnlp_tests.benchmark_extraction_func(get_amounts, text):
         continue
+
+
+def test_unit_token_window():
+    """
+    Test amount units are searched within the amount's sentence only.
+    :return:
+    """
+    text = "The Lender shall pay 5 million tons of coal. 25 Dollars will be paid by $35 each."
+    ants = list(get_amount_annotations(text))
+    assert [a.value for a in ants] == [5000000, 25, 35]
+    assert ants[0].text.startswith('5 million tons')
+    assert ants[1].text.startswith('25 Dollars')
+    assert ants[2].text == '$35'
+
+    ants = list(get_amount_annotations(text, unit_token_window=1))
+    assert ants[0].text == '5 million tons'
+
+
+def test_parse_amount_value():
+    """
+    Test parsing amount value without NLP processing.
+    :return:
+    """
+    assert parse_amount_value('25,000.00') == 25000
+    assert parse_amount_value(' Thirty ') == 30
+    assert parse_amount_value('2.55 BILLION') == 2550000000
+    assert parse_amount_value('1.123456', float_digits=2) == 1.12
+    assert parse_amount_value('five and 10') is None
+    assert parse_amount_value('no number') is None
+
+
+def test_text2num_cached_error():
+    """
+    Test each text2num() call raises its own error for the cached unknown number.
+    :return:
+    """
+    errors = []
+    for _ in range(2):
+        try:
+            text2num('one two three x')
+        except RuntimeError as e:
+            errors.append(e)
+    assert len(errors) == 2
+    assert errors[0] is not errors[1]
+    assert errors[0].args == errors[1].args == ('Unknown number: x',)
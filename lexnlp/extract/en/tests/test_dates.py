@@ -18,9 +18,13 @@ from typing import List, Tuple
 
 import pytest
 import datetime
+import itertools
 import random
 import string
 
+import pandas as pd
+
+from lexnlp.extract.en.date_model import DATE_MODEL_CHARS, MODEL_DATE, DateFeatureEngine, get_date_scores
 from lexnlp.extract.en.dates import get_dates_list, get_date_features, \
     get_raw_date_list, train_default_model
 from lexnlp.tests import lexnlp_tests
@@ -221,6 +225,62 @@ class TestDates(TestCase):
              'bigram_79': 0.0, 'bigram_21': 0.0, 'bigram_04': 0.0, 'char_7': 0.0, 'bigram_57': 0.0,
              'char_6': 0.0, 'bigram_94': 0.0})
 
+    @staticmethod
+    def count_date_features(text, start_index, end_index, include_bigrams=True, window=5, characters=None,
+                            norm=True):
+        """
+        Reference implementation of the date features: str.count() for each character and bigram.
+        """
+        characters = characters or DATE_MODEL_CHARS
+        feature_text = text[max(0, start_index - window):min(len(text), end_index + window)].strip()
+        char_vec = dict(("char_{0}".format(c), feature_text.count(c)) for c in characters)
+        bigram_vec = dict(("bigram_{0}".format("".join(b)), feature_text.count("".join(b)))
+                          for b in itertools.permutations(characters, 2)) if include_bigrams else {}
+        for vec in (char_vec, bigram_vec):
+            vec_sum = sum(vec.values())
+            if norm and vec_sum > 0:
+                for key in vec:
+                    vec[key] /= float(vec_sum)
+        char_vec.update(bigram_vec)
+        return char_vec
+
+    def test_date_feature_engine(self):
+        """
+        Test feature engine gives the same features as counting each character and bigram for each date candidate.
+        """
+        spans = [d[1] for d in get_raw_date_list(EXAMPLE_TEXT_1, return_source=True)] + [(0, 0), (10, 60)]
+        for kwargs in [dict(), dict(include_bigrams=False), dict(norm=False, characters=string.printable)]:
+            engine = DateFeatureEngine(EXAMPLE_TEXT_1, **kwargs)
+            matrix = engine.get_feature_matrix(spans)
+            for span, row in zip(spans, matrix):
+                expected = self.count_date_features(EXAMPLE_TEXT_1, span[0], span[1], **kwargs)
+                self.assertEqual(list(expected.keys()), engine.feature_names)
+                self.assertEqual(list(expected.values()), row.tolist())
+                self.assertEqual(expected, get_date_features(EXAMPLE_TEXT_1, span[0], span[1], **kwargs))
+
+    def test_date_features_lone_surrogate(self):
+        """
+        Test date features of a text with a lone surrogate character.
+        """
+        text = 'on 1 Jan \ud800 2020'
+        expected = self.count_date_features(text, 3, len(text), norm=False)
+        self.assertEqual(expected, get_date_features(text, 3, len(text), norm=False))
+        self.assertEqual(1, expected['char_J'])
+        self.assertEqual(2, expected['bigram_20'])
+
+    def test_date_scores_batch(self):
+        """
+        Test batch scoring of date candidates gives the same probabilities as scoring them one by one.
+        """
+        spans = [d[1] for d in get_raw_date_list(EXAMPLE_TEXT_1, return_source=True)]
+        self.assertTrue(spans)
+        batch_scores = get_date_scores(EXAMPLE_TEXT_1, spans)
+        for span, batch_score in zip(spans, batch_scores):
+            row_df = pd.DataFrame([get_date_features(EXAMPLE_TEXT_1, span[0], span[1])])
+            single_score = MODEL_DATE.predict_proba(row_df.loc[:, MODEL_DATE.columns])[0, 1]
+            self.assertAlmostEqual(single_score, batch_score)
+        self.assertEqual(0, len(get_date_scores(EXAMPLE_TEXT_1, [])))
+
     @pytest.mark.serial
     def test_build_model(self):
         """
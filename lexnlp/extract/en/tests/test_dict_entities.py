@@ -10,7 +10,8 @@ from unittest import TestCase
 from nose.tools import assert_dict_equal, assert_true, assert_false, assert_equals
 
 from lexnlp.extract.en.dict_entities import find_dict_entities, entity_config, entity_alias, get_entity_name, \
-    normalize_text, prepare_alias_blacklist_dict, alias_is_blacklisted, get_entity_id, get_alias_id, get_alias_text
+    normalize_text, prepare_alias_blacklist_dict, alias_is_blacklisted, get_entity_id, get_alias_id, get_alias_text, \
+    DictEntityIndex, conflicts_take_first_by_id, normalize_text_with_offsets
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -157,6 +158,27 @@ class TestDictEntities(TestCase):
         lexnlp_tests.test_extraction_func_on_test_data(normalize_text,
                                                        actual_data_converter=lambda text: (text,), debug_print=True)
 
+    def test_normalize_text_with_offsets(self):
+        for text in ['Bankr. E.D.N.C.', 'Something/Bankr. E.D.N.C. else.', '"Quoted"  Text\n\tU.S.. a..b', 'Tables', '']:
+            for lowercase in (True, False):
+                for use_stemmer in (True, False):
+                    normalized, offsets = normalize_text_with_offsets(text, lowercase=lowercase,
+                                                                      use_stemmer=use_stemmer)
+                    assert_equals(normalize_text(text, lowercase=lowercase, use_stemmer=use_stemmer), normalized)
+                    assert_equals(len(normalized), len(offsets))
+
+        text = 'One "E.D.N.C." two'
+        normalized, offsets = normalize_text_with_offsets(text, lowercase=False)
+        start = normalized.find('E')
+        assert_equals(text.find('E'), offsets[start])
+        assert_equals(text.find('C') + 1, offsets[normalized.find(' ', normalized.find('C'))])
+
+    def test_source_coords(self):
+        us = entity_config(1, 'United States', aliases=[entity_alias('U.S.', is_abbreviation=True)])
+        text = 'The  "United\n States" of America and the U.S.. End.'
+        res = list(find_dict_entities(text, [us]))
+        assert_equals(['United\n States', 'U.S.'], [text[e.coords[0]:e.coords[1]] for e in res])
+
     def test_prepare_alias_blacklist_dict(self):
         src = [('Alias1', 'lang1', False), ('ABBREV1', 'lang1', True), ('Alias2', None, False),
                ('Alias3', 'lang1', False)]
@@ -195,3 +217,39 @@ class TestDictEntities(TestCase):
     def test_get_alias_text(self):
         alias = entity_alias('alias', 'lang', False, 123)
         assert_equals('alias', get_alias_text(alias))
+
+    def test_index_same_as_list(self):
+        mississippi = entity_config(1, 'Mississippi', aliases=[entity_alias('MS', is_abbreviation=True, language='en'),
+                                                               entity_alias('Mississippi', language='de'),
+                                                               entity_alias('Mississippi River', language='en')])
+        montserrat = entity_config(2, 'Montserrat', aliases=[entity_alias('MS', is_abbreviation=True, language='en'),
+                                                             entity_alias('Montserrat', language='en')])
+        america = entity_config(3, 'America', aliases=[entity_alias('AM', is_abbreviation=True)],
+                                name_is_alias=False)
+        us = entity_config(4, 'United States', aliases=[entity_alias('U.S.', is_abbreviation=True),
+                                                        entity_alias('States')])
+        entities = [mississippi, montserrat, america, us]
+        index = DictEntityIndex(entities)
+
+        texts = ['"MS" means "Mississippi River" or Montserrat, MS. It is 11:00 AM in the U.S. and AM.',
+                 'THE UNITED STATES OF AMERICA AND MS AND THE U.S. MS MS',
+                 'United States United States states, U.S.. U.S.A.',
+                 '']
+
+        def to_list(results):
+            return [(e.coords, get_entity_id(e.entity[0]), e.entity[1][0]) for e in results]
+
+        for text in texts:
+            for kwargs in [dict(),
+                           dict(text_languages=['en'], conflict_resolving_func=conflicts_take_first_by_id),
+                           dict(min_alias_len=3),
+                           dict(prepared_alias_black_list=prepare_alias_blacklist_dict([('MS', 'en', True)]))]:
+                expected = to_list(find_dict_entities(text, entities, **kwargs))
+                actual = to_list(find_dict_entities(text, index, **kwargs))
+                self.assertEqual(expected, actual)
+
+    def test_index_repeated_alias(self):
+        entity = entity_config(1, 'And', aliases=[entity_alias('AND', is_abbreviation=True)])
+        index = DictEntityIndex([entity])
+        res = list(find_dict_entities('And AND AND AND And', index))
+        self.assertEqual([(0, 3), (4, 7), (8, 11), (12, 15), (16, 19)], [e.coords for e in res])
@@ -11,7 +11,7 @@ import os
 
 from lexnlp.extract.common.base_path import lexnlp_test_path
 from lexnlp.extract.en.dict_entities import get_entity_name, \
-    prepare_alias_blacklist_dict
+    prepare_alias_blacklist_dict, DictEntityIndex
 from lexnlp.extract.en.geoentities import get_geoentities, load_entities_dict_by_path
 from lexnlp.tests import lexnlp_tests
 
@@ -31,6 +31,7 @@ def load_entities_dict():
 
 
 _CONFIG = list(load_entities_dict())
+_INDEX = DictEntityIndex(_CONFIG)
 
 
 def test_geoentities():
@@ -40,6 +41,15 @@ def test_geoentities():
                                                    debug_print=True)
 
 
+def test_geoentities_index():
+    lexnlp_tests.test_extraction_func_on_test_data(get_geoentities, geo_config_list=_INDEX,
+                                                   actual_data_converter=lambda actual:
+                                                   [get_entity_name(c[0]) for c in actual],
+                                                   debug_print=True,
+                                                   test_data_path='lexnlp/extract/en/tests/test_geoentities/'
+                                                                  'test_geoentities.csv')
+
+
 def test_geoentities_counting():
     text = 'And AND AND AND And'
     actual = list(get_geoentities(text, geo_config_list=_CONFIG))
@@ -61,7 +61,7 @@ class TestGeoentitiesPlain(TestCase):
 
         # here we (surprisingly) expect BE (for Belgium)
         ant = parse_geo_annotations(text)[0]
-        self.assertEqual((3, 6), ant.coords)
+        self.assertEqual((3, 5), ant.coords)
         cite = ant.get_cite()
         self.assertEqual('/en/geoentity/Belgium/1993', cite)
 
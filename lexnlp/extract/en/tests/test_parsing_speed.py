@@ -1,12 +1,14 @@
 import os
 from unittest import TestCase
 import codecs
+import csv
 import time
 from typing import Callable, Dict
 
 from lexnlp.extract.common.base_path import lexnlp_test_path
 from lexnlp.extract.en.acts import get_acts
-from lexnlp.extract.en.amounts import get_amounts
+from lexnlp.extract.en.amounts import get_amounts, text2num, NUM_PTN_RE, _normalize_written_number, \
+    _parse_normalized_number, _parse_written_number
 from lexnlp.extract.en.citations import get_citations
 from lexnlp.extract.en.conditions import get_conditions
 from lexnlp.extract.en.constraints import get_constraints
@@ -73,6 +75,36 @@ class TestParsingSpeed(TestCase):
 
         self.assertTrue('get_amounts' in times)
 
+    def text2num_speed(self):
+        """
+        Measure per-call text2num latency on the amounts test data:
+        - text2num_not_cached: the first calls, when the LRU cache is empty
+        - text2num_cached: the same calls repeated, all taken from the cache
+        - parser_no_cache: the table-driven parser alone, called without the cache
+        The implementation before the table-driven parser is not kept in the code,
+        so this benchmark doesn't measure the speedup against it.
+        """
+        file_path = os.path.join(lexnlp_test_path,
+                                 'lexnlp/extract/en/tests/test_amounts/test_get_amount.csv')
+        with codecs.open(file_path, 'r', encoding='utf-8') as fr:
+            numbers = [m.group() for row in csv.reader(fr) for m in NUM_PTN_RE.finditer(row[0])]
+
+        def parse_all(parse: Callable):
+            for number in numbers:
+                try:
+                    parse(number)
+                except:  # pylint:disable=bare-except
+                    pass
+
+        _parse_written_number.cache_clear()
+        times = {}  # type: Dict[str, float]
+        self.check_time('', lambda _: parse_all(text2num), 'text2num_not_cached', times)
+        self.check_time('', lambda _: parse_all(text2num), 'text2num_cached', times)
+        self.check_time('', lambda _: parse_all(lambda n: _parse_normalized_number(_normalize_written_number(n), True)),
+                        'parser_no_cache', times)
+        self.assertTrue(numbers)
+        self.assertTrue('text2num_cached' in times)
+
     def check_time(self, text: str, func: Callable, func_name: str, times: Dict[str, float]) -> None:
         start = time.time()
         func(text)
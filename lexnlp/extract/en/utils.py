@@ -8,9 +8,10 @@ import unicodedata
 from itertools import groupby
 
 import nltk
-from typing import Generator, List, Tuple
+from typing import Generator, List, Tuple, Optional
 
 from lexnlp.extract.common.annotations.phrase_position_finder import PhrasePositionFinder
+from lexnlp.nlp.en.lex_document import LexDocument
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -69,10 +70,14 @@ class NPExtractor(object):
                   if l[0][1] not in self.exception_pos or l[0][0] in self.exception_sym]
         return leaves
 
-    def get_np(self, text: str) -> Generator[str, None, None]:
+    def get_np(self, text: str, document: Optional[LexDocument] = None) -> Generator[str, None, None]:
+        """
+        :param text: text to search noun phrases in
+        :param document: document (whole text) the tagged tokens are cached in
+        """
         tokenizer_func = self.get_tokenizer()
         tokens = tokenizer_func(text)
-        pos_tokens = nltk.tag.pos_tag(tokens)
+        pos_tokens = document.pos_tag(tokens) if document else nltk.tag.pos_tag(tokens)
         chunks = self.chunker.parse(pos_tokens)
 
         for tree in chunks.subtrees(filter=lambda t: t.label() == 'NP'):
@@ -80,8 +85,9 @@ class NPExtractor(object):
             for np_items in leaves:
                 yield self.join(np_items)
 
-    def get_np_with_coords(self, text: str) -> List[Tuple[str, int, int]]:
-        phrases = list(self.get_np(text))
+    def get_np_with_coords(self, text: str,
+                           document: Optional[LexDocument] = None) -> List[Tuple[str, int, int]]:
+        phrases = list(self.get_np(text, document=document))
         tagged_phrases = PhrasePositionFinder.find_phrase_in_source_text(
             text, phrases)
         return tagged_phrases
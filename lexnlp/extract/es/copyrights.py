@@ -29,7 +29,7 @@ class CopyrightEsParser(CopyrightEnStyleParser):
             line_split_params=split_params)
 
     @classmethod
-    def extract_phrases_with_coords(cls, sentence: str) -> List[Tuple[str, int, int]]:
+    def extract_phrases_with_coords(cls, sentence: str, document=None) -> List[Tuple[str, int, int]]:
         return [(t.text, t.start, t.get_end()) for t in
                 cls.line_processor.split_text_on_line_with_endings(sentence)]
 
@@ -9,7 +9,7 @@ Dates parser based on dateparser package
 import regex as re
 from dateparser.data.date_translation_data.es import info
 
-from lexnlp.extract.common.dates import DateParser
+from lexnlp.extract.common.dates import DateParser, DateParsingContext
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -36,10 +36,10 @@ class ESDateParser(DateParser):
          lambda i: re.sub(r'\s*º\s*', ' ', i))
     ]
 
-    def get_extra_dates(self):
-        dateparser_dates_dict = {i[0]: i for i in self.DATES}
+    def get_extra_dates(self, context: DateParsingContext):
+        dateparser_dates_dict = {i[0]: i for i in context.dates}
         last_match_start = last_match_year = None
-        dates_rev = reversed(list(self.SEQUENTIAL_DATES_RE.finditer(self.TEXT)))
+        dates_rev = reversed(list(self.SEQUENTIAL_DATES_RE.finditer(context.text)))
         for match in dates_rev:
             capture = match.capturesdict()
             capture_text = ''.join(capture['text']).strip(',y ')
@@ -47,13 +47,13 @@ class ESDateParser(DateParser):
             if capture['year']:
                 last_match_year = int(''.join(capture['year']))
                 if capture_text not in dateparser_dates_dict:
-                    a_date = self.get_dateparser_dates(capture_text)
+                    a_date = self.get_dateparser_dates(capture_text, context.language)
                     if a_date:
                         a_date = a_date[0]
                         dateparser_dates_dict[a_date[0]] = a_date
             elif last_match_year and last_match_start is not None and last_match_start == match_end:
                 if capture_text not in dateparser_dates_dict:
-                    a_date = self.get_dateparser_dates(capture_text)
+                    a_date = self.get_dateparser_dates(capture_text, context.language)
                     if a_date:
                         date_str, a_date = a_date[0]
                         a_date = a_date.replace(year=last_match_year)
@@ -67,14 +67,14 @@ class ESDateParser(DateParser):
         dates = list(dateparser_dates_dict.values())
 
         for w_date_re, w_date_norm in self.WEIRD_DATES_NORM:
-            w_dates = w_date_re.findall(self.TEXT)
+            w_dates = w_date_re.findall(context.text)
             for w_date_str in w_dates:
                 date_str = w_date_norm(w_date_str)
-                date_res = self.get_dateparser_dates(date_str)
+                date_res = self.get_dateparser_dates(date_str, context.language)
                 if date_res:
                     dates.append((w_date_str, date_res[0][1]))
 
-        self.DATES = dates
+        context.dates = dates
 
 
 get_date_annotations = ESDateParser(enable_classifier_check=False, language='es').get_date_annotations
@@ -34,8 +34,6 @@ class RegulationsParser:
         self.reg_start_triggers = []  # type: List[Pattern]
         self.load_trigger_words()
         self.setup_regexes()
-        self.annotations = []  # type: List[RegulationAnnotation]
-        self.locale = ''
 
     def setup_regexes(self) -> None:
         # read *.csv content and build regexes out of this data
@@ -60,18 +58,17 @@ class RegulationsParser:
 
     def parse(self, text: str, locale: str = None) -> List[RegulationAnnotation]:
         # find annotations in text passed and return them as a list of objects
-        self.locale = locale or 'es'
-        self.annotations = []
-        self.match_start_trigger(text)
-        for ant in self.annotations:
+        annotations = self.match_start_trigger(text, locale or 'es')
+        for ant in annotations:
             ant.country = 'Spain'
-        return self.annotations
+        return annotations
 
-    def match_start_trigger(self, phrase: str) -> None:
+    def match_start_trigger(self, phrase: str, locale: str = 'es') -> List[RegulationAnnotation]:
         """
         :param phrase: mediante la emisión de instrumentos inscritos en el Registro Nacional de Valores, colocados
-        :return: {name: 'Registro Nacional de Valores', probability: 100, ...}
+        :return: [{name: 'Registro Nacional de Valores', probability: 100, ...}]
         """
+        annotations = []  # type: List[RegulationAnnotation]
         for reg in self.reg_start_triggers:
             for match in reg.finditer(phrase):
                 text = match.group()
@@ -80,18 +77,20 @@ class RegulationsParser:
                     name=text,
                     coords=coords,
                     text=text,
-                    locale=self.locale)
-                self.annotations.append(ant)
+                    locale=locale)
+                annotations.append(ant)
+        return annotations
 
     def trim_annotations(self) -> None:
         # remove excess words from each definition
         pass
 
-    def get_annotations_as_dictionaries(self) -> List:
+    @staticmethod
+    def get_annotations_as_dictionaries(annotations: List[RegulationAnnotation]) -> List:
         # make dictionaries like
         # { "attr": { "start": 100, "end": 162 }, "tags": {..} }
         # out of annotations
-        return [a.to_dictionary() for a in self.annotations]
+        return [a.to_dictionary() for a in annotations]
 
 
 def make_de_regulations_parser():
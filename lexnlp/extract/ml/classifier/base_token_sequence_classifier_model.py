@@ -2,7 +2,13 @@ import gzip
 import os
 import pickle
 from abc import abstractmethod
-from typing import Any, Tuple, Generator, List
+from typing import Any, Tuple, Generator, List, Union
+
+import numpy
+import scipy.sparse
+
+from lexnlp.utils.unicode.unicode_lookup import UNICODE_CATEGORIES, UNICODE_CATEGORY_TOP_IDS, \
+    UNICODE_TOP_CATEGORIES, categorize, categorize_codes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -20,14 +26,12 @@ class BaseTokenSequenceClassifierModel(object):
     Base classifier class for generic text sequence objects.
     """
 
-    unicode_character_categories = pickle.load(
-        open(os.path.join(MODULE_PATH, 'data/unicode_character_categories.pickle'), 'rb'))
-    unicode_character_category_mapping = pickle.load(
-        open(os.path.join(MODULE_PATH, 'data/unicode_character_category_mapping.pickle'), 'rb'))
-    unicode_character_top_category_mapping = pickle.load(
-        open(os.path.join(MODULE_PATH, 'data/unicode_character_top_category_mapping.pickle'), 'rb'))
-    unicode_top_category_set = set(unicode_character_top_category_mapping.values())
-    unicode_category_set = set(unicode_character_category_mapping.values())
+    # names of unicode_lookup.categorize() results used in the feature names,
+    # the characters missing in the unicode lookup tables are counted as "Cc" ("C")
+    unicode_category_names = ['Cc' if c == 'Cn' else c for c in UNICODE_CATEGORIES]
+    unicode_top_category_names = list(UNICODE_TOP_CATEGORIES)
+    unicode_top_category_set = set(unicode_top_category_names)
+    unicode_category_set = set(unicode_category_names)
 
     @staticmethod
     # pylint: disable=unused-argument
@@ -99,10 +103,95 @@ class BaseTokenSequenceClassifierModel(object):
                          pre_window=None, post_window=None):
         raise NotImplementedError('get_feature_list() should be implemented in derived class')
 
+    def get_code_categories(self, codes: numpy.ndarray) -> List[Tuple[str, str]]:
+        """
+        Get (top unicode category, unicode category) feature names of the code points.
+        """
+        category_ids = categorize_codes(codes).tolist()
+        return [(self.unicode_top_category_names[UNICODE_CATEGORY_TOP_IDS[i]], self.unicode_category_names[i])
+                for i in category_ids]
+
+    def get_text_categories(self, text: str) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Get unicode category and top category feature names of the text characters.
+        :return: (top category names, category names) - arrays of the text length
+        """
+        category_ids = categorize(text)
+        category_names = numpy.array(self.unicode_category_names, dtype=object)[category_ids]
+        top_category_names = numpy.array(self.unicode_top_category_names, dtype=object)[
+            UNICODE_CATEGORY_TOP_IDS[category_ids]]
+        return top_category_names, category_names
+
     @abstractmethod
-    def get_feature_data(self, text: str, feature_mask: List[int] = None):
+    def get_feature_data(self, text: str, feature_mask: List[int] = None, sparse: bool = False):
         raise NotImplementedError('get_feature_data() should be implemented in derived class')
 
+    def get_window_columns(self) -> Tuple[List[int], numpy.ndarray]:
+        """
+        Get window offsets and the columns of the base features for each of them.
+        :return: ([-pre_window, ... post_window], array of shape (len(offsets), len(self._base_feature_list)))
+        """
+        # pylint: disable=invalid-unary-operand-type
+        offsets = list(range(-self.pre_window, self.post_window + 1))
+        window_columns = numpy.array(
+            [[self._feature_index_map[str(offset) + '_' + f] for f in self._base_feature_list]
+             for offset in offsets], dtype=numpy.int64).reshape(len(offsets), len(self._base_feature_list))
+        return offsets, window_columns
+
+    def build_feature_data(self,
+                           num_tokens: int,
+                           rows: numpy.ndarray,
+                           columns: numpy.ndarray,
+                           values: numpy.ndarray,
+                           sparse: bool = False) -> Union[numpy.ndarray, scipy.sparse.csr_matrix]:
+        """
+        Build the feature matrix from the (row, column, value) entries of the tokens' own features
+        and copy the base ("0_...") features of the neighbour tokens into the window features.
+        The entries should not repeat (row, column) pairs. The values are stored as numpy.int8.
+        :param sparse: return scipy.sparse.csr_matrix instead of the dense array
+        """
+        rows = numpy.asarray(rows, dtype=numpy.int64)
+        columns = numpy.asarray(columns, dtype=numpy.int64)
+        values = numpy.asarray(values).astype(numpy.int8)
+
+        # handle window feature calculations
+        if self.pre_window + self.post_window > 0:
+            offsets, window_columns = self.get_window_columns()
+            base_positions = numpy.full(len(self.feature_list), -1, dtype=numpy.int64)
+            base_positions[window_columns[offsets.index(0)]] = numpy.arange(window_columns.shape[1])
+            is_base = base_positions[columns] >= 0
+            base_rows, base_values = rows[is_base], values[is_base]
+            base_ids = base_positions[columns[is_base]]
+
+            window_rows, window_cols, window_values = [rows], [columns], [values]
+            for offset_id, offset in enumerate(offsets):
+                if offset == 0:
+                    continue
+                # token i gets the features of token i + offset;
+                # the window ends before i + post_window unless the window reaches the last token
+                targets = base_rows - offset
+                if offset < 0:
+                    is_target = targets < num_tokens
+                elif offset < self.post_window:
+                    is_target = targets >= 0
+                else:
+                    is_target = (base_rows == num_tokens - 1) & (targets >= 0)
+                window_rows.append(targets[is_target])
+                window_cols.append(window_columns[offset_id, base_ids[is_target]])
+                window_values.append(base_values[is_target])
+            rows = numpy.concatenate(window_rows)
+            columns = numpy.concatenate(window_cols)
+            values = numpy.concatenate(window_values)
+
+        if sparse:
+            feature_data = scipy.sparse.csr_matrix((values, (rows, columns)),
+                                                   shape=(num_tokens, len(self.feature_list)), dtype=numpy.int8)
+            feature_data.eliminate_zeros()
+            return feature_data
+        feature_data = numpy.zeros((num_tokens, len(self.feature_list)), dtype=numpy.int8)
+        feature_data[rows, columns] = values
+        return feature_data
+
     def train_model(self, model, feature_data, target_data):
         """
         Train a model and set into class.
@@ -111,13 +200,15 @@ class BaseTokenSequenceClassifierModel(object):
 
     def run_model(self, text: str, outer_class=0,
                   start_class=1, inner_class=2, end_class=3, strict=True,
-                  feature_mask: List[int] = None)\
+                  feature_mask: List[int] = None,
+                  sparse: bool = False)\
             -> Generator[Tuple[int, int], None, None]:
         """
         Run model on text
+        :param sparse: pass scipy.sparse feature matrix to the model instead of the dense one
         """
 
-        feature_data, tokens = self.get_feature_data(text, feature_mask)
+        feature_data, tokens = self.get_feature_data(text, feature_mask, sparse=sparse)
         predicted_class = self.model.predict(feature_data)
         start_pos = -1
 
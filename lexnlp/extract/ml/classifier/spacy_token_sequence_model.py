@@ -1,12 +1,14 @@
 # Imports
 
-from typing import List, Optional
+from collections import defaultdict
+from typing import DefaultDict, List, Optional
 
 import numpy
 import os
 import spacy
 
 from lexnlp.extract.ml.classifier.base_token_sequence_classifier_model import BaseTokenSequenceClassifierModel
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -17,7 +19,8 @@ __email__ = "support@contraxsuite.com"
 
 
 MODULE_PATH = os.path.abspath(os.path.dirname(__file__))
-NLP_EN = spacy.load('en_core_web_sm')
+SPACY_EN = register_resource('en.spacy_en_core_web_sm', lambda: spacy.load('en_core_web_sm'))
+__getattr__ = lazy_module_attributes(__name__, {'NLP_EN': SPACY_EN})
 
 
 # TODO: Refactor to support multiple languages
@@ -161,55 +164,52 @@ class SpacyTokenSequenceClassifierModel(BaseTokenSequenceClassifierModel):
 
     def get_feature_data(self,
                          text: str,
-                         feature_mask: List[int] = None):
+                         feature_mask: List[int] = None,
+                         sparse: bool = False):
         """
         Get features based on character model.
+        sparse - return scipy.sparse.csr_matrix instead of the dense array
         """
         # parse text with spacy
-        text_data = [(self.unicode_character_top_category_mapping[
-                          c] if c in self.unicode_character_top_category_mapping else "C",
-                      self.unicode_character_category_mapping[
-                          c] if c in self.unicode_character_category_mapping else "Cc",
-                      ord(c)
-                      ) for c in text]
+        top_categories, categories = self.get_text_categories(text)
         text_lower = text.lower()
-        doc = NLP_EN(text)
+        doc = SPACY_EN.get()(text)
 
-        # setup return structure
+        # setup return structure: (rows, columns, values) of the non-window features
         tokens = []
         num_tokens = len(doc)
-        num_features = len(self.feature_list)
-        feature_data = numpy.zeros((num_tokens, num_features), dtype=numpy.int8)
+        rows, columns, values = [], [], []
 
         # iterate through tokens
         for i, token in enumerate(doc):
             o = str(0)
-            feature_data[i, self._feature_index_map['position']] = i
-            feature_data[i, self._feature_index_map['length']] = len(token)
-            feature_data[i, self._feature_index_map['mask']] = 0
+            token_data = defaultdict(int)  # type: DefaultDict[int, int]
+            token_data[self._feature_index_map['position']] = i
+            token_data[self._feature_index_map['length']] = len(token)
+            token_data[self._feature_index_map['mask']] = 0
 
             if token.pos_ in SPACY_POS_LIST:
-                feature_data[i, self._feature_index_map['is_pos_' + token.pos_]] = 1
+                token_data[self._feature_index_map['is_pos_' + token.pos_]] = 1
             else:
-                feature_data[i, self._feature_index_map['is_pos_other']] = 1
+                token_data[self._feature_index_map['is_pos_other']] = 1
 
             if token.tag_ in SPACY_TAG_LIST:
-                feature_data[i, self._feature_index_map['is_tag_' + token.tag_]] = 1
+                token_data[self._feature_index_map['is_tag_' + token.tag_]] = 1
             else:
-                feature_data[i, self._feature_index_map['is_tag_other']] = 1
+                token_data[self._feature_index_map['is_tag_other']] = 1
 
             if token.dep_ in SPACY_DEP_LIST:
-                feature_data[i, self._feature_index_map['is_dep_' + token.dep_]] = 1
+                token_data[self._feature_index_map['is_dep_' + token.dep_]] = 1
             else:
-                feature_data[i, self._feature_index_map['is_dep_other']] = 1
+                token_data[self._feature_index_map['is_dep_other']] = 1
 
             if self.string_checks:
-                feature_data[i, self._feature_index_map[o + "_is_title"]] = token.is_title
-                feature_data[i, self._feature_index_map[o + "_is_lower"]] = token.is_lower
-                feature_data[i, self._feature_index_map[o + "_is_upper"]] = token.is_upper
+                token_data[self._feature_index_map[o + "_is_title"]] = token.is_title
+                token_data[self._feature_index_map[o + "_is_lower"]] = token.is_lower
+                token_data[self._feature_index_map[o + "_is_upper"]] = token.is_upper
 
             if str(token) in self.match_tokens:
-                feature_data[i, self._feature_index_map[o + "_token_" + str(token)]] = 1
+                token_data[self._feature_index_map[o + "_token_" + str(token)]] = 1
 
             start_pos = token.idx
             end_pos = token.idx + len(token)
@@ -218,64 +218,58 @@ class SpacyTokenSequenceClassifierModel(BaseTokenSequenceClassifierModel):
                 c = text[j]
                 cl = text_lower[j]
                 if feature_mask:
-                    feature_data[i, self._feature_index_map['mask']] = max(
-                        feature_data[i, self._feature_index_map['mask']], feature_mask[j])
+                    token_data[self._feature_index_map['mask']] = max(
+                        token_data[self._feature_index_map['mask']], feature_mask[j])
 
                 if c in self.letter_set:
-                    feature_data[i, self._feature_index_map[o + "_char_" + c]] += 1
-                    feature_data[i, self._feature_index_map[o + "_lchar_" + cl]] += 1
+                    token_data[self._feature_index_map[o + "_char_" + c]] += 1
+                    token_data[self._feature_index_map[o + "_lchar_" + cl]] += 1
                     if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_char_" + c]] += 1
-                        feature_data[i, self._feature_index_map[o + "_first_lchar_" + cl]] += 1
+                        token_data[self._feature_index_map[o + "_first_char_" + c]] += 1
+                        token_data[self._feature_index_map[o + "_first_lchar_" + cl]] += 1
                     if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_char_" + c]] += 1
-                        feature_data[i, self._feature_index_map[o + "_last_lchar_" + cl]] += 1
+                        token_data[self._feature_index_map[o + "_last_char_" + c]] += 1
+                        token_data[self._feature_index_map[o + "_last_lchar_" + cl]] += 1
                 elif c in self.digit_set:
-                    feature_data[i, self._feature_index_map[o + "_digit_" + c]] += 1
+                    token_data[self._feature_index_map[o + "_digit_" + c]] += 1
                     if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_digit_" + c]] += 1
+                        token_data[self._feature_index_map[o + "_first_digit_" + c]] += 1
                     if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_digit_" + c]] += 1
+                        token_data[self._feature_index_map[o + "_last_digit_" + c]] += 1
                 elif c in self.punc_set:
-                    feature_data[i, self._feature_index_map[o + "_punc_" + c]] += 1
+                    token_data[self._feature_index_map[o + "_punc_" + c]] += 1
                     if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_punc_" + c]] += 1
+                        token_data[self._feature_index_map[o + "_first_punc_" + c]] += 1
                     if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_punc_" + c]] += 1
+                        token_data[self._feature_index_map[o + "_last_punc_" + c]] += 1
                 elif c in self.symbol_set:
-                    feature_data[i, self._feature_index_map[o + "_symbol_" + c]] += 1
+                    token_data[self._feature_index_map[o + "_symbol_" + c]] += 1
                     if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_symbol_" + c]] += 1
+                        token_data[self._feature_index_map[o + "_first_symbol_" + c]] += 1
                     if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_symbol_" + c]] += 1
+                        token_data[self._feature_index_map[o + "_last_symbol_" + c]] += 1
                 else:
-                    feature_data[i, self._feature_index_map[o + "_char_other"]] += 1
+                    token_data[self._feature_index_map[o + "_char_other"]] += 1
                     if j == start_pos:
-                        feature_data[i, self._feature_index_map[o + "_first_char_other"]] += 1
+                        token_data[self._feature_index_map[o + "_first_char_other"]] += 1
                     if j == end_pos - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_char_other"]] += 1
+                        token_data[self._feature_index_map[o + "_last_char_other"]] += 1
 
-                feature_data[i, self._feature_index_map[o + "_cat_" + text_data[j][1]]] += 1
-                feature_data[i, self._feature_index_map[o + "_tcat_" + text_data[j][0]]] += 1
+                token_data[self._feature_index_map[o + "_cat_" + categories[j]]] += 1
+                token_data[self._feature_index_map[o + "_tcat_" + top_categories[j]]] += 1
 
                 if j == start_pos:
-                    feature_data[i, self._feature_index_map[o + "_first_cat_" + text_data[j][1]]] += 1
-                    feature_data[i, self._feature_index_map[o + "_first_tcat_" + text_data[j][0]]] += 1
+                    token_data[self._feature_index_map[o + "_first_cat_" + categories[j]]] += 1
+                    token_data[self._feature_index_map[o + "_first_tcat_" + top_categories[j]]] += 1
                 if j == end_pos - 1:
-                    feature_data[i, self._feature_index_map[o + "_last_cat_" + text_data[j][1]]] += 1
-                    feature_data[i, self._feature_index_map[o + "_last_tcat_" + text_data[j][0]]] += 1
-
-        # handle window feature calculations
-        if self.pre_window + self.post_window > 0:
-            for i in range(num_tokens):
-                j_start = (i - self.pre_window) if (i - self.pre_window >= 0) else 0
-                j_end = (i + self.post_window) if (i + self.post_window + 1 < num_tokens) else num_tokens
-                for j in range(j_start, j_end):
-                    if j == i:
-                        continue
-                    o = str(j - i)
-                    for f in self._base_feature_list:
-                        feature_data[i, self._feature_index_map[o + '_' + f]] = \
-                            feature_data[j, self._feature_index_map['0_' + f]]
+                    token_data[self._feature_index_map[o + "_last_cat_" + categories[j]]] += 1
+                    token_data[self._feature_index_map[o + "_last_tcat_" + top_categories[j]]] += 1
 
+            rows.extend([i] * len(token_data))
+            columns.extend(token_data.keys())
+            values.extend(token_data.values())
+
+        feature_data = self.build_feature_data(num_tokens, numpy.array(rows, dtype=numpy.int64),
+                                               numpy.array(columns, dtype=numpy.int64),
+                                               numpy.array(values, dtype=numpy.int64), sparse=sparse)
         return feature_data, tokens
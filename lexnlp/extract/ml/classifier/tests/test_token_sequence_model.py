@@ -0,0 +1,69 @@
+from unittest import TestCase
+import numpy as np
+
+from lexnlp.extract.ml.classifier.token_sequence_model import TokenSequenceClassifierModel
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "1.6.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class TestTokenSequenceClassifierModel(TestCase):
+    def test_tokens(self):
+        tokens = TokenSequenceClassifierModel.get_tokens(np.array([c == ' ' for c in ' ab  cd e ']))
+        self.assertEqual([(0, 3), (5, 7), (8, 9), (10, 10)], tokens)
+        self.assertEqual([(0, 0)], TokenSequenceClassifierModel.get_tokens(np.zeros(0, dtype=bool)))
+
+    def test_feature_data(self):
+        model = TokenSequenceClassifierModel(letter_set=list('abAB'), digit_set=list('0123456789'),
+                                             punc_set=list('.'), match_tokens=['b1.'],
+                                             pre_window=1, post_window=2, string_checks=True)
+        feature_data, tokens = model.get_feature_data('Ab b1. a$', feature_mask=[0, 1, 0, 0, 0, 0, 0, 0, 2])
+        self.assertEqual([(0, 2), (3, 6), (7, 9)], tokens)
+        self.assertEqual(np.int8, feature_data.dtype)
+
+        def get(token_id, feature):
+            return feature_data[token_id, model._feature_index_map[feature]]
+
+        self.assertEqual([0, 1, 2], [get(i, 'position') for i in range(3)])
+        self.assertEqual([2, 3, 2], [get(i, 'length') for i in range(3)])
+        self.assertEqual([1, 0, 2], [get(i, 'mask') for i in range(3)])
+        self.assertEqual([1, 0, 0], [get(i, '0_is_start') for i in range(3)])
+        self.assertEqual([0, 0, 1], [get(i, '0_is_end') for i in range(3)])
+        self.assertEqual([1, 0, 0], [get(i, '0_is_title') for i in range(3)])
+
+        self.assertEqual(1, get(0, '0_char_A'))
+        self.assertEqual(1, get(0, '0_lchar_a'))
+        self.assertEqual(1, get(0, '0_first_char_A'))
+        self.assertEqual(1, get(0, '0_last_lchar_b'))
+        self.assertEqual(1, get(1, '0_first_char_b'))
+        self.assertEqual(1, get(1, '0_last_punc_.'))
+        self.assertEqual(1, get(1, '0_token_b1.'))
+        self.assertEqual(1, get(2, '0_last_char_other'))
+        self.assertEqual(1, get(2, '0_last_cat_Sc'))
+        self.assertEqual(1, get(2, '0_tcat_L'))
+
+        # window features are copied from the neighbour tokens
+        self.assertEqual(get(0, '0_digit_1'), get(1, '-1_digit_1'))
+        self.assertEqual(get(1, '0_lchar_a'), get(0, '1_lchar_a'))
+        # the window reaches i + post_window only if that is the last token
+        self.assertEqual(get(2, '0_char_other'), get(0, '2_char_other'))
+        feature_data, _ = model.get_feature_data('a a a a')
+        self.assertEqual([0, 1, 0, 0], [get(i, '2_lchar_a') for i in range(4)])
+
+    def test_sparse_feature_data(self):
+        model = TokenSequenceClassifierModel(letter_set=list('abAB'), digit_set=list('0123456789'),
+                                             punc_set=list('.'), match_tokens=['b1.'],
+                                             pre_window=2, post_window=2, string_checks=True)
+        for text in ['', 'Ab b1. a$', 'a a a a b1. B', '  ab\tba\n\n1.' * 20]:
+            feature_data, tokens = model.get_feature_data(text)
+            sparse_data, sparse_tokens = model.get_feature_data(text, sparse=True)
+            self.assertEqual(tokens, sparse_tokens)
+            self.assertEqual('csr', sparse_data.format)
+            self.assertEqual(np.int8, sparse_data.dtype)
+            self.assertEqual(feature_data.shape, sparse_data.shape)
+            self.assertTrue(np.array_equal(feature_data, sparse_data.toarray()))
+            self.assertEqual(np.count_nonzero(feature_data), sparse_data.nnz)
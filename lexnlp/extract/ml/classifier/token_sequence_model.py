@@ -1,6 +1,6 @@
 # Imports
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy
 
@@ -132,116 +132,157 @@ class TokenSequenceClassifierModel(BaseTokenSequenceClassifierModel):
     # TODO: add "hints" alongside with the text? areas with special
     def get_feature_data(self,
                          text: str,
-                         feature_mask: List[int] = None):
+                         feature_mask: List[int] = None,
+                         sparse: bool = False):
         """
         Get features based on character model.
         feature_mask - array of numbers, has the same length as text
+        sparse - return scipy.sparse.csr_matrix instead of the dense array
+
+        The characters are mapped to feature ids through lookup tables built for the distinct
+        characters of the text, and the ids are counted for all the tokens at once.
         """
         # setup return data
-        text_len = len(text)
-        text_lower = [c.lower() for c in text]
-        text_data = [(self.unicode_character_top_category_mapping[
-                          c] if c in self.unicode_character_top_category_mapping else "C",
-                      self.unicode_character_category_mapping[
-                          c] if c in self.unicode_character_category_mapping else "Cc",
-                      ord(c)
-                      ) for c in text]
-
-        tokens = []
-        token_start = 0
+        codes = numpy.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=numpy.uint32)
+        unique_codes, char_ids = numpy.unique(codes, return_inverse=True)
+        char_ids = char_ids.reshape(-1)
+        unique_chars = [chr(c) for c in unique_codes.tolist()]
+        unique_categories = self.get_code_categories(unique_codes)
+
         # calculate token offsets
-        for i in range(text_len - 1):
-            if text_data[i][0] not in ['Z', 'C'] and text_data[i + 1][0] in ['Z', 'C']:
-                tokens.append((token_start, i + 1))
-                token_start = min(i + 2, text_len)
-            elif text_data[i][0] in ['Z', 'C'] and text_data[i + 1][0] in ['Z', 'C']:
-                token_start += 1
-        tokens.append((token_start, text_len))
+        is_separator = numpy.array([tcat in ('Z', 'C') for tcat, _ in unique_categories], dtype=bool)[char_ids]
+        tokens = self.get_tokens(is_separator)
         num_tokens = len(tokens)
 
-        # Setup return structure
-        feature_data = numpy.zeros((num_tokens, len(self.feature_list)), dtype=numpy.int8)
-
-        for i in range(num_tokens):
-            o = str(0)
-            token_text = text[tokens[i][0]:tokens[i][1]]
-
-            feature_data[i, self._feature_index_map['position']] = i
-            feature_data[i, self._feature_index_map['length']] = tokens[i][1] - tokens[i][0]
-            feature_data[i, self._feature_index_map['mask']] = 0
-
-            feature_data[i, self._feature_index_map[o + "_is_start"]] = int(i == 0)
-            feature_data[i, self._feature_index_map[o + "_is_end"]] = int(i == num_tokens - 1)
+        # Setup return structure: (rows, columns, values) of the non-window features
+        char_rows, char_columns, char_counts = self.get_char_count_data(tokens, char_ids, unique_chars,
+                                                                        unique_categories)
+        token_ids = numpy.arange(num_tokens)
+        token_starts = numpy.array([start for start, _ in tokens], dtype=numpy.int64)
+        token_ends = numpy.array([end for _, end in tokens], dtype=numpy.int64)
+        rows = [char_rows, token_ids, token_ids]
+        columns = [char_columns,
+                   numpy.full(num_tokens, self._feature_index_map['position']),
+                   numpy.full(num_tokens, self._feature_index_map['length'])]
+        values = [char_counts, token_ids, token_ends - token_starts]
+        if feature_mask:
+            token_mask = numpy.zeros(num_tokens, dtype=numpy.int64)
+            positions, position_token_ids = self.get_token_positions(tokens)
+            numpy.maximum.at(token_mask, position_token_ids, numpy.asarray(feature_mask)[positions])
+            rows.append(token_ids)
+            columns.append(numpy.full(num_tokens, self._feature_index_map['mask']))
+            values.append(token_mask)
+
+        flags = [(0, '0_is_start'), (num_tokens - 1, '0_is_end')]
+        for i, (token_start, token_end) in enumerate(tokens):
+            token_text = text[token_start:token_end]
             if self.string_checks:
-                feature_data[i, self._feature_index_map[o + "_is_title"]] = int(token_text == token_text.title())
-                feature_data[i, self._feature_index_map[o + "_is_lower"]] = int(token_text == token_text.lower())
-                feature_data[i, self._feature_index_map[o + "_is_upper"]] = int(token_text == token_text.upper())
-
+                if token_text == token_text.title():
+                    flags.append((i, '0_is_title'))
+                if token_text == token_text.lower():
+                    flags.append((i, '0_is_lower'))
+                if token_text == token_text.upper():
+                    flags.append((i, '0_is_upper'))
             if token_text in self.match_tokens:
-                feature_data[i, self._feature_index_map[o + "_token_" + token_text]] = 1
-
-            for j in range(tokens[i][0], tokens[i][1]):
-                c = text[j]
-                cl = text_lower[j]
-                if feature_mask:
-                    feature_data[i, self._feature_index_map['mask']] = max(
-                        feature_data[i, self._feature_index_map['mask']], feature_mask[j])
-
-                if c in self.letter_set:
-                    feature_data[i, self._feature_index_map[o + "_char_" + c]] += 1
-                    feature_data[i, self._feature_index_map[o + "_lchar_" + cl]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_char_" + c]] += 1
-                        feature_data[i, self._feature_index_map[o + "_first_lchar_" + cl]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_char_" + c]] += 1
-                        feature_data[i, self._feature_index_map[o + "_last_lchar_" + cl]] += 1
-                elif c in self.digit_set:
-                    feature_data[i, self._feature_index_map[o + "_digit_" + c]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_digit_" + c]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_digit_" + c]] += 1
-                elif c in self.punc_set:
-                    feature_data[i, self._feature_index_map[o + "_punc_" + c]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_punc_" + c]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_punc_" + c]] += 1
-                elif c in self.symbol_set:
-                    feature_data[i, self._feature_index_map[o + "_symbol_" + c]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_symbol_" + c]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_symbol_" + c]] += 1
-                else:
-                    feature_data[i, self._feature_index_map[o + "_char_other"]] += 1
-                    if j == tokens[i][0]:
-                        feature_data[i, self._feature_index_map[o + "_first_char_other"]] += 1
-                    if j == tokens[i][1] - 1:
-                        feature_data[i, self._feature_index_map[o + "_last_char_other"]] += 1
-
-                feature_data[i, self._feature_index_map[o + "_cat_" + text_data[j][1]]] += 1
-                feature_data[i, self._feature_index_map[o + "_tcat_" + text_data[j][0]]] += 1
-
-                if j == tokens[i][0]:
-                    feature_data[i, self._feature_index_map[o + "_first_cat_" + text_data[j][1]]] += 1
-                    feature_data[i, self._feature_index_map[o + "_first_tcat_" + text_data[j][0]]] += 1
-                if j == tokens[i][1] - 1:
-                    feature_data[i, self._feature_index_map[o + "_last_cat_" + text_data[j][1]]] += 1
-                    feature_data[i, self._feature_index_map[o + "_last_tcat_" + text_data[j][0]]] += 1
-
-        # handle window feature calculations
-        if self.pre_window + self.post_window > 0:
-            for i in range(num_tokens):
-                j_start = (i - self.pre_window) if (i - self.pre_window >= 0) else 0
-                j_end = (i + self.post_window) if (i + self.post_window + 1 < num_tokens) else num_tokens
-                for j in range(j_start, j_end):
-                    if j == i:
-                        continue
-                    o = str(j - i)
-                    for f in self._base_feature_list:
-                        feature_data[i, self._feature_index_map[o + '_' + f]] = \
-                            feature_data[j, self._feature_index_map['0_' + f]]
+                flags.append((i, '0_token_' + token_text))
+        rows.append(numpy.array([i for i, _ in flags], dtype=numpy.int64))
+        columns.append(numpy.array([self._feature_index_map[f] for _, f in flags], dtype=numpy.int64))
+        values.append(numpy.ones(len(flags), dtype=numpy.int64))
 
+        feature_data = self.build_feature_data(num_tokens, numpy.concatenate(rows), numpy.concatenate(columns),
+                                               numpy.concatenate(values), sparse=sparse)
         return feature_data, tokens
+
+    @staticmethod
+    def get_tokens(is_separator: numpy.ndarray) -> List[Tuple[int, int]]:
+        """
+        Get (start, end) of the tokens - character sequences ending before a separator.
+        A token starts after the separator ending the previous token, skipping any
+        other separators but the last one before the token.
+        """
+        text_len = is_separator.shape[0]
+        if text_len < 2:
+            return [(0, text_len)]
+        ends = numpy.nonzero(~is_separator[:-1] & is_separator[1:])[0]
+        separator_pairs = numpy.concatenate([[0], numpy.cumsum(is_separator[:-1] & is_separator[1:])])
+
+        # each token but the first one starts 2 chars after the previous token's last char
+        # and is moved further by each separator pair before its own end
+        pair_ranges_start = numpy.concatenate([[0], ends + 1])
+        pair_ranges_end = numpy.concatenate([ends, [text_len - 1]])
+        starts = numpy.concatenate([[0], numpy.minimum(ends + 2, text_len)])
+        starts += separator_pairs[pair_ranges_end] - separator_pairs[numpy.minimum(pair_ranges_start,
+                                                                                   text_len - 1)]
+        token_ends = numpy.concatenate([ends + 1, [text_len]])
+        return list(zip(starts.tolist(), token_ends.tolist()))
+
+    @staticmethod
+    def get_token_positions(tokens: List[Tuple[int, int]]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Get text positions covered by the tokens and the index of the token covering each of them.
+        """
+        token_starts = numpy.array([start for start, _ in tokens], dtype=numpy.int64)
+        token_ends = numpy.array([end for _, end in tokens], dtype=numpy.int64)
+        token_lengths = token_ends - token_starts
+        token_ids = numpy.repeat(numpy.arange(len(tokens)), token_lengths)
+        positions = numpy.arange(token_ids.shape[0]) - numpy.repeat(numpy.cumsum(token_lengths) - token_lengths,
+                                                                    token_lengths) + token_starts[token_ids]
+        return positions, token_ids
+
+    def get_char_feature_ids(self, c: str, categories: Tuple[str, str], kind: str) -> List[int]:
+        """
+        Get ids of the base features a character of a token adds 1 to.
+        :param c: the character
+        :param categories: (top unicode category, unicode category) of the character
+        :param kind: "" for any char of the token, "first_" or "last_" for its first or last char
+        """
+        o = str(0)
+        if c in self.letter_set:
+            names = [o + "_" + kind + "char_" + c, o + "_" + kind + "lchar_" + c.lower()]
+        elif c in self.digit_set:
+            names = [o + "_" + kind + "digit_" + c]
+        elif c in self.punc_set:
+            names = [o + "_" + kind + "punc_" + c]
+        elif c in self.symbol_set:
+            names = [o + "_" + kind + "symbol_" + c]
+        else:
+            names = [o + "_" + kind + "char_other"]
+        names.append(o + "_" + kind + "cat_" + categories[1])
+        names.append(o + "_" + kind + "tcat_" + categories[0])
+        return [self._feature_index_map[name] for name in names]
+
+    def get_char_count_data(self,
+                            tokens: List[Tuple[int, int]],
+                            char_ids: numpy.ndarray,
+                            unique_chars: List[str],
+                            unique_categories: List[Tuple[str, str]]) \
+            -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Count character features of the tokens.
+        :return: (token ids, feature ids, counts) of the non-zero counts
+        """
+        num_features = len(self.feature_list)
+        positions, token_ids = self.get_token_positions(tokens)
+        token_char_ids = char_ids[positions]
+        token_starts = numpy.array([start for start, _ in tokens], dtype=numpy.int64)
+        token_ends = numpy.array([end for _, end in tokens], dtype=numpy.int64)
+
+        cells = []
+        for kind, is_kind in [("", None),
+                              ("first_", positions == token_starts[token_ids]),
+                              ("last_", positions == token_ends[token_ids] - 1)]:
+            kind_token_ids = token_ids if is_kind is None else token_ids[is_kind]
+            kind_char_ids = token_char_ids if is_kind is None else token_char_ids[is_kind]
+
+            # feature ids of the distinct chars found in the tokens, padded with -1
+            used_char_ids = numpy.unique(kind_char_ids)
+            char_feature_ids = numpy.full((len(unique_chars), 4), -1, dtype=numpy.int64)
+            for char_id in used_char_ids.tolist():
+                ids = self.get_char_feature_ids(unique_chars[char_id], unique_categories[char_id], kind)
+                char_feature_ids[char_id, :len(ids)] = ids
+
+            feature_ids = char_feature_ids[kind_char_ids]
+            kind_cells = kind_token_ids[:, None] * num_features + feature_ids
+            cells.append(kind_cells[feature_ids >= 0])
+        cells, counts = numpy.unique(numpy.concatenate(cells), return_counts=True)
+        return cells // num_features, cells % num_features, counts
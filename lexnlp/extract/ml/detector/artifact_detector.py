@@ -4,6 +4,7 @@ import string
 import num2words
 import numpy
 import pandas
+import scipy.sparse
 
 from lexnlp.extract.ml.classifier.base_token_sequence_classifier_model import BaseTokenSequenceClassifierModel
 from lexnlp.extract.ml.detector.detecting_settings import DetectingSettings
@@ -49,13 +50,46 @@ class ArtifactDetector:
     def predict_text(self,
                      text: str,
                      join_settings: PhraseConstructorSettings = None,
-                     feature_mask: List[int] = None) -> Generator[Tuple[int, int], None, None]:
-        feature_data, tokens = self.model.get_feature_data(text, feature_mask)
+                     feature_mask: List[int] = None,
+                     sparse: bool = False) -> Generator[Tuple[int, int], None, None]:
+        feature_data, tokens = self.model.get_feature_data(text, feature_mask, sparse=sparse)
         predicted_class = self.model.model.predict(feature_data)
         join_settings = join_settings or self.join_token_settings
         yield from PhraseConstructor.join_tokens(
             tokens, predicted_class, settings=join_settings, feature_mask=feature_mask)
 
+    def predict_text_batch(self,
+                           texts: List[str],
+                           join_settings: PhraseConstructorSettings = None,
+                           feature_masks: Optional[List[Optional[List[int]]]] = None,
+                           sparse: bool = False) -> List[List[Tuple[int, int]]]:
+        """
+        Same as predict_text() for each of the texts, but the feature matrices of all the texts
+        are stacked, so that the model's predict() is called once for the whole batch.
+        :return: list of (start, end) phrases for each of the texts
+        """
+        if not texts:
+            return []
+        feature_masks = feature_masks or [None] * len(texts)
+        batch_data = [self.model.get_feature_data(text, feature_mask, sparse=sparse)
+                      for text, feature_mask in zip(texts, feature_masks)]
+        token_counts = [feature_data.shape[0] for feature_data, _ in batch_data]
+        if sum(token_counts):
+            matrices = [feature_data for feature_data, _ in batch_data]
+            feature_data = scipy.sparse.vstack(matrices, format='csr') if sparse else numpy.vstack(matrices)
+            predicted_class = self.model.model.predict(feature_data)
+        else:
+            predicted_class = numpy.zeros(0, dtype=numpy.int64)
+        ends = numpy.cumsum(token_counts)
+
+        join_settings = join_settings or self.join_token_settings
+        phrases = []  # type: List[List[Tuple[int, int]]]
+        for (_, tokens), feature_mask, end, token_count in zip(batch_data, feature_masks, ends, token_counts):
+            phrases.append(list(PhraseConstructor.join_tokens(
+                tokens, predicted_class[end - token_count:end], settings=join_settings,
+                feature_mask=feature_mask)))
+        return phrases
+
     def train_and_save(self,
                        settings: DetectingSettings,
                        train_file: str,
@@ -1,6 +1,7 @@
 from typing import Tuple, Union, List, Callable, Any, Optional
 import numpy
 import pandas
+import scipy.sparse
 
 from lexnlp.extract.ml.classifier.base_token_sequence_classifier_model import BaseTokenSequenceClassifierModel
 
@@ -35,8 +36,10 @@ def process_sample(sample_df: pandas.DataFrame,
                    inner_class: int = 2,
                    end_class: int = 3,
                    get_target_start_end: Callable[[str, str, Any], List[Tuple[int, int]]] = get_target_start_end_from_text,
-                   feature_mask_column: Optional[str] = None
-                   ) -> Union[numpy.ndarray, Tuple[numpy.ndarray, numpy.ndarray]]:
+                   feature_mask_column: Optional[str] = None,
+                   sparse: bool = False
+                   ) -> Union[numpy.ndarray, scipy.sparse.csr_matrix,
+                              Tuple[Union[numpy.ndarray, scipy.sparse.csr_matrix], numpy.ndarray]]:
     """
     Process a sample file to create feature and target data.
     :param sample_df: dataframe with at least 'sentence' column
@@ -48,13 +51,17 @@ def process_sample(sample_df: pandas.DataFrame,
     :param start_class:
     :param inner_class:
     :param end_class:
+    :param sparse: build scipy.sparse.csr_matrix feature data instead of the dense array
     :return: (feature_data, target_data) if build_target_data = True or just feature_data
     """
 
     # pre-allocate feature data approximately based on conservative sentence token count
     num_token_guess = sample_df.shape[0] * pre_alloc_multiple
     num_token = 0
-    feature_data = numpy.zeros((num_token_guess, len(s.feature_list)), dtype=numpy.int8)
+    if sparse:
+        feature_rows = []  # type: List[scipy.sparse.csr_matrix]
+    else:
+        feature_data = numpy.zeros((num_token_guess, len(s.feature_list)), dtype=numpy.int8)
     if build_target_data:
         target_data = numpy.zeros((num_token_guess,))
 
@@ -68,11 +75,18 @@ def process_sample(sample_df: pandas.DataFrame,
 
         # set feature rows
         feature_mask = row[feature_mask_column] if feature_mask_column else None
-        row_feature_data, row_tokens = s.get_feature_data(text, feature_mask=feature_mask)
+        row_feature_data, row_tokens = s.get_feature_data(text, feature_mask=feature_mask, sparse=sparse)
         row_num_tokens = row_feature_data.shape[0]
 
+        if sparse:
+            # sparse rows are stacked at the end, only the target data is pre-allocated
+            feature_rows.append(row_feature_data)
+            if build_target_data and num_token + row_num_tokens > target_data.shape[0]:
+                rescale_multiple = sample_df.shape[0] / float(row_id)
+                rescale_size = int(numpy.ceil(target_data.shape[0] * rescale_multiple))
+                target_data.resize((rescale_size,), refcheck=False)
         # check if we are within initial allocation
-        if num_token + row_num_tokens <= feature_data.shape[0]:
+        elif num_token + row_num_tokens <= feature_data.shape[0]:
             feature_data[num_token:(num_token + row_num_tokens), :] = row_feature_data
         else:
             # handle resize for both feature and target data if required
@@ -99,6 +113,9 @@ def process_sample(sample_df: pandas.DataFrame,
 
         num_token += row_num_tokens
 
+    if sparse:
+        feature_data = scipy.sparse.vstack(feature_rows, format='csr', dtype=numpy.int8) if feature_rows \
+            else scipy.sparse.csr_matrix((0, len(s.feature_list)), dtype=numpy.int8)
     if build_target_data:
         return feature_data[0:num_token], target_data[0:num_token]
     return feature_data[0:num_token]
@@ -0,0 +1,50 @@
+from unittest import TestCase
+import numpy as np
+
+from lexnlp.extract.ml.classifier.token_sequence_model import TokenSequenceClassifierModel
+from lexnlp.extract.ml.detector.artifact_detector import ArtifactDetector
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "1.6.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class CapitalizedTokenModel:
+    """
+    Marks tokens starting with a capital letter as "start" and the masked tokens as "inner" ones.
+    """
+    def __init__(self, upper_column: int, mask_column: int):
+        self.upper_column = upper_column
+        self.mask_column = mask_column
+        self.predict_calls = 0
+
+    def predict(self, feature_data) -> np.ndarray:
+        self.predict_calls += 1
+        if hasattr(feature_data, 'toarray'):
+            feature_data = feature_data.toarray()
+        upper, mask = feature_data[:, self.upper_column], feature_data[:, self.mask_column]
+        return np.where(upper > 0, 1, np.where(mask > 0, 2, 0))
+
+
+class TestArtifactDetector(TestCase):
+    def setUp(self):
+        self.detector = ArtifactDetector()
+        self.detector.model = TokenSequenceClassifierModel(letter_set=list('abcABC'), pre_window=1, post_window=1)
+        self.detector.model.model = CapitalizedTokenModel(
+            self.detector.model._feature_index_map['0_first_cat_Lu'],
+            self.detector.model._feature_index_map['mask'])
+
+    def test_predict_text_batch(self):
+        texts = ['a Bc c', '', 'Ab ca cc b', 'bb cc', 'C a']
+        masks = [None, None, [0, 0, 0, 1, 1, 0, 1, 1, 0, 0], None, None]
+        expected = [list(self.detector.predict_text(t, feature_mask=m)) for t, m in zip(texts, masks)]
+        self.assertEqual([[(2, 6)], [], [(0, 10)], [], [(0, 3)]], expected)
+        self.detector.model.model.predict_calls = 0
+        for sparse in (False, True):
+            phrases = self.detector.predict_text_batch(texts, feature_masks=masks, sparse=sparse)
+            self.assertEqual(expected, phrases)
+        self.assertEqual(2, self.detector.model.model.predict_calls)
+        self.assertEqual([], self.detector.predict_text_batch([]))
@@ -3,14 +3,16 @@ import os
 import shutil
 
 import pandas
-from typing import Tuple, List
+from typing import Dict, Tuple, List
 from zipfile import ZipFile
 
 from lexnlp.extract.common.annotations.definition_annotation import DefinitionAnnotation
+from lexnlp.extract.ml.classifier.base_token_sequence_classifier_model import BaseTokenSequenceClassifierModel
 from lexnlp.extract.ml.detector.detecting_settings import DetectingSettings
 from lexnlp.extract.ml.detector.phrase_constructor import PhraseConstructorSettings, PhraseConstructorMethod
 from lexnlp.extract.ml.en.definitions.definition_phrase_detector import DefinitionPhraseDetector
 from lexnlp.extract.ml.en.definitions.definition_term_detector import DefinitionTermDetector
+from lexnlp.utils.lazy_resources import register_resource
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -20,6 +22,41 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
+def load_packed_models(file_path: str) -> Dict[str, BaseTokenSequenceClassifierModel]:
+    """
+    Unpickle models packed by LayeredDefinitionDetector.train_on_formatted_data()
+    :return: {"definition.pickle": model, "term.pickle": model}
+    """
+    models = {}  # type: Dict[str, BaseTokenSequenceClassifierModel]
+    with ZipFile(file_path) as z:
+        for file_name in z.namelist():
+            if '/' in file_name or not file_name.endswith('.pickle'):
+                continue
+            if file_name not in ('definition.pickle', 'term.pickle'):
+                raise RuntimeError(f'Found unknown file "{file_name}" in packed model')
+            with z.open(file_name) as stream:
+                models[file_name] = BaseTokenSequenceClassifierModel.load_from_stream(stream)
+    return models
+
+
+def get_file_version(file_path: str) -> Tuple[int, int]:
+    file_stat = os.stat(file_path)
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def get_packed_models(file_path: str) -> Dict[str, BaseTokenSequenceClassifierModel]:
+    """
+    Same as load_packed_models() but the models are loaded once per file path
+    and then taken from the resource registry. The models are reloaded
+    if the file modification time or size has changed.
+    """
+    file_path = os.path.abspath(file_path)
+    resource = register_resource(f'en.layered_definition_models:{file_path}',
+                                 lambda: (get_file_version(file_path), load_packed_models(file_path)))
+    _version, models = resource.reload_if(lambda value: value[0] != get_file_version(file_path))
+    return models
+
+
 class LayeredDefinitionDetector:
     def __init__(self):
         # let the prase be <agrees to serve the Company in such capacity during the
@@ -40,49 +77,54 @@ class LayeredDefinitionDetector:
         """
         Loads archive with two model pickle files (model_definition,
         model_term)
+        The models are unpickled right from the archive and cached, so loading
+        the same (unchanged) file again costs nothing.
         """
-        file_folder = os.path.dirname(file_path)
-        temp_folder = os.path.join(file_folder, 'unpack_def_model_temp')
-        try:
-            shutil.rmtree(temp_folder)
-        # pylint: disable=bare-except
-        except:
-            pass
-        os.mkdir(temp_folder)
-        
-        with ZipFile(file_path) as z:
-            z.extractall(temp_folder)
-
-        model_files = [i for i in os.listdir(temp_folder) if i.endswith('.pickle')]
-        for file_name in model_files:
-            if file_name == 'definition.pickle':
-                self.model_definition.load(os.path.join(temp_folder, file_name))
-            elif file_name == 'term.pickle':
-                self.model_term.load(os.path.join(temp_folder, file_name))
-            else:
-                raise RuntimeError(f'Found unknown file "{file_name.filename}" in packed model')
-        shutil.rmtree(temp_folder)
+        models = get_packed_models(file_path)
+        if 'definition.pickle' in models:
+            self.model_definition.model = models['definition.pickle']
+        if 'term.pickle' in models:
+            self.model_term.model = models['term.pickle']
         self.initialized = True
 
     def get_annotations(self, sentence: str) -> List[DefinitionAnnotation]:
-        annotations = []  # type: List[DefinitionAnnotation]
+        return self.get_annotations_batch([sentence])[0]
+
+    def get_annotations_batch(self, sentences: List[str]) -> List[List[DefinitionAnnotation]]:
+        """
+        Find definitions in each of the sentences. Each model runs one prediction for
+        all the sentences, see ArtifactDetector.predict_text_batch().
+        :return: list of annotations for each of the sentences
+        """
         # we go from term to definition because term is a simplier object to locate
-        terms = list(self.model_term.predict_text(
-                sentence, join_settings=self.term_join_sets))
-        if not terms:
-            return annotations
+        sentence_terms = self.model_term.predict_text_batch(
+            sentences, join_settings=self.term_join_sets)
+        term_ids = [i for i, terms in enumerate(sentence_terms) if terms]
 
         # find definitions around the terms
         # "mask" suggests the underlying model where the term is located
-        feature_mask = [0] * len(sentence)
-        for term in terms:
-            for i in range(term[0], term[1]):
-                feature_mask[i] = 1
-
-        definitions = list(self.model_definition.predict_text(
-                    sentence, feature_mask=feature_mask,
-                    join_settings=self.definition_join_sets))
+        feature_masks = []  # type: List[List[int]]
+        for i in term_ids:
+            feature_mask = [0] * len(sentences[i])
+            for term in sentence_terms[i]:
+                for j in range(term[0], term[1]):
+                    feature_mask[j] = 1
+            feature_masks.append(feature_mask)
+
+        term_definitions = self.model_definition.predict_text_batch(
+            [sentences[i] for i in term_ids], feature_masks=feature_masks,
+            join_settings=self.definition_join_sets)
+
+        annotations = [[] for _ in sentences]  # type: List[List[DefinitionAnnotation]]
+        for i, definitions in zip(term_ids, term_definitions):
+            annotations[i] = self.build_annotations(sentences[i], sentence_terms[i], definitions)
+        return annotations
 
+    @staticmethod
+    def build_annotations(sentence: str,
+                          terms: List[Tuple[int, int]],
+                          definitions: List[Tuple[int, int]]) -> List[DefinitionAnnotation]:
+        annotations = []  # type: List[DefinitionAnnotation]
         # combine terms with surrounding definitions
         # measure distance between each tearm and each definition
         definition_distances = {}  # { term0: [0:d0, 1:d1, ...N:dN], term1: ... }
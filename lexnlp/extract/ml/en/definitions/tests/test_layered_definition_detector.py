@@ -1,9 +1,19 @@
 import os
+import pickle
+import tempfile
+import threading
+import time
+from typing import List
 from unittest import TestCase
+from zipfile import ZipFile
 
-from lexnlp.extract.ml.en.definitions.layered_definition_detector import LayeredDefinitionDetector
+from lexnlp.extract.common.annotations.definition_annotation import DefinitionAnnotation
+from lexnlp.extract.ml.classifier.token_sequence_model import TokenSequenceClassifierModel
+from lexnlp.extract.ml.en.definitions.layered_definition_detector import LayeredDefinitionDetector, \
+    get_packed_models
 from lexnlp.extract.ml.environment import ENV_EN_DATA_DIRECTORY
 from lexnlp.extract.common.base_path import lexnlp_test_path
+from lexnlp.utils.lazy_resources import RESOURCES
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -38,3 +48,104 @@ class TestLayeredDefinitionDetector(TestCase):
         self.assertGreater(len(ants), 0)
         ant_def = text[ants[0].coords[0]: ants[0].coords[1]]
         self.assertGreater(len(ant_def), 0)
+
+    def test_parse_batch(self):
+        model = LayeredDefinitionDetector()
+        model.load_compressed(TRAINED_MODEL_PATH)
+        sentences = [
+            'The Trustee shall establish a separate fund designated as the "Redemption Fund".',
+            '',
+            'This Agreement (the "Agreement") is made by and between the parties.',
+            'No definitions here.']
+        batch_ants = model.get_annotations_batch(sentences)
+        self.assertEqual(len(sentences), len(batch_ants))
+        for sentence, ants in zip(sentences, batch_ants):
+            expected = [(a.coords, a.name) for a in self.predict_sentence(model, sentence)]
+            self.assertEqual(expected, [(a.coords, a.name) for a in ants])
+
+    @staticmethod
+    def predict_sentence(model: LayeredDefinitionDetector,
+                         sentence: str) -> List[DefinitionAnnotation]:
+        # one ArtifactDetector.predict_text() call per model and sentence
+        if not sentence:
+            return []
+        terms = list(model.model_term.predict_text(sentence, join_settings=model.term_join_sets))
+        if not terms:
+            return []
+        feature_mask = [0] * len(sentence)
+        for start, end in terms:
+            for i in range(start, end):
+                feature_mask[i] = 1
+        definitions = list(model.model_definition.predict_text(
+            sentence, feature_mask=feature_mask, join_settings=model.definition_join_sets))
+        return LayeredDefinitionDetector.build_annotations(sentence, terms, definitions)
+
+    def test_load_compressed_cached(self):
+        with tempfile.TemporaryDirectory() as temp_folder:
+            file_path = os.path.join(temp_folder, 'model.pickle.gzip')
+            self.write_packed_models(file_path, 1)
+
+            model = LayeredDefinitionDetector()
+            model.load_compressed(file_path)
+            self.assertTrue(model.initialized)
+            self.assertEqual(1, model.model_term.model.pre_window)
+            self.assertEqual(0, model.model_definition.model.pre_window)
+            # nothing is extracted next to the archive
+            self.assertEqual(['model.pickle.gzip'], os.listdir(temp_folder))
+
+            other_model = LayeredDefinitionDetector()
+            other_model.load_compressed(file_path)
+            self.assertIs(model.model_term.model, other_model.model_term.model)
+            self.assertIs(model.model_definition.model, other_model.model_definition.model)
+
+            # the rewritten file is loaded again under the same resource name
+            self.write_packed_models(file_path, 2)
+            other_model = LayeredDefinitionDetector()
+            other_model.load_compressed(file_path)
+            self.assertEqual(2, other_model.model_term.model.pre_window)
+            self.assertEqual(1, len([n for n in RESOURCES.resources if n.endswith(file_path)]))
+
+            bad_path = os.path.join(temp_folder, 'bad.pickle.gzip')
+            with ZipFile(bad_path, 'w') as z:
+                z.writestr('other.pickle', pickle.dumps(None))
+            with self.assertRaises(RuntimeError):
+                LayeredDefinitionDetector().load_compressed(bad_path)
+
+    def test_load_compressed_cached_threads(self):
+        with tempfile.TemporaryDirectory() as temp_folder:
+            file_path = os.path.join(temp_folder, 'model.pickle.gzip')
+            self.write_packed_models(file_path, 0)
+            errors = []
+            stop = threading.Event()
+
+            def load_models():
+                try:
+                    while not stop.is_set():
+                        self.assertIn(get_packed_models(file_path)['term.pickle'].pre_window, range(6))
+                except Exception as e:  # pylint:disable=broad-except
+                    errors.append(e)
+
+            threads = [threading.Thread(target=load_models) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for pre_window in range(1, 6):
+                self.write_packed_models(file_path, pre_window)
+                # the models may pickle to the same size, so the modification time tells the versions apart
+                os.utime(file_path, ns=(pre_window * 10 ** 9, pre_window * 10 ** 9))
+                time.sleep(0.05)
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual([], errors)
+            self.assertEqual(5, get_packed_models(file_path)['term.pickle'].pre_window)
+
+    @staticmethod
+    def write_packed_models(file_path: str, term_pre_window: int) -> None:
+        # the archive is replaced at once, so it is never read half-written
+        temp_path = file_path + '.tmp'
+        with ZipFile(temp_path, 'w') as z:
+            z.writestr('term.pickle', pickle.dumps(
+                TokenSequenceClassifierModel(pre_window=term_pre_window, post_window=1)))
+            z.writestr('definition.pickle', pickle.dumps(TokenSequenceClassifierModel()))
+        os.replace(temp_path, file_path)
@@ -0,0 +1,130 @@
+"""Shared per-document NLP data for English.
+
+This module implements LexDocument - a container that lazily calculates and caches
+sentence spans, tokens, token spans and POS tags of a text, so that several extractors
+processing the same text split it on sentences and POS-tag it only once.
+
+Todo:
+"""
+
+# Imports
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+import nltk
+
+from lexnlp.nlp.en.segments.sentences import get_sentence_span_list
+from lexnlp.nlp.en.tokens import get_token_list, get_token_spans
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "1.6.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class LexDocument:
+    """
+    Sentences, tokens and POS tags of a text, each calculated once - on demand.
+
+    Extractors accept an optional "document" argument:
+
+        document = LexDocument(text)
+        persons = list(get_persons(text, document=document))
+        amounts = list(get_amounts(text, document=document))
+
+    POS tags are cached by token sequence, so an extractor that tokenizes
+    the text in its own way still reuses the tags of the same tokens.
+    """
+
+    def __init__(self,
+                 text: str,
+                 pos_cache: Optional[Dict[Tuple[str, ...], List[Tuple[str, str]]]] = None):
+        """
+        :param text: document's text
+        :param pos_cache: POS tags cache to share with another document
+        """
+        self.text = text
+        self.pos_cache = pos_cache if pos_cache is not None else {}
+        self._sentence_spans = None  # type: Optional[List[Tuple[int, int, str]]]
+        self._sentence_starts = None  # type: Optional[List[int]]
+        self._sentence_tokens = {}  # type: Dict[int, List[str]]
+        self._sentence_token_spans = {}  # type: Dict[int, List[Tuple[int, int]]]
+
+    @classmethod
+    def get(cls, text: str, document: Optional['LexDocument'] = None) -> 'LexDocument':
+        """
+        Get the document for the text. If the document provided is built for another text
+        (e.g., for the whole text while the text is a sentence) a new document is created
+        that shares POS tags cache with the document provided.
+        :param text: text to process
+        :param document: document passed to an extractor or None
+        :return: LexDocument for the text
+        """
+        if document is None:
+            return cls(text)
+        if document.text == text:
+            return document
+        return cls(text, pos_cache=document.pos_cache)
+
+    @property
+    def sentence_spans(self) -> List[Tuple[int, int, str]]:
+        """
+        (start, end, sentence) of the text's sentences - as get_sentence_span_list() returns.
+        """
+        if self._sentence_spans is None:
+            self._sentence_spans = get_sentence_span_list(self.text)
+            self._sentence_starts = [s for s, _, _ in self._sentence_spans]
+        return self._sentence_spans
+
+    @property
+    def sentences(self) -> List[str]:
+        return [s for _, _, s in self.sentence_spans]
+
+    def get_sentence_index(self, pos: int) -> int:
+        """
+        Get index of the sentence that contains the pos or of the last sentence
+        before the pos, -1 if there is no sentence before the pos.
+        """
+        _ = self.sentence_spans
+        return bisect.bisect_right(self._sentence_starts, pos) - 1
+
+    def get_sentence_tokens(self, index: int) -> List[str]:
+        """
+        Tokens of the sentence - as get_token_list() returns.
+        """
+        tokens = self._sentence_tokens.get(index)
+        if tokens is None:
+            tokens = get_token_list(self.sentence_spans[index][2])
+            self._sentence_tokens[index] = tokens
+        return tokens
+
+    def get_sentence_token_spans(self, index: int) -> List[Tuple[int, int]]:
+        """
+        (start, end) of the sentence's tokens in the document's text.
+        """
+        spans = self._sentence_token_spans.get(index)
+        if spans is None:
+            start, _, sentence = self.sentence_spans[index]
+            spans = [(s + start, e + start) for s, e in
+                     get_token_spans(sentence, self.get_sentence_tokens(index))]
+            self._sentence_token_spans[index] = spans
+        return spans
+
+    def get_sentence_pos(self, index: int) -> List[Tuple[str, str]]:
+        """
+        POS-tagged tokens of the sentence.
+        """
+        return self.pos_tag(self.get_sentence_tokens(index))
+
+    def pos_tag(self, tokens: List[str]) -> List[Tuple[str, str]]:
+        """
+        POS-tag the tokens (nltk.pos_tag) or take the tags from the cache.
+        """
+        key = tuple(tokens)
+        tagged = self.pos_cache.get(key)
+        if tagged is None:
+            tagged = nltk.pos_tag(tokens)
+            self.pos_cache[key] = tagged
+        return tagged
@@ -12,14 +12,19 @@ import os
 import string
 import unicodedata
 
-from typing import Generator
+from typing import Generator, List, Optional, Tuple
 
 # Packages
+import numpy
 import pandas
 from sklearn.externals import joblib
 
 # Project imports
-from lexnlp.nlp.en.segments.utils import build_document_distribution
+from lexnlp.nlp.en.segments.utils import build_line_window_features, count_line_categories, \
+    count_line_characters, get_line_edge_char_features, get_line_features, get_line_feature_cache, \
+    get_line_shape_features, get_lines_span, get_non_space_char_offsets, strip_span, LineFeatureCache, \
+    LINE_CATEGORY_FEATURES, LINE_EDGE_CHAR_FEATURES
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -32,8 +37,10 @@ __email__ = "support@contraxsuite.com"
 # Setup module path
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load segmenters
-PAGE_SEGMENTER_MODEL = joblib.load(os.path.join(MODULE_PATH, "./page_segmenter.pickle"))
+# Segmenter is loaded on first use
+PAGE_SEGMENTER = register_resource(
+    'en.page_segmenter', lambda: joblib.load(os.path.join(MODULE_PATH, "./page_segmenter.pickle")))
+__getattr__ = lazy_module_attributes(__name__, {'PAGE_SEGMENTER_MODEL': PAGE_SEGMENTER})
 
 
 def build_page_break_features(lines, line_id, line_window_pre, line_window_post, characters=string.printable,
@@ -100,47 +107,104 @@ def build_page_break_features(lines, line_id, line_window_pre, line_window_post,
     return feature_vector
 
 
-def get_pages(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+def build_page_break_feature_matrix(lines, line_window_pre, line_window_post, characters=string.printable,
+                                    include_doc=None, line_cache: Optional[LineFeatureCache] = None) \
+        -> Tuple[numpy.ndarray, List[str]]:
     """
-    Get pages from text.
-    :param text:
+    Build feature vectors for all the lines at once.
+    Gives the same columns as build_page_break_features() called for each line and put into
+    pandas.DataFrame(...).fillna(-1).
+    :param lines:
+    :param line_window_pre:
+    :param line_window_post:
+    :param characters:
+    :param include_doc:
+    :param line_cache: LineFeatureCache to take the per-line features from
+    :return: (feature matrix, column names)
+    """
+    line_lengths = get_line_features(lines, get_line_shape_features, line_cache=line_cache)[:, :1]
+    line_features = numpy.column_stack([line_lengths,
+                                        get_line_features(lines, count_line_categories, line_cache=line_cache)])
+    line_feature_names = ["line_len_{0}"] + [name for name, _ in LINE_CATEGORY_FEATURES]
+
+    # Simple checks
+    checks = [("page" in line, "PAGE" in line, "Page" in line,
+               line.strip().lower().startswith("page"), line.strip().lower().startswith("pg")) for line in lines]
+    extra_features = numpy.column_stack([numpy.array(checks, dtype=bool).reshape(len(lines), 5),
+                                         get_line_features(lines, get_line_edge_char_features, line_cache=line_cache),
+                                         get_line_features(lines, count_line_characters, characters,
+                                                           line_cache=line_cache)])
+    extra_feature_names = ["page", "PAGE", "Page", "sw_page", "sw_pg"] + list(LINE_EDGE_CHAR_FEATURES) + \
+                          ["char_{0}".format(character) for character in characters]
+
+    return build_line_window_features(line_features, line_feature_names, line_window_pre, line_window_post,
+                                      extra_features, extra_feature_names, include_doc)
+
+
+def get_page_breaks(line_cache: LineFeatureCache, window_pre=3, window_post=3, score_threshold=0.5) -> List[int]:
+    """
+    Get indexes of the lines predicted to start a page.
+    :param line_cache:
     :param window_pre:
     :param window_post:
     :param score_threshold:
     :return:
     """
-
     # Get document character distribution
-    doc_distribution = build_document_distribution(text)
-    lines = text.splitlines()
-    test_feature_data = []
-    for line_id in range(len(lines)):
-        test_feature_data.append(
-            build_page_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
+    doc_distribution = line_cache.get_document_distribution()
+    test_feature_data, _ = build_page_break_feature_matrix(line_cache.lines, window_pre, window_post,
+                                                           include_doc=doc_distribution, line_cache=line_cache)
 
     # Predict page breaks
-    test_feature_df = pandas.DataFrame(test_feature_data).fillna(-1)
-    test_predicted_lines = PAGE_SEGMENTER_MODEL.predict_proba(test_feature_df)
+    test_predicted_lines = PAGE_SEGMENTER.get().predict_proba(test_feature_data)
     predicted_df = pandas.DataFrame(test_predicted_lines, columns=["prob_false", "prob_true"])
-    page_breaks = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
-
-    if len(page_breaks) > 0:
-        # Get first break
-        pos0 = 0
-        pos1 = page_breaks[0]
-        yield "\n".join(lines[pos0:pos1])
-
-        # Iterate through paragraph breaks
-        for i in range(len(page_breaks) - 1):
-            # Get breaks
-            pos0 = page_breaks[i]
-            pos1 = page_breaks[i + 1]
-            # Get text
-            page = "\n".join(lines[pos0:pos1])
-            if len(page.strip()) > 1:
-                yield page
-
-        # Yield final page
-        page = "\n".join(lines[page_breaks[-1]:])
-        if len(page.strip()) > 1:
-            yield page.strip()
+    return predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
+
+
+def get_page_spans(text, window_pre=3, window_post=3, score_threshold=0.5,
+                   line_cache: Optional[LineFeatureCache] = None) -> Generator[Tuple[int, int], None, None]:
+    """
+    Get (start, end) of the pages get_pages() returns.
+    The spans are taken from the line offsets, so text[start:end] keeps the original line breaks.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :param line_cache: LineFeatureCache of the text shared with the other segmenters
+    :return:
+    """
+    line_cache = get_line_feature_cache(text, line_cache)
+    page_breaks = get_page_breaks(line_cache, window_pre, window_post, score_threshold)
+    if len(page_breaks) == 0:
+        return
+
+    line_spans = line_cache.get_line_spans()
+    non_space_offsets = get_line_features(line_cache.lines, get_non_space_char_offsets, line_cache=line_cache)
+
+    # Get first break
+    yield get_lines_span(text, line_spans, 0, page_breaks[0])
+
+    # Iterate through page breaks
+    for pos0, pos1 in zip(page_breaks, page_breaks[1:]):
+        if non_space_offsets[pos1] - non_space_offsets[pos0] > 1:
+            yield get_lines_span(text, line_spans, pos0, pos1)
+
+    # Yield final page
+    pos0, pos1 = page_breaks[-1], len(line_spans)
+    if non_space_offsets[pos1] - non_space_offsets[pos0] > 1:
+        yield strip_span(text, *get_lines_span(text, line_spans, pos0, pos1))
+
+
+def get_pages(text, window_pre=3, window_post=3, score_threshold=0.5,
+              line_cache: Optional[LineFeatureCache] = None) -> Generator:
+    """
+    Get pages from text.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :param line_cache: LineFeatureCache of the text shared with the other segmenters
+    :return:
+    """
+    for start, end in get_page_spans(text, window_pre, window_post, score_threshold, line_cache=line_cache):
+        yield text[start:end]
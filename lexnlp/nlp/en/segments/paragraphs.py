@@ -9,16 +9,20 @@ Todo:
 
 import os
 # Imports
-import re
 import string
 import unicodedata
 from typing import Generator, List, Tuple, Union, Optional
 
 # Packages
+import numpy
 import pandas
 from sklearn.externals import joblib
 
-from lexnlp.nlp.en.segments.utils import build_document_line_distribution
+from lexnlp.nlp.en.segments.utils import build_line_window_features, count_line_categories, \
+    count_line_characters, get_line_edge_char_features, get_line_features, get_line_feature_cache, \
+    get_line_shape_features, splitlines_with_spans, LineFeatureCache, LINE_CATEGORY_FEATURES, \
+    LINE_EDGE_CHAR_FEATURES, LINE_SHAPE_FEATURES
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -31,8 +35,10 @@ __email__ = "support@contraxsuite.com"
 # Setup module path
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load segmenters
-PARAGRAPH_SEGMENTER_MODEL = joblib.load(os.path.join(MODULE_PATH, "./paragraph_segmenter.pickle"))
+# Segmenter is loaded on first use
+PARAGRAPH_SEGMENTER = register_resource(
+    'en.paragraph_segmenter', lambda: joblib.load(os.path.join(MODULE_PATH, "./paragraph_segmenter.pickle")))
+__getattr__ = lazy_module_attributes(__name__, {'PARAGRAPH_SEGMENTER_MODEL': PARAGRAPH_SEGMENTER})
 
 
 def build_paragraph_break_features(lines, line_id, line_window_pre, line_window_post, characters=string.printable,
@@ -98,25 +104,33 @@ def build_paragraph_break_features(lines, line_id, line_window_pre, line_window_
     return feature_vector
 
 
-RE_NEW_LINE = re.compile(r'(?P<line>[^\r\n]*)((\r\n)|(\n\r)|\n|\r)')
+def build_paragraph_break_feature_matrix(lines, line_window_pre, line_window_post, characters=string.printable,
+                                         include_doc=None, line_cache: Optional[LineFeatureCache] = None) \
+        -> Tuple[numpy.ndarray, List[str]]:
+    """
+    Build feature vectors for all the lines at once.
+    Gives the same columns as build_paragraph_break_features() called for each line and put into
+    pandas.DataFrame(...).fillna(-1).
 
+    :param lines:
+    :param line_window_pre:
+    :param line_window_post:
+    :param characters:
+    :param include_doc:
+    :param line_cache: LineFeatureCache to take the per-line features from
+    :return: (feature matrix, column names)
+    """
+    line_features = numpy.column_stack([get_line_features(lines, get_line_shape_features, line_cache=line_cache),
+                                        get_line_features(lines, count_line_categories, line_cache=line_cache)])
+    line_feature_names = list(LINE_SHAPE_FEATURES) + [name for name, _ in LINE_CATEGORY_FEATURES]
 
-def splitlines_with_spans(text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
-    lines = list()  # type: List[str]
-    spans = list()  # type: List[Tuple[int, int]]
-    if text is None:
-        return lines, spans
-    last_line_end = -1
-    for m in RE_NEW_LINE.finditer(text):
-        line = m.group('line')
-        span = m.span()
-        lines.append(line)
-        spans.append(span)
-        last_line_end = span[1]
-    if last_line_end < len(text):
-        lines.append(text[last_line_end:len(text)])
-        spans.append((last_line_end, len(text)))
-    return lines, spans
+    extra_features = numpy.column_stack([get_line_features(lines, get_line_edge_char_features, line_cache=line_cache),
+                                         get_line_features(lines, count_line_characters, characters,
+                                                           line_cache=line_cache)])
+    extra_feature_names = list(LINE_EDGE_CHAR_FEATURES) + ["char_{0}".format(character) for character in characters]
+
+    return build_line_window_features(line_features, line_feature_names, line_window_pre, line_window_post,
+                                      extra_features, extra_feature_names, include_doc)
 
 
 def _maybe_paragraph(pos0: int, pos1: Optional[int], text: str, line_spans: List[Tuple[int, int]], return_spans: bool) \
@@ -134,23 +148,22 @@ def _maybe_paragraph(pos0: int, pos1: Optional[int], text: str, line_spans: List
 
 
 def get_paragraphs(text: str, window_pre=3, window_post=3,
-                   score_threshold=0.5, return_spans: bool = False) -> Generator:
+                   score_threshold=0.5, return_spans: bool = False,
+                   line_cache: Optional[LineFeatureCache] = None) -> Generator:
     """
     Get paragraphs.
     """
     # Get document character distribution
-    doc_distribution = build_document_line_distribution(text)
-    lines, line_spans = splitlines_with_spans(text)
-    feature_data = []
-
-    for line_id in range(len(lines)):
-        feature_data.append(
-            build_paragraph_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
+    line_cache = get_line_feature_cache(text, line_cache)
+    doc_distribution = line_cache.get_document_line_distribution()
+    lines, line_spans = line_cache.get_lines_with_spans()
+    feature_data, _ = build_paragraph_break_feature_matrix(lines, window_pre, window_post,
+                                                           include_doc=doc_distribution, line_cache=line_cache)
 
     # Predict page breaks
-    feature_df = pandas.DataFrame(feature_data).fillna(-1).astype(int)
+    feature_data = feature_data.astype(int)
     try:
-        predicted_lines = PARAGRAPH_SEGMENTER_MODEL.predict_proba(feature_df)
+        predicted_lines = PARAGRAPH_SEGMENTER.get().predict_proba(feature_data)
         predicted_df = pandas.DataFrame(predicted_lines, columns=["prob_false", "prob_true"])
         paragraph_breaks = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
 
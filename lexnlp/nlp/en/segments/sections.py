@@ -12,17 +12,22 @@ import os
 import string
 import unicodedata
 
-from typing import Generator
+from typing import Generator, List, Optional, Tuple
 
 # Packages
+import numpy
 import pandas
 import regex as re
 from sklearn.externals import joblib
 
 # Project imports
-from lexnlp.nlp.en.segments.utils import build_document_line_distribution
+from lexnlp.nlp.en.segments.utils import build_line_window_features, count_line_categories, \
+    count_line_characters, get_line_edge_char_features, get_line_features, get_line_feature_cache, \
+    get_line_shape_features, get_lines_span, get_non_space_char_offsets, LineFeatureCache, LINE_CATEGORY_FEATURES, \
+    LINE_EDGE_CHAR_FEATURES, LINE_SHAPE_FEATURES
 from lexnlp.utils.map import Map
 from lexnlp.utils.decorators import safe_failure
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -35,8 +40,10 @@ __email__ = "support@contraxsuite.com"
 # Setup module path
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load segmenters
-SECTION_SEGMENTER_MODEL = joblib.load(os.path.join(MODULE_PATH, "./section_segmenter.pickle"))
+# Segmenter is loaded on first use
+SECTION_SEGMENTER = register_resource(
+    'en.section_segmenter', lambda: joblib.load(os.path.join(MODULE_PATH, "./section_segmenter.pickle")))
+__getattr__ = lazy_module_attributes(__name__, {'SECTION_SEGMENTER_MODEL': SECTION_SEGMENTER})
 
 
 def build_section_break_features(lines, line_id, line_window_pre, line_window_post, characters=string.printable,
@@ -110,54 +117,104 @@ def build_section_break_features(lines, line_id, line_window_pre, line_window_po
     return feature_vector
 
 
-@safe_failure
-def get_sections(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+def build_section_break_feature_matrix(lines, line_window_pre, line_window_post, characters=string.printable,
+                                       include_doc=None, line_cache: Optional[LineFeatureCache] = None) \
+        -> Tuple[numpy.ndarray, List[str]]:
     """
-    Get sections from text.
-    NLP-based detection of sections.
-    :param text:
+    Build feature vectors for all the lines at once.
+    Gives the same columns as build_section_break_features() called for each line and put into
+    pandas.DataFrame(...).fillna(-1).
+
+    :param lines:
+    :param line_window_pre:
+    :param line_window_post:
+    :param characters:
+    :param include_doc:
+    :param line_cache: LineFeatureCache to take the per-line features from
+    :return: (feature matrix, column names)
+    """
+    line_features = numpy.column_stack([get_line_features(lines, get_line_shape_features, line_cache=line_cache),
+                                        get_line_features(lines, count_line_categories, line_cache=line_cache)])
+    line_feature_names = list(LINE_SHAPE_FEATURES) + [name for name, _ in LINE_CATEGORY_FEATURES]
+
+    # Simple checks
+    checks = [("section" in line, "SECTION" in line, "Section" in line,
+               "article" in line, "ARTICLE" in line, "Article" in line,
+               line.strip().lower().startswith("section"), line.strip().lower().startswith("article"))
+              for line in lines]
+    extra_features = numpy.column_stack([numpy.array(checks, dtype=bool).reshape(len(lines), 8),
+                                         get_line_features(lines, get_line_edge_char_features, line_cache=line_cache),
+                                         get_line_features(lines, count_line_characters, characters,
+                                                           line_cache=line_cache)])
+    extra_feature_names = ["section", "SECTION", "Section", "article", "ARTICLE", "Article",
+                           "sw_section", "sw_article"] + list(LINE_EDGE_CHAR_FEATURES) + \
+                          ["char_{0}".format(character) for character in characters]
+
+    return build_line_window_features(line_features, line_feature_names, line_window_pre, line_window_post,
+                                      extra_features, extra_feature_names, include_doc)
+
+
+def get_section_breaks(line_cache: LineFeatureCache, window_pre=3, window_post=3,
+                       score_threshold=0.5) -> List[int]:
+    """
+    Get indexes of the lines predicted to start a section.
+    :param line_cache:
     :param window_pre:
     :param window_post:
     :param score_threshold:
     :return:
     """
-
     # Get document character distribution
-    doc_distribution = build_document_line_distribution(text)
-    lines = text.splitlines()
-    test_feature_data = []
-    for line_id in range(len(lines)):
-        test_feature_data.append(
-            build_section_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
+    doc_distribution = line_cache.get_document_line_distribution()
+    test_feature_data, _ = build_section_break_feature_matrix(line_cache.lines, window_pre, window_post,
+                                                              include_doc=doc_distribution, line_cache=line_cache)
 
     # Predict page breaks
-    test_feature_df = pandas.DataFrame(test_feature_data).fillna(-1)
-    test_predicted_lines = SECTION_SEGMENTER_MODEL.predict_proba(test_feature_df)
+    test_predicted_lines = SECTION_SEGMENTER.get().predict_proba(test_feature_data)
     predicted_df = pandas.DataFrame(test_predicted_lines, columns=["prob_false", "prob_true"])
-    section_breaks = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
-
-    if len(section_breaks) > 0:
-        # Get first break
-        pos0 = 0
-        pos1 = section_breaks[0]
-        section = "\n".join(lines[pos0:pos1])
-        if len(section.strip()) > 0:
-            yield section
-
-        # Iterate through section breaks
-        for i in range(len(section_breaks) - 1):
-            # Get breaks
-            pos0 = section_breaks[i]
-            pos1 = section_breaks[i + 1]
-            # Get text
-            section = "\n".join(lines[pos0:pos1])
-            if len(section.strip()) > 0:
-                yield section
-
-        # Yield final section
-        section = "\n".join(lines[section_breaks[-1]:])
-        if len(section.strip()) > 0:
-            yield section
+    return predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
+
+
+@safe_failure
+def get_ml_section_spans(text, window_pre=3, window_post=3, score_threshold=0.5,
+                         line_cache: Optional[LineFeatureCache] = None) -> Generator[Tuple[int, int], None, None]:
+    """
+    Get (start, end) of the sections get_sections() returns.
+    The spans are taken from the line offsets, so text[start:end] keeps the original line breaks.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :param line_cache: LineFeatureCache of the text shared with the other segmenters
+    :return:
+    """
+    line_cache = get_line_feature_cache(text, line_cache)
+    section_breaks = get_section_breaks(line_cache, window_pre, window_post, score_threshold)
+    if len(section_breaks) == 0:
+        return
+
+    line_spans = line_cache.get_line_spans()
+    non_space_offsets = get_line_features(line_cache.lines, get_non_space_char_offsets, line_cache=line_cache)
+    for pos0, pos1 in zip([0] + section_breaks, section_breaks + [len(line_spans)]):
+        if non_space_offsets[pos1] - non_space_offsets[pos0] > 0:
+            yield get_lines_span(text, line_spans, pos0, pos1)
+
+
+@safe_failure
+def get_sections(text, window_pre=3, window_post=3, score_threshold=0.5,
+                 line_cache: Optional[LineFeatureCache] = None) -> Generator:
+    """
+    Get sections from text.
+    NLP-based detection of sections.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :param line_cache: LineFeatureCache of the text shared with the other segmenters
+    :return:
+    """
+    for start, end in get_ml_section_spans(text, window_pre, window_post, score_threshold, line_cache=line_cache):
+        yield text[start:end]
 
 
 SECTION_TITLE_PTN = r"""
@@ -180,23 +237,34 @@ SECTION_TITLE_RE2 = re.compile(r'\A' + SECTION_TITLE_PTN, re.M | re.X)
 
 
 @safe_failure
-def get_sections_re(text) -> Generator:
+def get_re_section_spans(text) -> Generator[Tuple[int, int], None, None]:
     """
-    Get sections from text.
-    Regex-based detection of text sections.
+    Get (start, end) of the sections get_sections_re() returns.
     :param text: str - source full text
-    :return: generator of str
+    :return: generator of (start, end)
     """
     prev_start = None
     for match in SECTION_TITLE_RE1.finditer(text):
         start = match.start()
         if prev_start:
-            yield text[prev_start:start]
+            yield prev_start, start
         elif start != 0:
-            yield text[0:start]
+            yield 0, start
         prev_start = start
     if prev_start:
-        yield text[prev_start:]
+        yield prev_start, len(text)
+
+
+@safe_failure
+def get_sections_re(text) -> Generator:
+    """
+    Get sections from text.
+    Regex-based detection of text sections.
+    :param text: str - source full text
+    :return: generator of str
+    """
+    for start, end in get_re_section_spans(text):
+        yield text[start:end]
 
 
 @safe_failure
@@ -214,14 +282,11 @@ def get_section_spans(text, use_ml=True,
     :return: Generator of dicts
     """
 
-    _start_index_counter = 0
     level_parser = SectionLevelParser(sections_hierarchy=sections_hierarchy)
-    sections_detector = get_sections if use_ml else get_sections_re
+    sections_detector = get_ml_section_spans if use_ml else get_re_section_spans
 
-    for section in sections_detector(text):
-        start_index = _start_index_counter + text[_start_index_counter:].index(section)
-        end_index = start_index + len(section)
-        _start_index_counter = end_index
+    for start_index, end_index in sections_detector(text):
+        section = text[start_index:end_index]
         try:
             title = SECTION_TITLE_RE2.findall(section)[0]
             title_start = start_index + section.index(title)
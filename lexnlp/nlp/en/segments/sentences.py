@@ -12,13 +12,15 @@ Todo:
 # Imports
 import os
 import re
-from typing import Tuple, List, Generator, Any, Union
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Tuple, List, Generator, Any, Optional, Union
 
 # Packages
 from nltk.tokenize.punkt import PunktTrainer, PunktSentenceTokenizer
 from sklearn.externals import joblib
 
 from lexnlp.extract.en.en_language_tokens import EnLanguageTokens
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -31,12 +33,18 @@ __email__ = "support@contraxsuite.com"
 # Setup module path
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load segmenters
-SENTENCE_SEGMENTER_MODEL = joblib \
-    .load(os.path.join(MODULE_PATH, "./sentence_segmenter.pickle"))  # type: PunktSentenceTokenizer
-extra_abbreviations = [a.rstrip('.') for a in EnLanguageTokens.abbreviations]
-SENTENCE_SEGMENTER_MODEL._params.abbrev_types.update(extra_abbreviations)
-SENTENCE_SEGMENTER_MODEL._params.abbrev_types.update(['no', 'l'])
+
+def _load_sentence_segmenter() -> PunktSentenceTokenizer:
+    model = joblib.load(os.path.join(MODULE_PATH, "./sentence_segmenter.pickle"))  # type: PunktSentenceTokenizer
+    extra_abbreviations = [a.rstrip('.') for a in EnLanguageTokens.abbreviations]
+    model._params.abbrev_types.update(extra_abbreviations)
+    model._params.abbrev_types.update(['no', 'l'])
+    return model
+
+
+# Segmenter is loaded on first use
+SENTENCE_SEGMENTER = register_resource('en.sentence_segmenter', _load_sentence_segmenter)
+__getattr__ = lazy_module_attributes(__name__, {'SENTENCE_SEGMENTER_MODEL': SENTENCE_SEGMENTER})
 
 
 PRE_PROCESS_TEXT_REMOVE = re.compile(
@@ -65,6 +73,16 @@ NOT_SENTENCES = re.compile(
 
 STRIP_GROUP = re.compile(r'^\s*(\S.*?)\s*$', re.DOTALL)
 
+# Blank lines and page breaks - the text is cut there to be split into sentences in parallel
+SAFE_TEXT_CUTS = re.compile(r'\n[ \t]*\n|\f')
+
+# Texts are cut into chunks of about this size to be split into sentences in parallel
+PARALLEL_CHUNK_SIZE = 200000
+
+# A chunk also takes this much of the next chunk's text, so the sentences
+# found by both of them can be matched
+PARALLEL_CHUNK_OVERLAP = 20000
+
 
 # are used in normalize_text for better splitting text on sentences
 PRETOKENIZE_REPLACEMENTS = [('“', '"'), ('”', '"')]
@@ -149,12 +167,110 @@ def get_sentence_span(text: str) -> Generator[Tuple[int, int, str], Any, Any]:
     in the text.
     """
     text_unified = normalize_text(text)
-    for span in SENTENCE_SEGMENTER_MODEL.span_tokenize(text_unified, realign_boundaries=True):
+    for span in SENTENCE_SEGMENTER.get().span_tokenize(text_unified, realign_boundaries=True):
         for tspan in post_process_sentence(text, span):
             subst = text[tspan[0]:tspan[1]]  # we take fragments from original text
             yield (tspan[0], tspan[1], subst)
 
 
+def get_chunk_sentence_spans(chunk: str, offset: int) -> List[Tuple[int, int]]:
+    """
+    Get (start, end) spans of the sentences of the text chunk starting at the given offset.
+    Is called in the worker processes by get_sentence_span_parallel().
+    """
+    return [(start + offset, end + offset) for start, end, _ in get_sentence_span(chunk)]
+
+
+def find_safe_text_cut(text: str, pos: int) -> int:
+    """
+    Get the position after the first blank line or page break at or after pos.
+    """
+    m = SAFE_TEXT_CUTS.search(text, pos)
+    return m.end() if m else len(text)
+
+
+def get_parallel_chunks(text: str,
+                        chunk_size: int = PARALLEL_CHUNK_SIZE,
+                        overlap: int = PARALLEL_CHUNK_OVERLAP) -> List[Tuple[int, int]]:
+    """
+    Cut the text into (start, end) chunks at blank lines and page breaks.
+    Each chunk but the last one runs at least <overlap> characters into the next chunk.
+    """
+    starts = [0]
+    while True:
+        start = find_safe_text_cut(text, starts[-1] + chunk_size)
+        if start >= len(text):
+            break
+        starts.append(start)
+    ends = [find_safe_text_cut(text, start + overlap) for start in starts[1:]] + [len(text)]
+    return list(zip(starts, ends))
+
+
+def join_chunk_sentence_spans(chunks: List[Tuple[int, int]],
+                              chunk_spans: List[List[Tuple[int, int]]]) -> Optional[List[Tuple[int, int]]]:
+    """
+    Join sentence spans found in the overlapping chunks.
+    Spans of a chunk are taken up to the first two sentences in a row found in the next chunk
+    as well, and the spans of the next chunk are taken from these sentences on. A chunk's
+    sentences may differ from the whole text's ones only near the chunk start and end,
+    so the joined spans are the same the whole text gives.
+    :return: joined spans or None if some neighbour chunks have no sentences in common
+    """
+    joined = []  # type: List[Tuple[int, int]]
+    tail = chunk_spans[0]
+    for chunk_id in range(1, len(chunks)):
+        prev_chunk_end = chunks[chunk_id - 1][1]
+        # the last sentence of the previous chunk may be cut by the chunk end
+        tail_positions = {span: i for i, span in enumerate(tail) if span[1] < prev_chunk_end}
+        next_spans = chunk_spans[chunk_id]
+        common = next((i for i in range(len(next_spans) - 1)
+                       if next_spans[i] in tail_positions
+                       and tail_positions.get(next_spans[i + 1]) == tail_positions[next_spans[i]] + 1), None)
+        if common is None:
+            return None
+        joined.extend(tail[:tail_positions[next_spans[common]]])
+        tail = next_spans[common:]
+    joined.extend(tail)
+    return joined
+
+
+def get_sentence_span_parallel(text: str,
+                               processes: Optional[int] = None,
+                               chunk_size: int = PARALLEL_CHUNK_SIZE,
+                               overlap: int = PARALLEL_CHUNK_OVERLAP,
+                               executor: Optional[Executor] = None) -> List[Tuple[int, int, str]]:
+    """
+    Get the same sentence spans as get_sentence_span_list() does, splitting large texts
+    into sentences in a process pool.
+    The text is cut at blank lines and page breaks into overlapping chunks, which are split
+    into sentences separately. The chunks' sentence spans are then joined on the sentences
+    found in both of the neighbour chunks (see join_chunk_sentence_spans()). The whole text is
+    split at once if it is shorter than two chunks or the chunks can't be joined.
+    :param text:
+    :param processes: max worker processes, see ProcessPoolExecutor
+    :param chunk_size:
+    :param overlap:
+    :param executor: executor to use instead of a new process pool
+    :return:
+    """
+    chunks = get_parallel_chunks(text, chunk_size, overlap)
+    if len(chunks) < 2:
+        return get_sentence_span_list(text)
+
+    chunk_texts = [text[start:end] for start, end in chunks]
+    chunk_offsets = [start for start, _ in chunks]
+    if executor is not None:
+        chunk_spans = list(executor.map(get_chunk_sentence_spans, chunk_texts, chunk_offsets))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            chunk_spans = list(pool.map(get_chunk_sentence_spans, chunk_texts, chunk_offsets))
+
+    spans = join_chunk_sentence_spans(chunks, chunk_spans)
+    if spans is None:
+        return get_sentence_span_list(text)
+    return [(start, end, text[start:end]) for start, end in spans]
+
+
 def normalize_text(text: str) -> str:
     """
     Simple text pre-processing: replacing "not-quite unicode" symbols
@@ -168,11 +284,15 @@ def normalize_text(text: str) -> str:
     return text
 
 
-def get_sentence_span_list(text) -> List[Tuple[int, int, str]]:
+def get_sentence_span_list(text, processes: int = 1) -> List[Tuple[int, int, str]]:
     """
     Given a text, generates (start, end) spans of sentences
     in the text.
+    :param text:
+    :param processes: split large texts in that many processes (see get_sentence_span_parallel)
     """
+    if processes > 1:
+        return get_sentence_span_parallel(text, processes)
     return list(get_sentence_span(text))
 
 
@@ -7,17 +7,21 @@ machine learning classifiers.
 # Imports
 import os
 import string
-from typing import Generator
+from typing import Generator, List, Optional, Tuple
 
 # Packages
+import numpy
 import pandas
 import sklearn.ensemble
 from sklearn.externals import joblib
 
 # Project
-from lexnlp.nlp.en.segments.utils import build_document_line_distribution
+from lexnlp.nlp.en.segments.utils import build_document_line_distribution, build_line_window_features, \
+    count_line_categories, count_line_characters, get_line_features, get_line_feature_cache, \
+    get_line_shape_features, strip_span, LineFeatureCache, LINE_CATEGORY_FEATURES, LINE_SHAPE_FEATURES
 from lexnlp.utils.decorators import safe_failure
-from lexnlp.utils.unicode.unicode_lookup import UNICODE_CHAR_TOP_CATEGORY_MAPPING
+from lexnlp.utils.unicode.unicode_lookup import UNICODE_TOP_CATEGORIES, categorize
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -30,8 +34,10 @@ __email__ = "support@contraxsuite.com"
 # Setup module path
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Load segmenters
-SECTION_SEGMENTER_MODEL = joblib.load(os.path.join(MODULE_PATH, "./title_locator.pickle"))
+# Segmenter is loaded on first use
+TITLE_LOCATOR = register_resource(
+    'en.title_locator', lambda: joblib.load(os.path.join(MODULE_PATH, "./title_locator.pickle")))
+__getattr__ = lazy_module_attributes(__name__, {'SECTION_SEGMENTER_MODEL': TITLE_LOCATOR})
 
 
 def build_title_features(lines, line_id, line_window_pre, line_window_post, characters=string.printable,
@@ -72,16 +78,10 @@ def build_title_features(lines, line_id, line_window_pre, line_window_post, char
         feature_vector["line_title_case_" + index_str] = line == line.title()
         feature_vector["line_upper_case_" + index_str] = line.isupper()
 
-        alpha_count, number_count, punct_count, whitespace_count = 0, 0, 0, 0
-        for c in line:
-            if UNICODE_CHAR_TOP_CATEGORY_MAPPING[c] == 'L':
-                alpha_count += 1
-            elif UNICODE_CHAR_TOP_CATEGORY_MAPPING[c] == 'Z':
-                whitespace_count += 1
-            elif UNICODE_CHAR_TOP_CATEGORY_MAPPING[c] == 'N':
-                number_count += 1
-            elif UNICODE_CHAR_TOP_CATEGORY_MAPPING[c] == 'P':
-                punct_count += 1
+        char_top_categories = categorize(line, top=True)
+        alpha_count, number_count, punct_count, whitespace_count = [
+            int(numpy.count_nonzero(char_top_categories == UNICODE_TOP_CATEGORIES.index(category)))
+            for category in ('L', 'N', 'P', 'Z')]
 
         # Count characters
         feature_vector["line_n_alpha_" + index_str] = alpha_count
@@ -123,6 +123,50 @@ def build_title_features(lines, line_id, line_window_pre, line_window_post, char
     return feature_vector
 
 
+def get_char_top_category(character: str) -> str:
+    return UNICODE_TOP_CATEGORIES[categorize(character, top=True)[0]]
+
+
+def build_title_feature_matrix(lines, line_window_pre, line_window_post, characters=string.printable,
+                               include_doc=None, line_cache: Optional[LineFeatureCache] = None) \
+        -> Tuple[numpy.ndarray, List[str]]:
+    """
+    Build feature vectors for all the lines at once.
+    Gives the same columns as build_title_features() called for each line and put into
+    pandas.DataFrame(...).fillna(-1).
+
+    :param lines:
+    :param line_window_pre:
+    :param line_window_post:
+    :param characters:
+    :param include_doc:
+    :param line_cache: LineFeatureCache to take the per-line features from
+    :return: (feature matrix, column names)
+    """
+    line_features = numpy.column_stack([
+        get_line_features(lines, get_line_shape_features, str.isupper, line_cache=line_cache),
+        get_line_features(lines, count_line_categories, get_char_top_category, line_cache=line_cache)])
+    line_feature_names = list(LINE_SHAPE_FEATURES) + [name for name, _ in LINE_CATEGORY_FEATURES]
+
+    # Simple checks
+    checks = []
+    for line in lines:
+        line_strip_lower = line.strip().lower()
+        checks.append(("agreement" in line, "Agreement" in line, "AGREEMENT" in line,
+                       "contract" in line, "Contract" in line, "CONTRACT" in line,
+                       "amendment" in line, "Amendment" in line, "AMENDMENT" in line,
+                       line_strip_lower.endswith("agreement"), line_strip_lower.startswith("amendment")))
+    extra_features = numpy.column_stack([numpy.array(checks, dtype=bool).reshape(len(lines), 11),
+                                         get_line_features(lines, count_line_characters, characters,
+                                                           line_cache=line_cache)])
+    extra_feature_names = ["agreement", "Agreement", "AGREEMENT", "contract", "Contract", "CONTRACT",
+                           "amendment", "Amendment", "AMENDMENT", "ew_agreement", "sw_amendment"] + \
+                          ["char_" + character for character in characters]
+
+    return build_line_window_features(line_features, line_feature_names, line_window_pre, line_window_post,
+                                      extra_features, extra_feature_names, include_doc)
+
+
 def build_document_title_features(text, window_pre=3, window_post=3):
     """
     Get a document title given file text.
@@ -132,13 +176,10 @@ def build_document_title_features(text, window_pre=3, window_post=3):
 
     # Parse all lines
     lines = text.splitlines()
-    feature_data = []
-
-    for line_id in range(len(lines)):
-        feature_data.append(build_title_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
+    feature_data, columns = build_title_feature_matrix(lines, window_pre, window_post, include_doc=doc_distribution)
 
     # Get feature DF
-    feature_df = pandas.DataFrame(feature_data).fillna(-1).astype(int)
+    feature_df = pandas.DataFrame(feature_data.astype(int), columns=columns)
     return feature_df
 
 
@@ -206,41 +247,76 @@ def build_model(training_file_path):
     joblib.dump(model, "title_locator.pickle")
 
 
-@safe_failure
-def get_titles(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+def get_title_lines(line_cache: LineFeatureCache, window_pre=3, window_post=3, score_threshold=0.5) -> List[int]:
     """
-    Get titles from text.
-    :param text:
+    Get indexes of the lines predicted to be (a part of) a title.
+    :param line_cache:
     :param window_pre:
     :param window_post:
     :param score_threshold:
     :return:
     """
-
     # Get features and target for model
-    feature_data = build_document_title_features(text, window_pre, window_post)
+    doc_distribution = line_cache.get_document_line_distribution()
+    feature_data, _ = build_title_feature_matrix(line_cache.lines, window_pre, window_post,
+                                                 include_doc=doc_distribution, line_cache=line_cache)
+    feature_data = feature_data.astype(int)
 
     # Predict title lines
-    predicted_lines = SECTION_SEGMENTER_MODEL.predict_proba(feature_data)
+    predicted_lines = TITLE_LOCATOR.get().predict_proba(feature_data)
     predicted_df = pandas.DataFrame(predicted_lines, columns=["prob_false", "prob_true"])
-    title_lines = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
-
-    # Check if results
-    if len(title_lines) > 0:
-        # Get lines
-        lines = text.splitlines()
-
-        # Iterate through lines
-        title = ""
-        for i in range(len(lines)):
-            if i in title_lines:
-                title += lines[i] + " "
-            elif len(lines[i].strip()) == 0:
-                continue
-            else:
-                if len(title) > 0:
-                    yield title.strip()
-                    title = ""
-
-        if len(title) > 0:
-            yield title.strip()
+    return predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
+
+
+@safe_failure
+def get_title_spans(text, window_pre=3, window_post=3, score_threshold=0.5,
+                    line_cache: Optional[LineFeatureCache] = None) -> Generator[Tuple[int, int], None, None]:
+    """
+    Get (start, end) of the titles get_titles() returns.
+    A span covers all the title lines, so text[start:end] keeps the line breaks and
+    the empty lines between them.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :param line_cache: LineFeatureCache of the text shared with the other segmenters
+    :return:
+    """
+    line_cache = get_line_feature_cache(text, line_cache)
+    title_lines = set(get_title_lines(line_cache, window_pre, window_post, score_threshold))
+    if len(title_lines) == 0:
+        return
+
+    lines = line_cache.lines
+    line_spans = line_cache.get_line_spans()
+    title_start = title_end = None
+    for i in range(len(lines)):
+        if i in title_lines:
+            if title_start is None:
+                title_start = line_spans[i][0]
+            title_end = line_spans[i][1]
+        elif len(lines[i].strip()) == 0:
+            continue
+        elif title_start is not None:
+            yield strip_span(text, title_start, title_end)
+            title_start = title_end = None
+
+    if title_start is not None:
+        yield strip_span(text, title_start, title_end)
+
+
+@safe_failure
+def get_titles(text, window_pre=3, window_post=3, score_threshold=0.5,
+               line_cache: Optional[LineFeatureCache] = None) -> Generator:
+    """
+    Get titles from text.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :param line_cache: LineFeatureCache of the text shared with the other segmenters
+    :return:
+    """
+    # a title is yielded as one line: its lines are joined with spaces, the empty lines are skipped
+    for start, end in get_title_spans(text, window_pre, window_post, score_threshold, line_cache=line_cache):
+        yield " ".join(line for line in text[start:end].splitlines() if line.strip())
@@ -7,7 +7,13 @@ Todo:
 """
 
 # Imports
+import re
 import string
+import unicodedata
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Packages
+import numpy
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -17,6 +23,153 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
+RE_NEW_LINE = re.compile(r'(?P<line>[^\r\n]*)((\r\n)|(\n\r)|\n|\r)')
+
+LINE_CATEGORY_FEATURES = (("line_n_alpha_{0}", "L"), ("line_n_number_{0}", "N"),
+                          ("line_n_punct_{0}", "P"), ("line_n_whitespace_{0}", "Z"))
+
+LINE_SHAPE_FEATURES = ("line_len_{0}", "line_lenstrip_{0}", "line_title_case_{0}", "line_upper_case_{0}")
+
+LINE_EDGE_CHAR_FEATURES = ("first_char_punct", "last_char_punct", "first_char_number", "last_char_number")
+
+
+def splitlines_with_spans(text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+    lines = list()  # type: List[str]
+    spans = list()  # type: List[Tuple[int, int]]
+    if text is None:
+        return lines, spans
+    last_line_end = -1
+    for m in RE_NEW_LINE.finditer(text):
+        line = m.group('line')
+        span = m.span()
+        lines.append(line)
+        spans.append(span)
+        last_line_end = span[1]
+    if last_line_end < len(text):
+        lines.append(text[last_line_end:len(text)])
+        spans.append((last_line_end, len(text)))
+    return lines, spans
+
+
+class LineFeatureCache:
+    """
+    Lines, per-line features and document character distributions of a text.
+    Each of them is computed on first request and then shared by the page, paragraph,
+    section and title segmenters:
+
+        line_cache = LineFeatureCache(text)
+        pages = list(get_pages(text, line_cache=line_cache))
+        paragraphs = list(get_paragraphs(text, line_cache=line_cache))
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lines = text.splitlines()
+        self.line_spans = None  # type: Optional[List[Tuple[int, int]]]
+        self.lines_with_spans = None  # type: Optional[Tuple[List[str], List[Tuple[int, int]]]]
+        self.doc_features = {}  # type: Dict[Hashable, Dict[str, float]]
+        # (id(lines), build function, args): (lines, features)
+        self.line_features = {}  # type: Dict[Hashable, Tuple[Sequence[str], Any]]
+
+    def get_line_spans(self) -> List[Tuple[int, int]]:
+        """
+        Get (start, end) of each of self.lines in the text, line breaks excluded.
+        """
+        if self.line_spans is None:
+            self.line_spans = get_line_spans(self.text, self.lines)
+        return self.line_spans
+
+    def get_lines_with_spans(self) -> Tuple[List[str], List[Tuple[int, int]]]:
+        """
+        Get lines split by splitlines_with_spans() along with their spans.
+        The lines are the same list as self.lines when both ways of splitting agree,
+        so that the lines' features are computed once.
+        """
+        if self.lines_with_spans is None:
+            lines, spans = splitlines_with_spans(self.text)
+            if lines == self.lines:
+                lines = self.lines
+            self.lines_with_spans = lines, spans
+        return self.lines_with_spans
+
+    def get_document_distribution(self, characters=string.printable, norm=True) -> Dict[str, float]:
+        key = (build_document_distribution, characters, norm)
+        if key not in self.doc_features:
+            self.doc_features[key] = build_document_distribution(self.text, characters, norm)
+        return self.doc_features[key]
+
+    def get_document_line_distribution(self, characters=string.printable, norm=True) -> Dict[str, float]:
+        key = (build_document_line_distribution, characters, norm)
+        if key not in self.doc_features:
+            self.doc_features[key] = build_document_line_distribution(self.text, characters, norm)
+        return self.doc_features[key]
+
+    def get_line_features(self, lines: Sequence[str], build: Callable, *args) -> Any:
+        """
+        Get build(lines, *args) result, computing it on the first call only.
+        """
+        key = (id(lines), build, args)
+        cached = self.line_features.get(key)
+        if cached is not None and cached[0] is lines:
+            return cached[1]
+        features = build(lines, *args)
+        self.line_features[key] = lines, features
+        return features
+
+
+def get_line_spans(text: str, lines: Sequence[str]) -> List[Tuple[int, int]]:
+    """
+    Get (start, end) of each line of text.splitlines() in the text, line breaks excluded.
+    """
+    spans = []  # type: List[Tuple[int, int]]
+    start = 0
+    for line in lines:
+        end = start + len(line)
+        spans.append((start, end))
+        start = end + (2 if text.startswith("\r\n", end) else 1)
+    return spans
+
+
+def get_lines_span(text: str, line_spans: Sequence[Tuple[int, int]], pos0: int, pos1: int) -> Tuple[int, int]:
+    """
+    Get (start, end) of the lines[pos0:pos1] in the text, line breaks between the lines included.
+    """
+    if pos1 > pos0:
+        return line_spans[pos0][0], line_spans[pos1 - 1][1]
+    start = line_spans[pos0][0] if pos0 < len(line_spans) else len(text)
+    return start, start
+
+
+def strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """
+    Get (start, end) of text[start:end].strip() without copying the text.
+    """
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def get_line_feature_cache(text: str, line_cache: Optional[LineFeatureCache] = None) -> LineFeatureCache:
+    """
+    Get the line cache given if it has been made for this text, or a new one.
+    """
+    if line_cache is not None and line_cache.text == text:
+        return line_cache
+    return LineFeatureCache(text)
+
+
+def get_line_features(lines: Sequence[str], build: Callable, *args,
+                      line_cache: Optional[LineFeatureCache] = None) -> Any:
+    """
+    Get build(lines, *args) result either from the line cache or computed right here.
+    """
+    if line_cache is None:
+        return build(lines, *args)
+    return line_cache.get_line_features(lines, build, *args)
+
+
 def build_document_distribution(text, characters=string.printable, norm=True):
     """
     Build document character distribution based on fixed character, optionally norming.
@@ -82,3 +235,180 @@ def build_document_line_distribution(text, characters=string.printable, norm=Tru
                 feature_vector[character] = feature_vector[character] / total_startchar if total_startchar != 0 else 0
 
     return feature_vector
+
+
+def get_line_char_codes(lines: Sequence[str]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Get code points of all the lines' characters along with the index of the line each character belongs to.
+    :param lines:
+    :return: (code points, line indexes)
+    """
+    lengths = numpy.array([len(line) for line in lines], dtype=numpy.int64)
+    codes = numpy.frombuffer("".join(lines).encode("utf-32-le", "surrogatepass"), dtype=numpy.uint32)
+    line_ids = numpy.repeat(numpy.arange(len(lines)), lengths)
+    return codes, line_ids
+
+
+def count_line_categories(lines: Sequence[str],
+                          char_category: Optional[Callable[[str], str]] = None) -> numpy.ndarray:
+    """
+    Count letters, numbers, punctuation and whitespace characters (see LINE_CATEGORY_FEATURES) of each line.
+    :param lines:
+    :param char_category: returns the top unicode category of a character, unicodedata by default
+    :return: array of shape (len(lines), len(LINE_CATEGORY_FEATURES))
+    """
+    if char_category is None:
+        char_category = lambda c: unicodedata.category(c)[0]
+    codes, line_ids = get_line_char_codes(lines)
+    # each distinct character is looked up once
+    unique_codes, code_ids = numpy.unique(codes, return_inverse=True)
+    unique_categories = numpy.array([char_category(chr(c)) for c in unique_codes.tolist()], dtype=object)
+    char_categories = unique_categories[code_ids.reshape(-1)]
+
+    counts = numpy.zeros((len(lines), len(LINE_CATEGORY_FEATURES)), dtype=numpy.int64)
+    for feature_id, (_, category) in enumerate(LINE_CATEGORY_FEATURES):
+        counts[:, feature_id] = numpy.bincount(line_ids[char_categories == category], minlength=len(lines))
+    return counts
+
+
+def count_line_characters(lines: Sequence[str], characters=string.printable) -> numpy.ndarray:
+    """
+    Count occurrences of each of the characters in each line.
+    :param lines:
+    :param characters:
+    :return: array of shape (len(lines), len(characters))
+    """
+    counts = numpy.zeros((len(lines), len(characters)), dtype=numpy.int64)
+    if not characters:
+        return counts
+    codes, line_ids = get_line_char_codes(lines)
+    char_codes = [ord(c) for c in characters]
+    char_ids = numpy.full(max(char_codes) + 1, -1, dtype=numpy.int64)
+    char_ids[char_codes] = numpy.arange(len(characters))
+
+    known = codes < len(char_ids)
+    codes, line_ids = codes[known], line_ids[known]
+    codes_char_ids = char_ids[codes]
+    known = codes_char_ids >= 0
+    cell_ids = line_ids[known] * len(characters) + codes_char_ids[known]
+    counts += numpy.bincount(cell_ids, minlength=counts.size).reshape(counts.shape)
+    return counts
+
+
+def get_non_space_char_offsets(lines: Sequence[str]) -> numpy.ndarray:
+    """
+    Count non-whitespace characters of the lines.
+    The count of lines[pos0:pos1] is offsets[pos1] - offsets[pos0], and it is also the length
+    of "\n".join(lines[pos0:pos1]).strip() when it is 0 or 1.
+    :param lines:
+    :return: cumulative counts, array of shape (len(lines) + 1,)
+    """
+    counts = numpy.array([len("".join(line.split())) for line in lines], dtype=numpy.int64)
+    return numpy.concatenate([[0], numpy.cumsum(counts)])
+
+
+def get_line_shape_features(lines: Sequence[str],
+                            is_upper_case: Optional[Callable[[str], bool]] = None) -> numpy.ndarray:
+    """
+    Get length, stripped length, title and upper case flags (see LINE_SHAPE_FEATURES) of each line.
+    :param lines:
+    :param is_upper_case: upper case check, line == line.upper() by default
+    :return: array of shape (len(lines), len(LINE_SHAPE_FEATURES))
+    """
+    if is_upper_case is None:
+        is_upper_case = lambda line: line == line.upper()
+    features = [(len(line), len(line.strip()), line == line.title(), is_upper_case(line)) for line in lines]
+    return numpy.array(features, dtype=numpy.int64).reshape(len(lines), len(LINE_SHAPE_FEATURES))
+
+
+def get_line_edge_char_features(lines: Sequence[str]) -> numpy.ndarray:
+    """
+    Check if the stripped lines start or end with punctuation or digits (see LINE_EDGE_CHAR_FEATURES).
+    :param lines:
+    :return: boolean array of shape (len(lines), len(LINE_EDGE_CHAR_FEATURES))
+    """
+    features = numpy.zeros((len(lines), len(LINE_EDGE_CHAR_FEATURES)), dtype=bool)
+    for line_id, line in enumerate(lines):
+        line = line.strip()
+        if line:
+            features[line_id] = (line[0] in string.punctuation, line[-1] in string.punctuation,
+                                 line[0] in string.digits, line[-1] in string.digits)
+    return features
+
+
+def get_line_window_mask(line_count: int, offset: int, line_window_pre: int, line_window_post: int) -> numpy.ndarray:
+    """
+    Get the lines whose feature vector includes the features of the line at the given offset.
+    Reproduces the window bounds of build_page_break_features() and the like, including
+    the way they cut the window at the end of the document.
+    :param line_count:
+    :param offset:
+    :param line_window_pre:
+    :param line_window_post:
+    :return: boolean array of shape (line_count,)
+    """
+    line_ids = numpy.arange(line_count)
+    window_pre = numpy.minimum(line_window_pre, line_ids)
+    window_post = numpy.where(line_ids + line_window_post >= line_count,
+                              line_count - line_window_post - 1, line_window_post)
+    return (-window_pre <= offset) & (offset <= window_post) & (line_ids + offset < line_count)
+
+
+def build_line_window_features(line_features: numpy.ndarray,
+                               line_feature_names: Sequence[str],
+                               line_window_pre: int,
+                               line_window_post: int,
+                               extra_features: numpy.ndarray,
+                               extra_feature_names: Sequence[str],
+                               include_doc: Optional[Dict[str, float]] = None) \
+        -> Tuple[numpy.ndarray, List[str]]:
+    """
+    Build the feature matrix of all lines at once: window features are taken by shifting
+    the per-line features, extra features are taken from the line itself and the doc
+    features are the same for each line.
+
+    The matrix is what pandas.DataFrame(<per-line feature dicts>).fillna(-1) gives:
+    the columns go in the order they first appear in the feature dicts and the window
+    features missing for a line are set to -1.
+
+    :param line_features: per-line features, shape (line count, len(line_feature_names))
+    :param line_feature_names: name templates like "line_len_{0}", formatted with window offset
+    :param line_window_pre:
+    :param line_window_post:
+    :param extra_features: current line features, shape (line count, len(extra_feature_names))
+    :param extra_feature_names:
+    :param include_doc: document features
+    :return: (feature matrix, column names)
+    """
+    line_count = line_features.shape[0]
+    if line_count == 0:
+        return numpy.zeros((0, 0)), []
+
+    # window offsets with the first line having them
+    offset_blocks = []
+    for offset in range(-line_window_pre, line_window_post + 1):
+        mask = get_line_window_mask(line_count, offset, line_window_pre, line_window_post)
+        if not mask.any():
+            continue
+        block = numpy.full((line_count, line_features.shape[1]), -1, dtype=numpy.float64)
+        line_ids = numpy.nonzero(mask)[0]
+        block[line_ids] = line_features[line_ids + offset]
+        offset_blocks.append((line_ids[0], offset, block))
+    offset_blocks.sort(key=lambda b: (b[0], b[1]))
+
+    doc_names = list(include_doc.keys()) if include_doc else []
+    doc_block = numpy.tile(numpy.array([include_doc[name] for name in doc_names], dtype=numpy.float64),
+                           (line_count, 1))
+
+    blocks, names = [], []
+    line_0_blocks = [b for b in offset_blocks if b[0] == 0]
+    for _, offset, block in line_0_blocks:
+        blocks.append(block)
+        names.extend(name.format(offset) for name in line_feature_names)
+    blocks += [extra_features.astype(numpy.float64), doc_block]
+    names += list(extra_feature_names) + doc_names
+    for _, offset, block in offset_blocks[len(line_0_blocks):]:
+        blocks.append(block)
+        names.extend(name.format(offset) for name in line_feature_names)
+
+    return numpy.hstack(blocks), names
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Imports
+
+from unittest import TestCase
+
+from lexnlp.nlp.en.lex_document import LexDocument
+from lexnlp.nlp.en.segments.sentences import get_sentence_span_list
+from lexnlp.nlp.en.tokens import get_token_list
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "1.6.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class TestLexDocument(TestCase):
+    text = 'This Agreement is made by ACME, Inc. and "Beta" LLC.\n\n' + \
+           'The Buyer shall pay $25,000 to the Seller within thirty (30) days.'
+
+    def test_sentences(self):
+        document = LexDocument(self.text)
+        self.assertEqual(get_sentence_span_list(self.text), document.sentence_spans)
+        self.assertIs(document.sentence_spans, document.sentence_spans)
+        self.assertEqual(2, len(document.sentences))
+        self.assertEqual(0, document.get_sentence_index(5))
+        self.assertEqual(1, document.get_sentence_index(len(self.text) - 1))
+
+    def test_token_spans(self):
+        document = LexDocument(self.text)
+        for index, sentence in enumerate(document.sentences):
+            tokens = document.get_sentence_tokens(index)
+            self.assertEqual(get_token_list(sentence), tokens)
+            spans = document.get_sentence_token_spans(index)
+            self.assertEqual(len(tokens), len(spans))
+            for token, (start, end) in zip(tokens, spans):
+                if token in ('``', "''"):
+                    self.assertEqual('"', self.text[start:end])
+                else:
+                    self.assertEqual(token, self.text[start:end])
+
+    def test_get_shares_pos_cache(self):
+        document = LexDocument(self.text)
+        self.assertIs(document, LexDocument.get(self.text, document))
+        sentence_doc = LexDocument.get(document.sentences[1], document)
+        self.assertIsNot(document, sentence_doc)
+        self.assertIs(document.pos_cache, sentence_doc.pos_cache)
+        self.assertIsNot(document.pos_cache, LexDocument.get(self.text).pos_cache)
+
+    def test_pos_tag_cached(self):
+        document = LexDocument(self.text)
+        tagged = [('The', 'DT'), ('Buyer', 'NNP')]
+        document.pos_cache[('The', 'Buyer')] = tagged
+        self.assertIs(tagged, document.pos_tag(['The', 'Buyer']))
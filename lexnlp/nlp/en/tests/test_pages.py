@@ -3,7 +3,12 @@
 
 # Imports
 
-from lexnlp.nlp.en.segments.pages import get_pages
+# Packages
+import numpy
+import pandas
+
+from lexnlp.nlp.en.segments.pages import get_pages, build_page_break_features, build_page_break_feature_matrix
+from lexnlp.nlp.en.segments.utils import build_document_distribution
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -25,3 +30,17 @@ def test_page_examples():
         clean_result = [remove_whitespace(p) for p in expected]
         for page in page_list:
             assert remove_whitespace(page) in clean_result
+
+
+def test_page_feature_matrix():
+    text = "Page 1 of 2\nSome text, 12.\n\n- pg 2 -\nDone \u00e4\u00f6\u00fc!"
+    lines = text.splitlines()
+    doc_distribution = build_document_distribution(text)
+    for window_pre, window_post in [(3, 3), (2, 8)]:
+        feature_df = pandas.DataFrame([
+            build_page_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution)
+            for line_id in range(len(lines))]).fillna(-1)
+        feature_matrix, columns = build_page_break_feature_matrix(
+            lines, window_pre, window_post, include_doc=doc_distribution)
+        assert list(feature_df.columns) == columns
+        assert numpy.array_equal(feature_df.values.astype(float), feature_matrix)
@@ -5,12 +5,19 @@
 
 import string
 
+# Packages
+import numpy
+import pandas
+
 # Test imports
 from nose.tools import assert_dict_equal, nottest, assert_list_equal, assert_tuple_equal
 
 # Project imports
-from lexnlp.nlp.en.segments.paragraphs import get_paragraphs, splitlines_with_spans
-from lexnlp.nlp.en.segments.utils import build_document_distribution
+from lexnlp.nlp.en.segments.paragraphs import get_paragraphs, splitlines_with_spans, \
+    build_paragraph_break_features, build_paragraph_break_feature_matrix
+from lexnlp.nlp.en.segments.sections import build_section_break_feature_matrix
+from lexnlp.nlp.en.segments.utils import build_document_distribution, build_document_line_distribution, \
+    get_lines_span, strip_span, LineFeatureCache
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -185,3 +192,51 @@ def test_get_paragraphs_too_small_text_with_spans():
     text = '\nToo small text\n'
     spans = list(get_paragraphs(text=text, return_spans=True))
     assert_tuple_equal((text, 0, len(text)), spans[0])
+
+
+def test_paragraph_feature_matrix():
+    text = "ARTICLE I\n\n  1.1 Definitions. «Term» means—the term;\nSecond line 2\u00a0and\u2003more\n\nEND"
+    lines = text.splitlines()
+    doc_distribution = build_document_line_distribution(text)
+    for window_pre, window_post in [(3, 3), (0, 0), (1, 5), (6, 2)]:
+        feature_df = pandas.DataFrame([
+            build_paragraph_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution)
+            for line_id in range(len(lines))]).fillna(-1).astype(int)
+        feature_matrix, columns = build_paragraph_break_feature_matrix(
+            lines, window_pre, window_post, include_doc=doc_distribution)
+        assert_list_equal(list(feature_df.columns), columns)
+        assert numpy.array_equal(feature_df.values, feature_matrix.astype(int))
+
+
+def test_line_feature_cache():
+    text = "ARTICLE I\r\n\r\nSection 1.1. Definitions.\r\nThe terms below\r\n"
+    line_cache = LineFeatureCache(text)
+    lines, spans = line_cache.get_lines_with_spans()
+    assert lines is line_cache.lines
+    assert_tuple_equal((0, 11), spans[0])
+    assert line_cache.get_document_line_distribution() is line_cache.get_document_line_distribution()
+
+    doc_distribution = line_cache.get_document_line_distribution()
+    paragraph_features = build_paragraph_break_feature_matrix(lines, 3, 3, include_doc=doc_distribution,
+                                                              line_cache=line_cache)
+    cached_count = len(line_cache.line_features)
+    section_features = build_section_break_feature_matrix(lines, 3, 3, include_doc=doc_distribution,
+                                                          line_cache=line_cache)
+    # sections need no per-line features the paragraphs haven't computed
+    assert cached_count == len(line_cache.line_features)
+
+    for (feature_matrix, columns), build in [(paragraph_features, build_paragraph_break_feature_matrix),
+                                             (section_features, build_section_break_feature_matrix)]:
+        expected_matrix, expected_columns = build(lines, 3, 3, include_doc=doc_distribution)
+        assert_list_equal(expected_columns, columns)
+        assert numpy.array_equal(expected_matrix, feature_matrix)
+
+
+def test_line_spans():
+    text = "Title\r\n\r\n  Body line\x0cnext\rlast\n"
+    line_cache = LineFeatureCache(text)
+    line_spans = line_cache.get_line_spans()
+    assert_list_equal(line_cache.lines, [text[start:end] for start, end in line_spans])
+    assert_tuple_equal((7, 20), get_lines_span(text, line_spans, 1, 3))
+    assert_tuple_equal((len(text), len(text)), get_lines_span(text, line_spans, 5, 5))
+    assert_tuple_equal((11, 20), strip_span(text, 5, 21))
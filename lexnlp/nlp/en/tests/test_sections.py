@@ -13,12 +13,18 @@ Todo:
 import os
 import codecs
 
+# Packages
+import numpy
+import pandas
+
 # Project imports
 from nose.tools import assert_equal
 from unittest import TestCase
 
 from lexnlp import get_module_path
-from lexnlp.nlp.en.segments.sections import get_sections, get_section_spans
+from lexnlp.nlp.en.segments.sections import get_sections, get_section_spans, \
+    build_section_break_features, build_section_break_feature_matrix
+from lexnlp.nlp.en.segments.utils import build_document_line_distribution
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -86,6 +92,21 @@ def test_file_3():
         assert_equal(num_sections, 72)
 
 
+def test_section_feature_matrix():
+    text = "ARTICLE I\n\nSECTION 1.1 Definitions. \u00abTerm\u00bb means\u2014the term;\n" \
+           "Second line 2\u00a0and\u2003more\n\nsection 2 END."
+    lines = text.splitlines()
+    doc_distribution = build_document_line_distribution(text)
+    for window_pre, window_post in [(3, 3), (0, 0), (1, 5), (6, 2)]:
+        feature_df = pandas.DataFrame([
+            build_section_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution)
+            for line_id in range(len(lines))]).fillna(-1)
+        feature_matrix, columns = build_section_break_feature_matrix(
+            lines, window_pre, window_post, include_doc=doc_distribution)
+        assert list(feature_df.columns) == columns
+        assert numpy.array_equal(feature_df.values.astype(float), feature_matrix)
+
+
 class TestSectionSpans(TestCase):
 
     @staticmethod
@@ -3,10 +3,13 @@
 
 # Imports
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 from lexnlp.nlp.en.segments.sentences import get_sentence_list, build_sentence_model, \
-    pre_process_document, post_process_sentence, get_sentence_span
+    pre_process_document, post_process_sentence, get_sentence_span, get_sentence_span_list, \
+    get_sentence_span_parallel, get_parallel_chunks
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -115,3 +118,25 @@ class TestGetSentenceSpan(TestCase):
 
     def test_pre_process_document(self):
         lexnlp_tests.test_extraction_func_on_test_data(pre_process_document, actual_data_converter=lambda text: [text])
+
+    def test_sentence_span_parallel(self):
+        with open(os.path.join(lexnlp_tests.DIR_TEST_DATA, 'test_get_section_spans_1.txt'), 'rb') as f:
+            text = f.read().decode('utf-8')
+        self.assertGreater(len(get_parallel_chunks(text, 50000, 10000)), 5)
+
+        expected = get_sentence_span_list(text)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            actual = get_sentence_span_parallel(text, chunk_size=50000, overlap=10000, executor=executor)
+        self.assertEqual(expected, actual)
+
+        short_text = 'This is Mr. Smith.\n\nHe went home.'
+        self.assertEqual(get_sentence_span_list(short_text), get_sentence_span_parallel(short_text))
+
+    def test_sentence_span_parallel_processes(self):
+        # the chunks and their offsets go to the worker processes and back pickled
+        with open(os.path.join(lexnlp_tests.DIR_TEST_DATA, 'test_get_section_spans_1.txt'), 'rb') as f:
+            text = f.read().decode('utf-8')[:60000]
+        self.assertGreater(len(get_parallel_chunks(text, 20000, 5000)), 2)
+
+        actual = get_sentence_span_parallel(text, processes=2, chunk_size=20000, overlap=5000)
+        self.assertEqual(get_sentence_span_list(text), actual)
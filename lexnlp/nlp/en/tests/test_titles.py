@@ -2,11 +2,14 @@
 # -*- coding: UTF-8 -*-
 
 import os
+import numpy
+import pandas
 import requests
 from nose.tools import assert_list_equal
 
 from lexnlp import get_module_path
-from lexnlp.nlp.en.segments.titles import get_titles
+from lexnlp.nlp.en.segments.titles import get_titles, build_title_features, build_title_feature_matrix
+from lexnlp.nlp.en.segments.utils import build_document_line_distribution
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -67,3 +70,18 @@ def test_title_3():
        45% Stormwater Utility Bill Collection Rate 94% 98% 95% 95% 95%
        Average Response Time for...', 1, , ...)"""
     assert_list_equal(list(get_titles(text)), [])
+
+
+def test_title_feature_matrix():
+    text = "LEASE AGREEMENT\n\nAmendment No. 1 to the Contract \u00abTerm\u00bb\n" \
+           "Second line 2\u00a0and\u2003more\n\nthis agreement"
+    lines = text.splitlines()
+    doc_distribution = build_document_line_distribution(text)
+    for window_pre, window_post in [(3, 3), (0, 0), (1, 5), (6, 2)]:
+        feature_df = pandas.DataFrame([
+            build_title_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution)
+            for line_id in range(len(lines))]).fillna(-1)
+        feature_matrix, columns = build_title_feature_matrix(
+            lines, window_pre, window_post, include_doc=doc_distribution)
+        assert_list_equal(list(feature_df.columns), columns)
+        assert numpy.array_equal(feature_df.values.astype(float), feature_matrix)
@@ -8,12 +8,14 @@ Todo:
 # Imports
 import os
 import pickle
-from typing import List, Generator
+from typing import List, Generator, Tuple
 
 # NLTK imports
 import nltk
 from nltk.corpus import wordnet
 
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
+
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
 __license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
@@ -29,10 +31,17 @@ STOPWORDS = pickle.load(open(os.path.join(MODULE_PATH, "stopwords.pickle"), "rb"
 
 # Collocations
 COLLOCATION_SIZE = 10000
-BIGRAM_COLLOCATIONS = pickle.load(
-    open(os.path.join(MODULE_PATH, "collocation_bigrams_{0}.pickle".format(COLLOCATION_SIZE)), "rb"))
-TRIGRAM_COLLOCATIONS = pickle.load(
-    open(os.path.join(MODULE_PATH, "collocation_trigrams_{0}.pickle".format(COLLOCATION_SIZE)), "rb"))
+
+
+def _load_collocations(ngram: str):
+    with open(os.path.join(MODULE_PATH, "collocation_{0}_{1}.pickle".format(ngram, COLLOCATION_SIZE)), "rb") as f:
+        return pickle.load(f)
+
+
+# Collocations are loaded on first use
+__getattr__ = lazy_module_attributes(__name__, {
+    'BIGRAM_COLLOCATIONS': register_resource('en.bigram_collocations', lambda: _load_collocations('bigrams')),
+    'TRIGRAM_COLLOCATIONS': register_resource('en.trigram_collocations', lambda: _load_collocations('trigrams'))})
 
 # Setup default stemmer for English
 DEFAULT_STEMMER = nltk.stem.snowball.EnglishStemmer()
@@ -40,6 +49,9 @@ DEFAULT_STEMMER = nltk.stem.snowball.EnglishStemmer()
 # Setup lemmatizers for English
 DEFAULT_LEMMATIZER = nltk.stem.wordnet.WordNetLemmatizer()
 
+# Tokenizer replaces double quotes with these tokens
+QUOTE_TOKENS = {'``', "''"}
+
 
 def get_wordnet_pos(treebank_tag):
     """
@@ -98,6 +110,38 @@ def get_token_list(text: str, lowercase: bool = False, stopword: bool = False,
                            preserve_line=preserve_line))
 
 
+def get_token_spans(text: str, tokens: List[str]) -> List[Tuple[int, int]]:
+    """
+    Find (start, end) positions of the tokens in the source text.
+    Tokens are expected to go in the order of the text and to be separated by whitespaces only - as they are
+    returned by get_token_list(). If the tokenizer has changed a token (quotes) then its span is taken
+    from the nearest non-space chars of the text.
+    :param text:
+    :param tokens: tokens of the text
+    :return: list of (start, end) - one per token
+    """
+    spans = []
+    text_len = len(text)
+    pos = 0
+    for token in tokens:
+        while pos < text_len and text[pos].isspace():
+            pos += 1
+        if text.startswith(token, pos):
+            end = pos + len(token)
+        elif token in QUOTE_TOKENS and text.startswith('"', pos):
+            end = pos + 1
+        else:
+            start = text.find(token, pos, pos + 2 * len(token) + 2)
+            if start >= 0:
+                pos = start
+                end = start + len(token)
+            else:
+                end = min(text_len, pos + len(token))
+        spans.append((pos, end))
+        pos = end
+    return spans
+
+
 def get_stems(text, lowercase=False, stopword=False, stemmer=DEFAULT_STEMMER) -> Generator:
     """
     Get stems from text.
@@ -22,7 +22,7 @@ def safe_failure(func):
             res = func(*args, **kwargs)
             if isinstance(res, types.GeneratorType):
                 try:
-                    yield from func(*args, **kwargs)
+                    yield from res
                 except:
                     if raise_exc:
                         raise
@@ -0,0 +1,156 @@
+"""Lazy loading registry for models and other heavy resources.
+
+Modules register their models (pickles, dictionaries, spaCy / gensim models) here
+instead of loading them at import time. A resource is loaded on the first
+LazyResource.get() call, so importing e.g. lexnlp.extract.en.urls costs nothing
+even if it (indirectly) imports modules that own big models.
+
+    from lexnlp.utils.lazy_resources import preload, get_resource_stats
+
+    preload()  # load everything before forking worker processes
+    for stats in get_resource_stats():
+        print(stats.name, stats.load_time, stats.memory)
+
+Memory is measured only while tracemalloc is tracing (tracemalloc.start()).
+"""
+
+# Imports
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "1.6.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class ResourceStats:
+    def __init__(self, name: str, loaded: bool,
+                 load_time: Optional[float], memory: Optional[int]):
+        self.name = name
+        self.loaded = loaded
+        self.load_time = load_time  # seconds
+        self.memory = memory  # bytes, None if not measured
+
+    def __repr__(self):
+        return f'{self.name}: loaded={self.loaded}, load_time={self.load_time}, memory={self.memory}'
+
+
+class LazyResource:
+    """
+    A resource (model, dictionary ...) that is loaded by the first get() call.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self.loader = loader
+        self.loaded = False
+        self.load_time = None  # type: Optional[float]
+        self.memory = None  # type: Optional[int]
+        self._value = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        if self.loaded:
+            return self._value
+        with self._lock:
+            if not self.loaded:
+                self._load()
+        return self._value
+
+    def _load(self) -> None:
+        tracing = tracemalloc.is_tracing()
+        memory_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.time()
+        self._value = self.loader()
+        self.load_time = time.time() - start
+        if tracing:
+            self.memory = tracemalloc.get_traced_memory()[0] - memory_before
+        self.loaded = True
+
+    def reload_if(self, predicate: Callable[[Any], bool]) -> Any:
+        """
+        Same as get() but loads the resource again if predicate(loaded value) is true.
+        The check and the reload are done under the lock, and get() callers see
+        either the old or the new value meanwhile.
+        """
+        with self._lock:
+            if not self.loaded or predicate(self._value):
+                self._load()
+            return self._value
+
+    def unload(self) -> None:
+        """
+        Forget the loaded value, the next get() call loads it again.
+        """
+        with self._lock:
+            self._value = None
+            self.loaded = False
+
+    def get_stats(self) -> ResourceStats:
+        return ResourceStats(self.name, self.loaded, self.load_time, self.memory)
+
+
+class LazyResourceRegistry:
+    def __init__(self):
+        self.resources = {}  # type: Dict[str, LazyResource]
+
+    def register(self, name: str, loader: Callable[[], Any]) -> LazyResource:
+        """
+        Register the resource. Registering the same name twice returns the resource registered first.
+        :param name: unique resource name, e.g. "en.date_model"
+        :param loader: function that loads and returns the resource
+        :return: LazyResource - call get() to obtain the resource itself
+        """
+        resource = self.resources.get(name)
+        if resource is None:
+            resource = LazyResource(name, loader)
+            self.resources[name] = resource
+        return resource
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Load the resources (all registered by default) now, e.g. before forking worker processes.
+        Only resources of the modules already imported are registered.
+        """
+        names = list(names) if names is not None else list(self.resources)
+        for name in names:
+            self.resources[name].get()
+
+    def get_stats(self) -> List[ResourceStats]:
+        return [r.get_stats() for r in self.resources.values()]
+
+
+RESOURCES = LazyResourceRegistry()
+
+
+def register_resource(name: str, loader: Callable[[], Any]) -> LazyResource:
+    return RESOURCES.register(name, loader)
+
+
+def preload(names: Optional[Iterable[str]] = None) -> None:
+    RESOURCES.preload(names)
+
+
+def get_resource_stats() -> List[ResourceStats]:
+    return RESOURCES.get_stats()
+
+
+def lazy_module_attributes(module_name: str,
+                           resources: Dict[str, LazyResource]) -> Callable[[str], Any]:
+    """
+    Build module-level __getattr__ (PEP 562) that keeps former module constants
+    (e.g. SENTENCE_SEGMENTER_MODEL) importable - the resource is loaded on access.
+    :param module_name: __name__ of the module
+    :param resources: {attribute name: resource}
+    """
+    def module_getattr(name: str) -> Any:
+        resource = resources.get(name)
+        if resource is None:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+        return resource.get()
+    return module_getattr
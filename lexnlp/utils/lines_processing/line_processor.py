@@ -1,4 +1,6 @@
-from typing import List, Generator, Tuple
+from bisect import bisect_left
+from functools import lru_cache
+from typing import List, Generator, Tuple, Optional, Pattern, Set
 import regex as re
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -56,6 +58,21 @@ WordList = List[SingleWord]
 StringList = List[str]
 
 
+def get_line_breaks_regex(line_breaks: Set[str]) -> Optional[Pattern]:
+    """
+    Regex that finds runs of line break characters, None if there are no line breaks.
+    Only single characters from line_breaks are taken into account.
+    """
+    return _get_line_breaks_regex(frozenset(b for b in line_breaks if len(b) == 1))
+
+
+@lru_cache(maxsize=64)
+def _get_line_breaks_regex(line_breaks: frozenset) -> Optional[Pattern]:
+    if not line_breaks:
+        return None
+    return re.compile('[' + ''.join(re.escape(b) for b in sorted(line_breaks)) + ']+')
+
+
 # splits text by phrases
 # finds an ending for each phrase and clues the phrases
 #  back by their endings
@@ -126,54 +143,76 @@ class LineProcessor:
                                         text: str,
                                         line_split_ptrs: LineSplitParams = None) -> \
             Generator[LineOrPhrase, None, None]:
+        """
+        Each phrase is a slice of the text up to the first line break character.
+        The sequence of line break characters that follows is the phrase's ending.
+        Line breaks within abbreviations (see get_break_positions) don't split the text.
+        """
         ptrs = line_split_ptrs or self.line_split_params
-        line = None
-        text_ended = False
-        i = -1
+        reg_breaks = get_line_breaks_regex(ptrs.line_breaks)
+        if reg_breaks is None:
+            if text:
+                yield LineOrPhrase(text, 0)
+            return
 
-        # mark text with abbreviations:
-        # - we doesn't split the text if we are within an abbreviation
         abr_coords = self.get_abbreviations_in_text(text)
-        coord_index = 0 if abr_coords else -1
-
-        for ch in text:
-            i += 1
-
-            # should we break the line?
-            if ch in ptrs.line_breaks:
-
-                # are we inside abbreviation?
-                inside_abr = False
-                while coord_index >= 0:
-                    coords = abr_coords[coord_index]
-                    if i >= coords[1]:
-                        coord_index += 1
-                        if coord_index >= len(abr_coords):
-                            coord_index = -1
-                            continue
-                    inside_abr = i >= coords[0]
-                    break
-                if not inside_abr:
-                    if line is not None:
-                        text_ended = True
-                        line.ending += ch
-                    continue
-
-            if line is None:
-                line = LineOrPhrase(ch, i)
-                continue
-
-            if text_ended:
-                new_line = LineOrPhrase(ch, i)
-                yield line
-                line = new_line
-                text_ended = False
-            else:
-                line.text += ch
-
-        if line is not None:
-            if len(line.text) > 0:
+        if abr_coords:
+            break_runs = self.get_break_runs(self.get_break_positions(text, reg_breaks, abr_coords))
+        else:
+            # no abbreviations - each run of line break characters ends the phrase
+            break_runs = (m.span() for m in reg_breaks.finditer(text))
+
+        start = 0
+        for run_start, run_end in break_runs:
+            if run_start > start:
+                line = LineOrPhrase(text[start:run_start], start)
+                line.ending = text[run_start:run_end]
                 yield line
+            start = run_end
+
+        if start < len(text):
+            yield LineOrPhrase(text[start:], start)
+
+    @staticmethod
+    def get_break_positions(text: str,
+                            reg_breaks: Pattern,
+                            abr_coords: List[Tuple[int, int]]) -> List[int]:
+        """
+        Positions of line break characters that are not "inside" abbreviations.
+        The abbreviations are checked one by one as the line breaks go: the first line break
+        after the current abbreviation's end is skipped as well and moves the check
+        to the next abbreviation (unless the abbreviation is the last one).
+        """
+        all_positions = []  # type: List[int]
+        for m in reg_breaks.finditer(text):
+            all_positions.extend(range(m.start(), m.end()))
+
+        positions = []  # type: List[int]
+        last_abr_index = len(abr_coords) - 1
+        i = 0
+        for abr_index, (abr_start, abr_end) in enumerate(abr_coords):
+            # line breaks before the abbreviation split the text, the ones inside it don't
+            abr_start_index = bisect_left(all_positions, abr_start, i)
+            positions.extend(all_positions[i:abr_start_index])
+            i = bisect_left(all_positions, abr_end, abr_start_index)
+            if i == len(all_positions) or abr_index == last_abr_index:
+                break
+            i += 1
+        positions.extend(all_positions[i:])
+        return positions
+
+    @staticmethod
+    def get_break_runs(positions: List[int]) -> Generator[Tuple[int, int], None, None]:
+        # [3, 4, 9] -> (3, 5), (9, 10)
+        if not positions:
+            return
+        run_start = run_end = positions[0]
+        for i in positions[1:]:
+            if i != run_end + 1:
+                yield run_start, run_end + 1
+                run_start = i
+            run_end = i
+        yield run_start, run_end + 1
 
     def get_abbreviations_in_text(self,
                                   text: str) -> List[Tuple[int, int]]:
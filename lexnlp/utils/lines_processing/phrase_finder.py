@@ -1,5 +1,5 @@
 import re
-from typing import List, Tuple
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -11,24 +11,41 @@ __email__ = "support@contraxsuite.com"
 
 PhraseMatch = Tuple[str, int, int]
 
+# single regex "atom" of a phrase: escaped char, char class or plain char + optional quantifier
+_ATOM_RE = re.compile(r'(?:\\[^xuUN0-9]|\[(?:\\.|[^\]\\])+\]|[^\\\[\](){}|?*+])(?:[?*+]|\{\d*,?\d*\})?\??')
+
+_PHRASE_BOUND = r'(?:\b|\s)'
+
 
 class PhraseFinder:
     """
     The class contains a collection of short string (usually 1 or 2 or 3 words)
     PhraseFinder searches for these strings (phrases) in the text given, either
     ignoring or regarding the case
+
+    All the phrases are compiled into one trie-shaped regex, so the text is scanned
+    once whatever the number of phrases is. The phrase regexes are then matched only
+    at the positions found by this scan.
     """
 
     def __init__(self, phrase_set: List[str], extra_format_function=None):
         self.extra_format_function = extra_format_function
         self.word_re_ig = dict((v, self.word_to_regex(v, True)) for v in phrase_set)
         self.word_re_cs = dict((v, self.word_to_regex(v, False)) for v in phrase_set)
+        self.phrases = list(self.word_re_ig)
+        # ignore_case: (phrase start regex, {first char: phrase indexes}, phrase indexes with no first char)
+        self.search_data = {}  # type: Dict[bool, Tuple[Pattern, Dict[str, List[int]], List[int]]]
 
-    def word_to_regex(self, word: str, ignore_case: bool) -> str:
-        # " Amtsgericht Stuttgart" ->  re("Amtsgericht[\s]+Stuttgart")
+    def format_phrase(self, word: str) -> str:
+        # " Amtsgericht Stuttgart" ->  "Amtsgericht[\s]+Stuttgart"
         subphrase = word.replace(r'\t', ' ').strip(' ').replace('  ', ' ').replace(' ', r'[\s]+')
         if self.extra_format_function is not None:
             subphrase = self.extra_format_function(subphrase)
+        return subphrase
+
+    def word_to_regex(self, word: str, ignore_case: bool) -> Pattern:
+        # " Amtsgericht Stuttgart" ->  re("Amtsgericht[\s]+Stuttgart")
+        subphrase = self.format_phrase(word)
         sps = '(\\b|\\s)'
         return re.compile(sps + subphrase + sps, re.IGNORECASE | re.UNICODE) if ignore_case else \
             re.compile(sps + subphrase + sps, re.UNICODE)
@@ -42,10 +59,85 @@ class PhraseFinder:
         PhraseFinder instance had been initialized like
             PhraseFinder([' let us ', 'better', 'the sea'])
         """
-        matches = []
         match_dict = self.word_re_ig if ignore_case else self.word_re_cs
+        search_re, first_char_phrases, other_phrases = self.get_search_data(ignore_case)
+
+        found = []  # type: List[Tuple[int, int, int]]
+        last_ends = {}  # type: Dict[int, int]
+        for candidate in search_re.finditer(phrase):
+            start = candidate.start()
+            phrase_ids = set(other_phrases)
+            # the phrase itself starts either right here or after the whitespace
+            for c in phrase[start:start + 2]:
+                for key in self.get_char_keys(c, ignore_case):
+                    phrase_ids.update(first_char_phrases.get(key, ()))
+
+            for phrase_id in phrase_ids:
+                # matches of the same phrase don't overlap - just like re.finditer()
+                if last_ends.get(phrase_id, 0) > start:
+                    continue
+                match = match_dict[self.phrases[phrase_id]].match(phrase, start)
+                if match:
+                    found.append((phrase_id, match.start(), match.end()))
+                    last_ends[phrase_id] = match.end()
+
+        found.sort()
+        return [(self.phrases[phrase_id], start, end) for phrase_id, start, end in found]
+
+    def get_search_data(self, ignore_case: bool) -> Tuple[Pattern, Dict[str, List[int]], List[int]]:
+        search_data = self.search_data.get(ignore_case)
+        if search_data is None:
+            search_data = self.build_search_data(ignore_case)
+            self.search_data[ignore_case] = search_data
+        return search_data
+
+    def build_search_data(self, ignore_case: bool) -> Tuple[Pattern, Dict[str, List[int]], List[int]]:
+        trie = {}  # type: Dict[Optional[str], dict]
+        first_char_phrases = {}  # type: Dict[str, List[int]]
+        other_phrases = []  # type: List[int]
+
+        for phrase_id, word in enumerate(self.phrases):
+            subphrase = self.format_phrase(word)
+            atoms = self.split_regex_atoms(subphrase)
+            node = trie
+            for atom in atoms:
+                node = node.setdefault(atom, {})
+            node[None] = {}
+
+            first_char = atoms[0] if atoms and len(atoms[0]) == 1 and atoms[0].isalnum() else None
+            if first_char is None:
+                other_phrases.append(phrase_id)
+                continue
+            for key in self.get_char_keys(first_char, ignore_case):
+                first_char_phrases.setdefault(key, []).append(phrase_id)
+
+        pattern = '(?=' + _PHRASE_BOUND + self.trie_to_regex(trie) + _PHRASE_BOUND + ')'
+        flags = re.IGNORECASE | re.UNICODE if ignore_case else re.UNICODE
+        return re.compile(pattern, flags), first_char_phrases, other_phrases
+
+    @staticmethod
+    def split_regex_atoms(subphrase: str) -> List[str]:
+        r"""
+        "Amtsgericht[\s]+Stuttgart" -> ["A", "m", ... "t", "[\s]+", "S", ... "t"]
+        The phrases we can't split safely (groups, alternatives ...) make one atom.
+        """
+        atoms = _ATOM_RE.findall(subphrase)
+        if ''.join(atoms) != subphrase:
+            return ['(?:' + subphrase + ')']
+        return atoms
+
+    @staticmethod
+    def trie_to_regex(node: Dict[Optional[str], dict]) -> str:
+        branches = [atom + PhraseFinder.trie_to_regex(child)
+                    for atom, child in node.items() if atom is not None]
+        if None in node:
+            branches.append('')
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
 
-        for k, v in match_dict.items():
-            for match in v.finditer(phrase):
-                matches.append((k, match.start(), match.end()))
-        return matches
+    @staticmethod
+    def get_char_keys(c: str, ignore_case: bool) -> Set[str]:
+        if not ignore_case:
+            return {c}
+        return {c, c.lower()[:1], c.upper().lower()[:1]}
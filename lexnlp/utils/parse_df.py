@@ -1,5 +1,8 @@
+import hashlib
 import re
-from typing import Generator, List, Union, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Generator, List, Optional, Union, Tuple
 
 import pandas as pd
 
@@ -74,6 +77,39 @@ class DataframeEntityParser(object):
                 c[0]: c[1] for c in collection_patterns if c[1]
             }
 
+        # {col_name: {cell value: [row position, ...]}}, positions are sorted by priority
+        self.row_index = {}  # type: Dict[str, Dict[str, List[int]]]
+        # {col_name: [cell value, ...]} - values to copy into the entities found
+        self.result_values = {}  # type: Dict[str, list]
+        if self.result_columns:
+            self.build_row_index()
+
+    def build_row_index(self) -> None:
+        """
+        Map each (separator-split) cell value of the parse columns to the rows containing it.
+        The rows are sorted by priority_sort_column once here, so get_formed_entity()
+        just takes the rows found by the value matched.
+        """
+        positions = list(range(len(self.dataframe)))
+        if self.priority_sort_column:
+            order = self.dataframe[self.priority_sort_column].reset_index(drop=True).sort_values(
+                ascending=self.priority_sort_ascending, kind='mergesort')
+            positions = order.index.tolist()
+
+        for col_name in self.collection_patterns:
+            values = self.dataframe[col_name].values
+            col_index = {}  # type: Dict[str, List[int]]
+            for pos in positions:
+                cell = values[pos]
+                if not cell:
+                    continue
+                for value in dict.fromkeys(cell.split(self.cell_values_separator)):
+                    col_index.setdefault(value, []).append(pos)
+            self.row_index[col_name] = col_index
+
+        self.result_values = {col_name: self.dataframe[col_name].tolist()
+                              for col_name in self.result_columns}
+
     def get_collection_ptn(self, collection):
         """
         Convert list of values to regex pattern
@@ -88,15 +124,17 @@ class DataframeEntityParser(object):
             '|'.join(re.escape(j) for i in collection for j in i.split(self.cell_values_separator) if i))
         return re.compile(ptn)
 
-    def get_single_result(self, rows):
+    def get_single_result(self, row_positions: List[int]) -> int:
         """
         By default we mean that all values we filter by in dataframe are UNIQUE, so just take 1st
+        (row_positions are already sorted by priority_sort_column)
         Implement your own logic to choose from multiple matched dataframe rows
         """
-        if self.priority_sort_column:
-            rows = rows.sort_values(by=self.priority_sort_column,
-                                    ascending=self.priority_sort_ascending)
-        return rows.iloc[0]
+        return row_positions[0]
+
+    def get_row_values(self, row_position: int) -> dict:
+        return {new_col_name: self.result_values[_col_name][row_position]
+                for _col_name, new_col_name in self.result_columns.items()}
 
     def get_formed_entity(self, match, col_name):
         """
@@ -113,18 +151,11 @@ class DataframeEntityParser(object):
             'source': matched_str
         }
         if self.result_columns:
-            matched_rows = self.dataframe[self.dataframe[col_name].str.contains(r'(?:^|;){}(?:$|;)'.format(matched_str), regex=True)]
+            row_positions = self.row_index[col_name].get(matched_str, [])
             if self.unique_column_values:
-                matched_row = self.get_single_result(matched_rows)
-                for _col_name, new_col_name in self.result_columns.items():
-                    formed_entity[new_col_name] = matched_row[_col_name]
+                formed_entity.update(self.get_row_values(self.get_single_result(row_positions)))
             else:
-                formed_entity["entities"] = []
-                for _, matched_row in matched_rows.iterrows():
-                    sub_entity = {}
-                    for _col_name, new_col_name in self.result_columns.items():
-                        sub_entity[new_col_name] = matched_row[_col_name]
-                    formed_entity["entities"].append(sub_entity)
+                formed_entity["entities"] = [self.get_row_values(pos) for pos in sorted(row_positions)]
 
         formed_entity.update(self.preformed_entity)
         return formed_entity
@@ -150,9 +181,72 @@ class DataframeEntityParser(object):
         return list(self.get_entities(text))
 
 
+# compiled parsers by config contents and parser settings, see get_dataframe_entity_parser()
+_PARSER_CACHE = OrderedDict()  # type: OrderedDict
+_PARSER_CACHE_SIZE = 16
+_PARSER_CACHE_LOCK = threading.Lock()
+
+
+def get_dataframe_hash(dataframe: pd.DataFrame, columns: Optional[List[str]] = None) -> str:
+    """
+    Hash of the dataframe column names, index and cell values.
+    :param columns: hash only these columns of the dataframe
+    """
+    if columns is not None:
+        dataframe = dataframe[columns]
+    hasher = hashlib.sha1(repr(list(dataframe.columns)).encode('utf-8'))
+    hasher.update(pd.util.hash_pandas_object(dataframe, index=True).values.tobytes())
+    return hasher.hexdigest()
+
+
+def get_dataframe_entity_parser(config: pd.DataFrame,
+                                parse_columns: Union[List[str], Tuple[str]],
+                                result_columns: Union[dict, None] = None,
+                                priority_sort_column: Union[str, None] = None,
+                                priority_sort_ascending: bool = True,
+                                cell_values_separator: Union[str, None] = ';',
+                                unique_column_values: bool = True) -> DataframeEntityParser:
+    """
+    Return DataframeEntityParser (without preformed_entity) built for the config dataframe
+    and the parameters given. The parser is built on the first call and then taken from the cache
+    while the dataframe contents stay the same - the cache key includes the hash of the dataframe
+    columns the parser reads, so the dataframe is not referenced by the cache.
+    Hashing still goes through the whole columns on every call: build the parser once
+    and reuse it when parsing many documents.
+    """
+    used_columns = list(OrderedDict.fromkeys(
+        c for c in list(parse_columns) + list(result_columns or {}) + [priority_sort_column]
+        if c and c in config.columns))
+    key = (get_dataframe_hash(config, used_columns),
+           tuple(parse_columns),
+           tuple(sorted((result_columns or {}).items())),
+           priority_sort_column,
+           priority_sort_ascending,
+           cell_values_separator,
+           unique_column_values)
+    with _PARSER_CACHE_LOCK:
+        parser = _PARSER_CACHE.get(key)
+        if parser is not None:
+            _PARSER_CACHE.move_to_end(key)
+            return parser
+
+    parser = DataframeEntityParser(dataframe=config,
+                                   parse_columns=parse_columns,
+                                   result_columns=result_columns,
+                                   priority_sort_column=priority_sort_column,
+                                   priority_sort_ascending=priority_sort_ascending,
+                                   cell_values_separator=cell_values_separator,
+                                   unique_column_values=unique_column_values)
+    with _PARSER_CACHE_LOCK:
+        _PARSER_CACHE[key] = parser
+        while len(_PARSER_CACHE) > _PARSER_CACHE_SIZE:
+            _PARSER_CACHE.popitem(last=False)
+    return parser
+
+
 def get_entities(text: str,
-                 config: pd.DataFrame,
-                 parse_columns: Union[List[str], Tuple[str]],
+                 config: Union[pd.DataFrame, DataframeEntityParser],
+                 parse_columns: Union[List[str], Tuple[str]] = None,
                  result_columns: Union[dict, None] = None,
                  preformed_entity: Union[dict, None] = None,
                  priority_sort_column: Union[str, None] = None,
@@ -161,20 +255,32 @@ def get_entities(text: str,
                  unique_column_values: bool = True) -> Generator:
     """
     Simple wrapper around DataframeEntityParser
+    :param config: entities dataframe or DataframeEntityParser built once for it -
+        in the latter case the rest of the parser's parameters are ignored. The dataframe
+        is hashed on each call to find its cached parser, see get_dataframe_entity_parser()
+    :param parse_columns: required if config is a dataframe
     """
-    yield from DataframeEntityParser(dataframe=config,
-                                     parse_columns=parse_columns,
-                                     result_columns=result_columns,
-                                     preformed_entity=preformed_entity,
-                                     priority_sort_column=priority_sort_column,
-                                     priority_sort_ascending=priority_sort_ascending,
-                                     cell_values_separator=cell_values_separator,
-                                     unique_column_values=unique_column_values).get_entities(text)
+    if isinstance(config, DataframeEntityParser):
+        yield from config.get_entities(text)
+        return
+    if parse_columns is None:
+        raise ValueError('parse_columns should be given for the config dataframe')
+    parser = get_dataframe_entity_parser(config=config,
+                                         parse_columns=parse_columns,
+                                         result_columns=result_columns,
+                                         priority_sort_column=priority_sort_column,
+                                         priority_sort_ascending=priority_sort_ascending,
+                                         cell_values_separator=cell_values_separator,
+                                         unique_column_values=unique_column_values)
+    for entity in parser.get_entities(text):
+        if preformed_entity:
+            entity.update(preformed_entity)
+        yield entity
 
 
 def get_entity_list(text: str,
-                    config: pd.DataFrame,
-                    parse_columns: Union[List[str], Tuple[str]],
+                    config: Union[pd.DataFrame, DataframeEntityParser],
+                    parse_columns: Union[List[str], Tuple[str]] = None,
                     result_columns: Union[dict, None] = None,
                     preformed_entity: Union[dict, None] = None,
                     priority_sort_column: Union[str, None] = None,
@@ -182,13 +288,14 @@ def get_entity_list(text: str,
                     cell_values_separator: Union[str, None] = ';',
                     unique_column_values: bool = True) -> List:
     """
-    Simple wrapper around DataframeEntityParser
+    Simple wrapper around DataframeEntityParser, see get_entities()
     """
-    return DataframeEntityParser(dataframe=config,
-                                 parse_columns=parse_columns,
-                                 result_columns=result_columns,
-                                 preformed_entity=preformed_entity,
-                                 priority_sort_column=priority_sort_column,
-                                 priority_sort_ascending=priority_sort_ascending,
-                                 cell_values_separator=cell_values_separator,
-                                 unique_column_values=unique_column_values).get_entity_list(text)
+    return list(get_entities(text,
+                             config=config,
+                             parse_columns=parse_columns,
+                             result_columns=result_columns,
+                             preformed_entity=preformed_entity,
+                             priority_sort_column=priority_sort_column,
+                             priority_sort_ascending=priority_sort_ascending,
+                             cell_values_separator=cell_values_separator,
+                             unique_column_values=unique_column_values))
@@ -0,0 +1,28 @@
+from unittest import TestCase
+from lexnlp.utils.decorators import safe_failure
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "1.6.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class TestSafeFailure(TestCase):
+
+    def test_generator_called_once(self):
+        calls = []
+
+        @safe_failure
+        def get_items(count):
+            calls.append(count)
+            yield from range(count)
+            raise ValueError('failed')
+
+        self.assertEqual([0, 1, 2], list(get_items(3)))
+        self.assertEqual([3], calls)
+
+        with self.assertRaises(ValueError):
+            list(get_items(2, safe_failure=False))
+        self.assertEqual([3, 2], calls)
@@ -0,0 +1,85 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+from lexnlp.utils.lazy_resources import LazyResourceRegistry, lazy_module_attributes
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "1.6.0"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class TestLazyResources(TestCase):
+
+    def test_load_once(self):
+        calls = []
+        registry = LazyResourceRegistry()
+        resource = registry.register('test.model', lambda: calls.append(1) or {'a': 1})
+        self.assertIs(resource, registry.register('test.model', lambda: None))
+        self.assertFalse(resource.loaded)
+        self.assertEqual([], calls)
+
+        self.assertEqual({'a': 1}, resource.get())
+        self.assertIs(resource.get(), resource.get())
+        self.assertEqual(1, len(calls))
+
+        stats = registry.get_stats()
+        self.assertEqual(1, len(stats))
+        self.assertEqual('test.model', stats[0].name)
+        self.assertTrue(stats[0].loaded)
+        self.assertIsNotNone(stats[0].load_time)
+
+        resource.unload()
+        self.assertFalse(resource.loaded)
+        resource.get()
+        self.assertEqual(2, len(calls))
+
+    def test_reload_if(self):
+        calls = []
+        registry = LazyResourceRegistry()
+        resource = registry.register('test.model', lambda: calls.append(1) or len(calls))
+        self.assertEqual(1, resource.reload_if(lambda value: True))
+        self.assertEqual(1, resource.reload_if(lambda value: value > 1))
+        self.assertEqual(2, resource.reload_if(lambda value: value == 1))
+        self.assertEqual(2, resource.get())
+        self.assertEqual(2, len(calls))
+
+    def test_preload(self):
+        registry = LazyResourceRegistry()
+        first = registry.register('test.first', lambda: 1)
+        second = registry.register('test.second', lambda: 2)
+        registry.preload(['test.second'])
+        self.assertFalse(first.loaded)
+        self.assertTrue(second.loaded)
+        registry.preload()
+        self.assertTrue(first.loaded)
+
+    def test_module_attributes(self):
+        registry = LazyResourceRegistry()
+        module_getattr = lazy_module_attributes('test_module', {
+            'MODEL': registry.register('test.model', lambda: 'model')})
+        self.assertEqual('model', module_getattr('MODEL'))
+        with self.assertRaises(AttributeError):
+            module_getattr('OTHER_MODEL')
+
+    def test_nothing_loaded_on_import(self):
+        code = '\n'.join([
+            'import lexnlp.extract.en.urls',
+            'import lexnlp.extract.en.dates',
+            'import lexnlp.extract.en.addresses.addresses',
+            'import lexnlp.nlp.en.segments.pages',
+            'import lexnlp.nlp.en.segments.paragraphs',
+            'import lexnlp.nlp.en.segments.sections',
+            'import lexnlp.nlp.en.segments.sentences',
+            'import lexnlp.nlp.en.segments.titles',
+            'from lexnlp.utils.lazy_resources import get_resource_stats',
+            'print(sorted(s.name for s in get_resource_stats() if s.loaded))'])
+        output = subprocess.check_output([sys.executable, '-c', code]).decode('utf-8')
+        self.assertEqual('[]', output.strip().splitlines()[-1])
+
+    def test_module_constant_compatibility(self):
+        from lexnlp.nlp.en.segments import sentences
+        self.assertIs(sentences.SENTENCE_SEGMENTER.get(), sentences.SENTENCE_SEGMENTER_MODEL)
@@ -1,5 +1,10 @@
+import time
+from typing import Callable, Dict, Generator
 from unittest import TestCase
-from lexnlp.utils.lines_processing.line_processor import LineProcessor, LineSplitParams
+
+from lexnlp.extract.de.language_tokens import DeLanguageTokens
+from lexnlp.tests.utility_for_testing import load_resource_document
+from lexnlp.utils.lines_processing.line_processor import LineProcessor, LineSplitParams, LineOrPhrase
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -112,3 +117,97 @@ As of some one gently rapping, rapping at my chamber door."""
         text = '1000 A.d. und drang'
         sents = list(proc.split_text_on_line_with_endings(text))
         self.assertGreater(len(sents), 1)
+
+    def test_compare_to_legacy_splitter(self):
+        text = self.get_legacy_comparison_text()
+        for abbreviations in [DeLanguageTokens.abbreviations, {}]:
+            proc = self.get_legacy_comparison_processor(abbreviations)
+            lines = [(l.text, l.start, l.ending) for l in proc.split_text_on_line_with_endings(text)]
+            legacy_lines = [(l.text, l.start, l.ending) for l in self.split_text_legacy(proc, text)]
+            self.assertGreater(len(lines), 100)
+            self.assertEqual(legacy_lines, lines)
+
+    def splitter_speed(self):
+        """
+        This method is not named as test_XXX
+        because it is not intended for (automatic) regression tests.
+        Times LineProcessor.split_text_on_line_with_endings against the legacy
+        char by char splitter, with and without abbreviations. With abbreviations
+        both splitters spend most of the time in the same get_abbreviations_in_text() call.
+        """
+        text = self.get_legacy_comparison_text()
+        times = {}  # type: Dict[str, float]
+        for abbr_name, abbreviations in [('abbrs', DeLanguageTokens.abbreviations), ('no_abbrs', {})]:
+            proc = self.get_legacy_comparison_processor(abbreviations)
+            self.check_time(text, lambda s: list(proc.split_text_on_line_with_endings(s)),
+                            f'splitter_{abbr_name}', times)
+            self.check_time(text, lambda s: list(self.split_text_legacy(proc, s)),
+                            f'legacy_splitter_{abbr_name}', times)
+
+        self.assertTrue('splitter_abbrs' in times)
+        self.assertLess(times['splitter_no_abbrs'], times['legacy_splitter_no_abbrs'])
+
+    def check_time(self, text: str, func: Callable, func_name: str, times: Dict[str, float]) -> None:
+        start = time.time()
+        func(text)
+        end = time.time()
+        times[func_name] = end - start
+
+    @staticmethod
+    def get_legacy_comparison_text() -> str:
+        return '\n'.join(load_resource_document('lexnlp/extract/de/' + file_name, 'utf-8')
+                         for file_name in ['sample_de_courts01.txt', 'sample_de_courts02.txt',
+                                           'sample_de_definitions01.txt', 'sample_de_definitions02.txt',
+                                           'sample_de_court_citations01.txt']) * 10
+
+    @staticmethod
+    def get_legacy_comparison_processor(abbreviations) -> LineProcessor:
+        ptrs = LineSplitParams()
+        ptrs.line_breaks = {'\n', '.', ';', ','}.union(set(DeLanguageTokens.conjunctions))
+        ptrs.abbreviations = abbreviations
+        return LineProcessor(line_split_params=ptrs)
+
+    @staticmethod
+    def split_text_legacy(proc: LineProcessor, text: str) -> Generator[LineOrPhrase, None, None]:
+        # char by char implementation of LineProcessor.split_text_on_line_with_endings
+        ptrs = proc.line_split_params
+        line = None
+        text_ended = False
+        i = -1
+        abr_coords = proc.get_abbreviations_in_text(text)
+        coord_index = 0 if abr_coords else -1
+
+        for ch in text:
+            i += 1
+            if ch in ptrs.line_breaks:
+                inside_abr = False
+                while coord_index >= 0:
+                    coords = abr_coords[coord_index]
+                    if i >= coords[1]:
+                        coord_index += 1
+                        if coord_index >= len(abr_coords):
+                            coord_index = -1
+                            continue
+                    inside_abr = i >= coords[0]
+                    break
+                if not inside_abr:
+                    if line is not None:
+                        text_ended = True
+                        line.ending += ch
+                    continue
+
+            if line is None:
+                line = LineOrPhrase(ch, i)
+                continue
+
+            if text_ended:
+                new_line = LineOrPhrase(ch, i)
+                yield line
+                line = new_line
+                text_ended = False
+            else:
+                line.text += ch
+
+        if line is not None:
+            if len(line.text) > 0:
+                yield line
@@ -2,7 +2,7 @@ import io
 import pandas as pd
 from coverage.backunittest import TestCase
 
-from lexnlp.utils.parse_df import DataframeEntityParser
+from lexnlp.utils.parse_df import DataframeEntityParser, get_entity_list
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -36,6 +36,38 @@ class TestParseDataframe(TestCase):
         ents = self.get_entries('mum, Peps si George merg la plimbare impreuna.')
         self.assertEqual(3, len(ents))
 
+    def test_result_columns(self):
+        df = pd.DataFrame({'name': ['Peppa', 'George', 'Peppa Pig'],
+                           'alias': ['Peps;pig', 'pig', 'Peps'],
+                           'priority': [2, 1, 3]})
+        text = 'Peps si pig merg la plimbare'
+
+        parser = DataframeEntityParser(dataframe=df, parse_columns=['alias'],
+                                       result_columns={'name': 'Name'},
+                                       priority_sort_column='priority')
+        ents = list(parser.get_entities(text))
+        self.assertEqual(['Peppa', 'George'], [e['Name'] for e in ents])
+
+        parser = DataframeEntityParser(dataframe=df, parse_columns=['alias'],
+                                       result_columns={'name': 'Name'},
+                                       priority_sort_column='priority',
+                                       priority_sort_ascending=False)
+        ents = list(parser.get_entities(text))
+        self.assertEqual(['Peppa Pig', 'Peppa'], [e['Name'] for e in ents])
+
+        parser = DataframeEntityParser(dataframe=df, parse_columns=['alias'],
+                                       result_columns={'name': 'Name'},
+                                       unique_column_values=False)
+        ents = list(parser.get_entities(text))
+        self.assertEqual([['Peppa', 'Peppa Pig'], ['Peppa', 'George']],
+                         [[s['Name'] for s in e['entities']] for e in ents])
+
+    def test_parse_columns_required(self):
+        with self.assertRaises(ValueError):
+            get_entity_list('Peppa si George', entity_df)
+        ents = get_entity_list('Peppa si George', entity_df, self.default_columns)
+        self.assertEqual(2, len(ents))
+
     def get_entries(self, text: str, columns=None):
         columns = columns or self.default_columns
         parser = DataframeEntityParser(dataframe=entity_df,
@@ -20,3 +20,16 @@ class TestPhraseFinder(TestCase):
         finder = PhraseFinder(['C.D. Ill.', 'sh', 'should', 'find'])
         rst = finder.find_word(text, True)
         self.assertEqual(3, len(rst))
+
+    def test_overlapping_phrases(self):
+        text = 'Das Landgericht Sachsen-Anhalt und das landgericht Sachsen'
+        finder = PhraseFinder(['Sachsen', 'Landgericht', 'Sachsen-Anhalt', 'Landgericht Sachsen'])
+        rst = finder.find_word(text, True)
+        self.assertEqual([('Sachsen', 15, 23), ('Sachsen', 50, 58),
+                          ('Landgericht', 3, 15), ('Landgericht', 38, 50),
+                          ('Sachsen-Anhalt', 15, 30),
+                          ('Landgericht Sachsen', 3, 23), ('Landgericht Sachsen', 38, 58)], rst)
+
+        rst = finder.find_word(text, False)
+        self.assertEqual([('Sachsen', 15, 23), ('Sachsen', 50, 58), ('Landgericht', 3, 15),
+                          ('Sachsen-Anhalt', 15, 30), ('Landgericht Sachsen', 3, 23)], rst)
@@ -8,7 +8,9 @@ from datetime import datetime
 from tempfile import mkstemp
 
 from lexnlp.extract.common.base_path import lexnlp_test_path
-from lexnlp.utils.unicode.unicode_lookup import UNICODE_CHAR_TOP_CATEGORY_MAPPING, build_lookup_tables, _load_table
+from lexnlp.utils.unicode.unicode_lookup import UNICODE_CHAR_TOP_CATEGORY_MAPPING, build_lookup_tables, \
+    UNICODE_CHAR_CATEGORY_MAPPING, UNICODE_CHAR_CATEGORIES, UNICODE_CATEGORIES, UNICODE_TOP_CATEGORIES, \
+    MAX_CODE_POINT, build_category_codes, categorize, _load_category_codes
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
@@ -103,41 +105,61 @@ def safe_remove_temp_file(handler, name):
 
 def test_preparing_tables():
     """
-    Tests preparing and loading the custom unicode lookup tables.
+    Tests preparing and loading the custom unicode lookup table.
     :return:
     """
-    h1, fn_categories = mkstemp()
-    h2, fn_char_category_mapping = mkstemp()
-    h3, fn_char_top_category_mapping = mkstemp()
-
+    h, fn_codes = mkstemp()
     try:
         path = os.path.join(lexnlp_test_path, 'lexnlp/utils/unicode_data.txt')
-        build_lookup_tables(fn_categories,
-                            fn_char_category_mapping,
-                            fn_char_top_category_mapping,
-                            table_source=path)
-
-        tbl_categories = _load_table(fn_categories, False)
-
-        # Simple basic testing that the contents are not empty and make sense.
+        build_lookup_tables(fn_codes, table_source=path)
+        codes = _load_category_codes(fn_codes)
+        assert [UNICODE_CATEGORIES[codes[ord(c)]] for c in 'aA,$\u2028'] == ['Ll', 'Lu', 'Po', 'Sc', 'Zl']
+    finally:
+        safe_remove_temp_file(h, fn_codes)
 
-        assert ',' in tbl_categories['punctuation']
-        assert '[' in tbl_categories['punctuation_start']
-        assert ']' in tbl_categories['punctuation_end']
-        assert '^' in tbl_categories['symbol']
-        assert '$' in tbl_categories['symbol_currency']
-        assert '+' in tbl_categories['symbol_math']
-        assert ' ' in tbl_categories['whitespace']
-        assert ' ' in tbl_categories['space']
-        assert '\u2028' in tbl_categories['line']
 
-        tbl_char_category_mapping = _load_table(fn_char_category_mapping, False)
-        assert tbl_char_category_mapping['a'] == 'Ll'
+def test_compatibility_tables():
+    """
+    Tests the character mappings made from the code point indexed table.
+    """
+    assert UNICODE_CHAR_CATEGORY_MAPPING['a'] == 'Ll'
+    assert UNICODE_CHAR_TOP_CATEGORY_MAPPING['a'] == 'L'
+    assert '\U000E01F0' not in UNICODE_CHAR_CATEGORY_MAPPING
+
+    assert ',' in UNICODE_CHAR_CATEGORIES['punctuation']
+    assert '[' in UNICODE_CHAR_CATEGORIES['punctuation_start']
+    assert ']' in UNICODE_CHAR_CATEGORIES['punctuation_end']
+    assert '^' in UNICODE_CHAR_CATEGORIES['symbol']
+    assert '$' in UNICODE_CHAR_CATEGORIES['symbol_currency']
+    assert '+' in UNICODE_CHAR_CATEGORIES['symbol_math']
+    assert ' ' in UNICODE_CHAR_CATEGORIES['whitespace']
+    assert ' ' in UNICODE_CHAR_CATEGORIES['space']
+    assert '\u2028' in UNICODE_CHAR_CATEGORIES['line']
+
+
+def test_categorize():
+    """
+    Tests the code point indexed category table gives the categories of UnicodeData.txt.
+    UnicodeData.txt lists only the first and the last characters of the CJK ideograph range.
+    """
+    text = 'Ab1 .,$+\t\n ä一丁€\U0001F600\x00'
+    categories = [UNICODE_CATEGORIES[i] for i in categorize(text)]
+    assert categories == ['Lu', 'Ll', 'Nd', 'Zs', 'Po', 'Po', 'Sc', 'Sm', 'Cc', 'Cc', 'Zl',
+                          'Ll', 'Lo', 'Cn', 'Sc', 'So', 'Cc']
+    top_categories = [UNICODE_TOP_CATEGORIES[i] for i in categorize(text, top=True)]
+    assert top_categories == [c[0] for c in categories]
+    assert categorize('').shape == (0,)
 
-        tbl_char_top_category_mapping = _load_table(fn_char_top_category_mapping, False)
-        assert tbl_char_top_category_mapping['a'] == 'L'
 
+def test_build_category_codes():
+    """
+    Tests storing and loading the code point indexed category table.
+    """
+    h, fn_codes = mkstemp()
+    try:
+        build_category_codes(fn_codes, {'a': 'Ll', 'b': 'Ll', 'A': 'Lu', '\U0010FFFF': 'Co'})
+        codes = _load_category_codes(fn_codes)
+        assert codes.shape == (MAX_CODE_POINT + 1,)
+        assert [UNICODE_CATEGORIES[codes[ord(c)]] for c in 'abcA\U0010FFFF'] == ['Ll', 'Ll', 'Cn', 'Lu', 'Co']
     finally:
-        safe_remove_temp_file(h1, fn_categories)
-        safe_remove_temp_file(h2, fn_char_category_mapping)
-        safe_remove_temp_file(h3, fn_char_top_category_mapping)
+        safe_remove_temp_file(h, fn_codes)
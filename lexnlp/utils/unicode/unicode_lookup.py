@@ -1,8 +1,11 @@
-import pickle
+from typing import Dict, List
 
+import numpy
 import pandas
 import os
 
+from lexnlp.utils.lazy_resources import register_resource, lazy_module_attributes
+
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2020, ContraxSuite, LLC"
 __license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
@@ -12,32 +15,128 @@ __email__ = "support@contraxsuite.com"
 
 
 _MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
-_FN_UNICODE_CHAR_CATEGORIES = os.path.join(_MODULE_PATH, 'unicode_character_categories.pickle')
-_FN_UNICODE_CHAR_CATEGORY_MAPPING = os.path.join(_MODULE_PATH, 'unicode_character_category_mapping.pickle')
-_FN_UNICODE_CHAR_TOP_CATEGORY_MAPPING = os.path.join(_MODULE_PATH, 'unicode_character_top_category_mapping.pickle')
+_FN_UNICODE_CHAR_CATEGORY_CODES = os.path.join(_MODULE_PATH, 'unicode_character_category_codes.npz')
+
+MAX_CODE_POINT = 0x10FFFF
+
+# general categories, categorize() returns indexes in this list
+# "Cn" (unassigned) stands for the code points missing in the lookup tables
+UNICODE_CATEGORIES = ['Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Mn', 'Mc', 'Me', 'Nd', 'Nl', 'No',
+                      'Pc', 'Pd', 'Ps', 'Pe', 'Pi', 'Pf', 'Po', 'Sm', 'Sc', 'Sk', 'So',
+                      'Zs', 'Zl', 'Zp', 'Cc', 'Cf', 'Cs', 'Co', 'Cn']
+UNICODE_TOP_CATEGORIES = ['L', 'M', 'N', 'P', 'S', 'Z', 'C']
+UNICODE_CATEGORY_TOP_IDS = numpy.array([UNICODE_TOP_CATEGORIES.index(c[0]) for c in UNICODE_CATEGORIES],
+                                       dtype=numpy.uint8)
+
+# character lists of UNICODE_CHAR_CATEGORIES: list name -> general categories
+CHARACTER_CATEGORY_GROUPS = {
+    'punctuation': ['Pc', 'Pd', 'Ps', 'Pe', 'Pi', 'Pf', 'Po'],
+    'punctuation_start': ['Ps', 'Pi'],
+    'punctuation_end': ['Pe', 'Pf'],
+    'symbol': ['Sk', 'So'],
+    'symbol_currency': ['Sc'],
+    'symbol_math': ['Sm'],
+    'whitespace': ['Zs', 'Zl', 'Zp', 'Cc', 'Cf', 'Cs'],
+    'space': ['Zs'],
+    'line': ['Zl']}
+
+
+def _load_category_codes(fn: str) -> numpy.ndarray:
+    """
+    Expand category runs stored by build_category_codes() into
+    the array of category ids (see UNICODE_CATEGORIES) indexed by code point.
+    """
+    with numpy.load(fn, allow_pickle=False) as data:
+        category_ids = numpy.array([UNICODE_CATEGORIES.index(c) for c in data['categories'].tolist()],
+                                   dtype=numpy.uint8)
+        run_starts = data['run_starts'].astype(numpy.int64)
+        run_categories = category_ids[data['run_categories']]
+    run_lengths = numpy.diff(numpy.append(run_starts, MAX_CODE_POINT + 1))
+    return numpy.repeat(run_categories, run_lengths)
+
+
+def _build_category_mapping(top: bool) -> Dict[str, str]:
+    """
+    Character -> general category ("Lu", "Ll" ...) or top category ("L", "M" ...) mapping
+    of the characters listed in the category table (all but "Cn").
+    """
+    codes = UNICODE_CHAR_CATEGORY_CODES_TABLE.get()
+    categories = UNICODE_TOP_CATEGORIES if top else UNICODE_CATEGORIES
+    category_ids = UNICODE_CATEGORY_TOP_IDS[codes] if top else codes
+    code_points = numpy.flatnonzero(codes != UNICODE_CATEGORIES.index('Cn'))
+    return {chr(code_point): categories[category_id]
+            for code_point, category_id in zip(code_points.tolist(), category_ids[code_points].tolist())}
 
 
-def _load_table(fn: str, ignore_error: bool):
-    try:
-        with open(fn, 'rb') as f:
-            return pickle.load(f)
-    except IOError as e:
-        print('Unable to load unicode lookup table: {0}'.format(fn))
-        if ignore_error:
-            return None
-        else:
-            raise e
+def _build_character_categories() -> Dict[str, List[str]]:
+    """
+    Lists of the characters of CHARACTER_CATEGORY_GROUPS, in code point order.
+    """
+    character_categories = {name: [] for name in CHARACTER_CATEGORY_GROUPS}
+    for character, category in UNICODE_CHAR_CATEGORY_MAPPING_TABLE.get().items():
+        for name, group in CHARACTER_CATEGORY_GROUPS.items():
+            if category in group:
+                character_categories[name].append(character)
+    return character_categories
+
+
+# Tables are loaded on first use, the character mappings are made from the code point indexed table
+UNICODE_CHAR_CATEGORY_CODES_TABLE = register_resource(
+    'unicode_char_category_codes', lambda: _load_category_codes(_FN_UNICODE_CHAR_CATEGORY_CODES))
+UNICODE_CHAR_CATEGORY_MAPPING_TABLE = register_resource(
+    'unicode_char_category_mapping', lambda: _build_category_mapping(top=False))
+UNICODE_CHAR_TOP_CATEGORY_MAPPING_TABLE = register_resource(
+    'unicode_char_top_category_mapping', lambda: _build_category_mapping(top=True))
+UNICODE_CHAR_CATEGORIES_TABLE = register_resource(
+    'unicode_char_categories', _build_character_categories)
+
+__getattr__ = lazy_module_attributes(__name__, {
+    'UNICODE_CHAR_CATEGORIES': UNICODE_CHAR_CATEGORIES_TABLE,
+    'UNICODE_CHAR_CATEGORY_MAPPING': UNICODE_CHAR_CATEGORY_MAPPING_TABLE,
+    'UNICODE_CHAR_TOP_CATEGORY_MAPPING': UNICODE_CHAR_TOP_CATEGORY_MAPPING_TABLE,
+    'UNICODE_CHAR_CATEGORY_CODES': UNICODE_CHAR_CATEGORY_CODES_TABLE})
+
+
+def categorize_codes(codes: numpy.ndarray, top: bool = False) -> numpy.ndarray:
+    """
+    Get unicode categories of the code points.
+    :param codes: array of code points
+    :param top: return top categories ("L", "M" ...) instead of general categories ("Lu", "Ll" ...)
+    :return: uint8 array of indexes in UNICODE_CATEGORIES (UNICODE_TOP_CATEGORIES if top)
+    """
+    category_ids = UNICODE_CHAR_CATEGORY_CODES_TABLE.get()[codes]
+    return UNICODE_CATEGORY_TOP_IDS[category_ids] if top else category_ids
 
 
-UNICODE_CHAR_CATEGORIES = _load_table(_FN_UNICODE_CHAR_CATEGORIES, True)
-UNICODE_CHAR_CATEGORY_MAPPING = _load_table(_FN_UNICODE_CHAR_CATEGORY_MAPPING, True)
-UNICODE_CHAR_TOP_CATEGORY_MAPPING = _load_table(_FN_UNICODE_CHAR_TOP_CATEGORY_MAPPING, True)
+def categorize(text: str, top: bool = False) -> numpy.ndarray:
+    """
+    Get unicode categories of the text characters, e.g.:
+        [UNICODE_CATEGORIES[i] for i in categorize("Ab1")] == ["Lu", "Ll", "Nd"]
+    :param text:
+    :param top: return top categories ("L", "M" ...) instead of general categories ("Lu", "Ll" ...)
+    :return: uint8 array of indexes in UNICODE_CATEGORIES (UNICODE_TOP_CATEGORIES if top)
+    """
+    codes = numpy.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=numpy.uint32)
+    return categorize_codes(codes, top)
 
 
-def build_lookup_tables(fn_char_categories,
-                        fn_char_category_mapping,
-                        fn_char_top_category_mapping,
-                        table_source: str = None):
+def build_category_codes(fn_char_category_codes: str, char_category_mapping: Dict[str, str]) -> None:
+    """
+    Store the character -> general category mapping as runs of code points of the same category.
+    The code points missing in the mapping get "Cn" category.
+    """
+    codes = numpy.full(MAX_CODE_POINT + 1, UNICODE_CATEGORIES.index('Cn'), dtype=numpy.uint8)
+    for character, category in char_category_mapping.items():
+        codes[ord(character)] = UNICODE_CATEGORIES.index(category)
+    run_starts = numpy.concatenate([[0], numpy.flatnonzero(codes[1:] != codes[:-1]) + 1])
+    with open(fn_char_category_codes, 'wb') as output_file:
+        numpy.savez_compressed(output_file,
+                               categories=numpy.array(UNICODE_CATEGORIES),
+                               run_starts=run_starts.astype(numpy.uint32),
+                               run_categories=codes[run_starts])
+
+
+def build_lookup_tables(fn_char_category_codes: str, table_source: str = None) -> None:
     """
     https://www.unicode.org/reports/tr44/#General_Category
     https://www.unicode.org/reports/tr44/#General_Category_Values
@@ -95,102 +194,15 @@ def build_lookup_tables(fn_char_categories,
                   "unicode_1_name", "iso_comment", "simple_uppercase_mapping",
                   "simple_lowercase_mapping", "simple_titlecase_mapping", ]
 
-    # Get all punctuation characters
-    punctuation_category_list = ["Pc", "Pd", "Ps", "Pe", "Pi", "Pf", "Po", "P"]
-    punctuation_character_set = df.loc[df["general_category"].isin(punctuation_category_list), "value"].apply(
-        lambda x: chr(int(x, 16))).tolist()
-    print(punctuation_character_set[0:10])
-
-    # Get all punctuation characters
-    punctuation_start_category_list = ["Ps", "Pi"]
-    punctuation_start_character_set = df.loc[
-        df["general_category"].isin(punctuation_start_category_list), "value"].apply(lambda x: chr(int(x, 16))).tolist()
-    print(punctuation_start_character_set[0:10])
-
-    # Get all punctuation characters
-    punctuation_end_category_list = ["Pe", "Pf"]
-    punctuation_end_character_set = df.loc[df["general_category"].isin(punctuation_end_category_list), "value"].apply(
-        lambda x: chr(int(x, 16))).tolist()
-    print(punctuation_end_character_set[0:10])
-
-    # Get all punctuation characters
-    symbol_currency_category_list = ["Sc"]
-    symbol_currency_character_set = df.loc[df["general_category"].isin(symbol_currency_category_list), "value"].apply(
-        lambda x: chr(int(x, 16))).tolist()
-    print(symbol_currency_character_set[0:10])
-
-    # Get all math characters
-    symbol_math_category_list = ["Sm"]
-    symbol_math_character_set = df.loc[df["general_category"].isin(symbol_math_category_list), "value"].apply(
-        lambda x: chr(int(x, 16))).tolist()
-    print(symbol_math_character_set[0:10])
-
-    # Get all math characters
-    symbol_category_list = ["Sk", "So"]
-    symbol_character_set = df.loc[df["general_category"].isin(symbol_category_list), "value"].apply(
-        lambda x: chr(int(x, 16))).tolist()
-    # symbol_character_set[0:10]
-
-    # Get all math characters
-    whitespace_category_list = ["Zs", "Zl", "Zp", "Cc", "Cf", "Cs"]
-    whitespace_character_set = df.loc[df["general_category"].isin(whitespace_category_list), "value"].apply(
-        lambda x: chr(int(x, 16))).tolist()
-    print(whitespace_character_set[0:10])
-
-    # Get all math characters
-    space_category_list = ["Zs"]
-    space_character_set = df.loc[df["general_category"].isin(space_category_list), "value"].apply(
-        lambda x: chr(int(x, 16))).tolist()
-    print(space_character_set[0:10])
-
-    # Get all math characters
-    line_category_list = ["Zl"]
-    line_character_set = df.loc[df["general_category"].isin(line_category_list), "value"].apply(
-        lambda x: chr(int(x, 16))).tolist()
-    print(line_character_set[0:10])
-
-    # Get all math characters
-    para_category_list = ["Zp"]
-    para_character_set = df.loc[df["general_category"].isin(para_category_list), "value"].apply(
-        lambda x: chr(int(x, 16))).tolist()
-    print(para_character_set[0:10])
-
-    unicode_character_categories = {"punctuation": punctuation_character_set,
-                                    "punctuation_start": punctuation_start_character_set,
-                                    "punctuation_end": punctuation_end_character_set,
-                                    "symbol": symbol_character_set,
-                                    "symbol_currency": symbol_currency_character_set,
-                                    "symbol_math": symbol_math_character_set,
-                                    "whitespace": whitespace_character_set,
-                                    "space": space_character_set,
-                                    "line": line_character_set
-                                    }
-
-    with open(fn_char_categories, 'wb') as output_file:
-        pickle.dump(unicode_character_categories, output_file)
-
-    # Reverse mapping
     unicode_character_category_mapping = {}
-
     for _, row in df.iterrows():
         unicode_character_category_mapping[chr(int(row['value'], 16))] = row['general_category']
 
-    with open(fn_char_category_mapping, 'wb') as output_file:
-        pickle.dump(unicode_character_category_mapping, output_file)
-
-    # Reverse mapping
-    unicode_character_top_category_mapping = {}
-
-    for _, row in df.iterrows():
-        unicode_character_top_category_mapping[chr(int(row['value'], 16))] = row['general_category'][0].upper()
-
-    with open(fn_char_top_category_mapping, 'wb') as output_file:
-        pickle.dump(unicode_character_top_category_mapping, output_file)
+    build_category_codes(fn_char_category_codes, unicode_character_category_mapping)
 
 
 if __name__ == '__main__':
     print('Building and saving unicode lookup tables...')
-    build_lookup_tables(_FN_UNICODE_CHAR_CATEGORIES, _FN_UNICODE_CHAR_CATEGORY_MAPPING,
-                        _FN_UNICODE_CHAR_TOP_CATEGORY_MAPPING)
+    build_lookup_tables(_FN_UNICODE_CHAR_CATEGORY_CODES)
 
     print('Done')